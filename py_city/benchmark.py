@@ -0,0 +1,532 @@
+"""
+Headless Benchmark Harness for Py City
+======================================
+
+Runs CitySimulation without a window (SDL dummy driver) for a fixed number
+of simulated seconds at a fixed timestep and seed, timing each subsystem
+separately so regressions can be pinned to the system that caused them.
+
+Features:
+- Scenarios scale NPC count (50 / 500 / 5000) and world size
+- Per-subsystem timings: game loop, crime, NPC movement, vehicles, animals,
+  clues and environment (day/night, weather, city map)
+- Optional off-screen render pass
+- JSON results for tracking over time
+- Baseline comparison that fails when a subsystem regresses past a threshold
+- Entity memory report (tracemalloc): bytes per record and peak memory of
+  building the world, slotted vs dict-backed records
+
+Usage:
+    python benchmark.py
+    python benchmark.py --output results.json
+    python benchmark.py --save-baseline benchmarks/baseline.json
+    python benchmark.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmark.py --memory
+"""
+
+import os
+
+# Must be set before pygame initializes a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import types
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+import pygame
+
+PY_CITY_DIR = os.path.dirname(os.path.abspath(__file__))
+if PY_CITY_DIR not in sys.path:
+    sys.path.insert(0, PY_CITY_DIR)
+
+from city_map import CityConfig, Camera
+from game_loop import GamePhase
+from simulation import CitySimulation
+
+
+DEFAULT_BASELINE_PATH = os.path.join(PY_CITY_DIR, "benchmarks", "baseline.json")
+
+# Subsystems timed every frame (CitySimulation.step sections)
+SUBSYSTEMS = list(CitySimulation.PROFILE_SECTIONS)
+
+# Ignore regressions smaller than this (ms per frame) - timer noise
+NOISE_FLOOR_MS = 0.05
+
+
+@dataclass
+class BenchmarkScenario:
+    """A single benchmark configuration."""
+    name: str
+    npc_count: int
+    world_width: int
+    world_height: int
+    seconds: float = 10.0
+    dt: float = 1.0 / 60.0
+    seed: int = 1234
+    animal_count: int = 25
+    render: bool = False
+    screen_width: int = 1024
+    screen_height: int = 768
+
+
+DEFAULT_SCENARIOS = [
+    BenchmarkScenario("small", npc_count=50, world_width=1600, world_height=1200),
+    BenchmarkScenario("medium", npc_count=500, world_width=3200, world_height=2400),
+    BenchmarkScenario("large", npc_count=5000, world_width=6400, world_height=4800),
+]
+
+# --memory default: ten times the area of the default CityConfig world
+MEMORY_SCENARIO = BenchmarkScenario("memory_10x", npc_count=1550,
+                                    world_width=15180, world_height=11384)
+
+# Copies allocated per record type when measuring bytes per record
+MEMORY_COPIES = 2000
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize per-frame samples (seconds) as milliseconds."""
+    total = sum(samples)
+    count = len(samples) or 1
+    return {
+        "total_ms": round(total * 1000.0, 3),
+        "mean_ms": round(total * 1000.0 / count, 4),
+        "p95_ms": round(_percentile(samples, 0.95) * 1000.0, 4),
+        "max_ms": round(max(samples) * 1000.0, 4) if samples else 0.0,
+    }
+
+
+def _state_checksum(sim: CitySimulation) -> int:
+    """Cheap checksum of final entity positions, for determinism checks."""
+    entities = (list(sim.all_npcs) + list(sim.vehicle_manager.vehicles)
+                + list(sim.animal_manager.animals))
+    acc = 0
+    for entity in entities:
+        acc = (acc * 31 + int(entity.x * 10) * 7 + int(entity.y * 10)) & 0xFFFFFFFF
+    return acc
+
+
+def build_simulation(scenario: BenchmarkScenario) -> CitySimulation:
+    """Build a CitySimulation for the scenario, with crime already enabled."""
+    config = CityConfig(
+        world_width=scenario.world_width,
+        world_height=scenario.world_height,
+        block_width=180,
+        block_height=140,
+        road_width=70,
+        sidewalk_width=14,
+    )
+
+    # Same type mix as the game (6 criminals / 5 police / 20 civilians)
+    criminals = scenario.npc_count * 6 // 31
+    police = scenario.npc_count * 5 // 31
+    civilians = scenario.npc_count - criminals - police
+
+    sim = CitySimulation(
+        config,
+        seed=scenario.seed,
+        criminal_count=criminals,
+        police_count=police,
+        civilian_count=civilians,
+        animal_count=scenario.animal_count,
+    )
+
+    # Skip the tutorial so crime runs from the first frame
+    sim.start()
+    sim.game_loop.state.phase = GamePhase.LIVING_CITY
+    return sim
+
+
+def run_scenario(scenario: BenchmarkScenario) -> dict:
+    """
+    Build a world for the scenario and step it headlessly.
+
+    Returns:
+        Dict of timings (setup, per-subsystem and whole-frame) plus a
+        checksum of the final state.
+    """
+    setup_start = time.perf_counter()
+    sim = build_simulation(scenario)
+
+    screen = None
+    camera = None
+    if scenario.render:
+        screen = pygame.Surface((scenario.screen_width, scenario.screen_height))
+        camera = Camera(scenario.screen_width, scenario.screen_height,
+                        sim.config.world_width, sim.config.world_height)
+        camera.follow(sim.player.x, sim.player.y)
+
+    setup_seconds = time.perf_counter() - setup_start
+
+    sim.profile = {name: [] for name in SUBSYSTEMS}
+    render_samples = []
+    frame_samples = []
+
+    dt = scenario.dt
+    frames = max(1, int(round(scenario.seconds / dt)))
+    perf = time.perf_counter
+
+    for _ in range(frames):
+        frame_start = perf()
+        sim.step(dt)
+
+        if scenario.render:
+            render_start = perf()
+            sim.city_map.draw(screen, camera, sim.lighting.darkness_alpha)
+            sim.vehicle_manager.draw(screen, camera)
+            sim.animal_manager.draw(screen, camera)
+            for npc in sim.all_npcs:
+                npc.draw(screen, camera)
+            render_samples.append(perf() - render_start)
+
+        frame_samples.append(perf() - frame_start)
+
+    subsystems = {name: _summarize(s) for name, s in sim.profile.items()}
+    if scenario.render:
+        subsystems["render"] = _summarize(render_samples)
+
+    return {
+        "scenario": asdict(scenario),
+        "frames": frames,
+        "setup_ms": round(setup_seconds * 1000.0, 3),
+        "frame": _summarize(frame_samples),
+        "subsystems": subsystems,
+        "entities": {
+            "npcs": len(sim.all_npcs),
+            "vehicles": len(sim.vehicle_manager.vehicles),
+            "animals": len(sim.animal_manager.animals),
+            "sidewalk_nodes": len(sim.city_map.sidewalk_nodes),
+        },
+        "checksum": _state_checksum(sim),
+    }
+
+
+def run_benchmarks(scenarios: List[BenchmarkScenario] = None) -> dict:
+    """Run every scenario and collect results into one JSON-ready dict."""
+    if scenarios is None:
+        scenarios = DEFAULT_SCENARIOS
+
+    pygame.init()
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": {s.name: run_scenario(s) for s in scenarios},
+    }
+
+
+def compare_to_baseline(results: dict, baseline: dict,
+                        threshold: float = 0.25) -> List[str]:
+    """
+    Compare results against a stored baseline.
+
+    Args:
+        results: Output of run_benchmarks()
+        baseline: A previous run_benchmarks() output
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        List of human-readable regression descriptions (empty if none).
+    """
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = results.get("results", {}).get(name)
+        if current is None:
+            continue
+
+        checks = [("frame", base.get("frame", {}), current.get("frame", {}))]
+        for subsystem, base_stats in base.get("subsystems", {}).items():
+            checks.append((subsystem, base_stats,
+                           current.get("subsystems", {}).get(subsystem, {})))
+
+        for label, base_stats, cur_stats in checks:
+            base_ms = base_stats.get("mean_ms")
+            cur_ms = cur_stats.get("mean_ms")
+            if base_ms is None or cur_ms is None:
+                continue
+            if cur_ms - base_ms < NOISE_FLOOR_MS:
+                continue
+            if cur_ms > base_ms * (1.0 + threshold):
+                slowdown = (cur_ms / base_ms - 1.0) * 100 if base_ms > 0 else float("inf")
+                regressions.append(
+                    f"{name}/{label}: {cur_ms:.3f} ms/frame vs baseline "
+                    f"{base_ms:.3f} ms (+{slowdown:.0f}%)"
+                )
+    return regressions
+
+
+def _record_types() -> list:
+    """The slotted high-count record classes."""
+    from city_map import SidewalkNode
+    from city_entities import Animal, Clue, RoadNode, Vehicle
+    from event_log import LogEntry
+    from interiors import InteriorObject
+    from simulation import CityNPC
+    return [SidewalkNode, RoadNode, Vehicle, Animal, CityNPC, Clue, LogEntry, InteriorObject]
+
+
+def _unslotted(cls) -> type:
+    """Same class without __slots__: instances keep attributes in a __dict__."""
+    namespace = {
+        name: value for name, value in cls.__dict__.items()
+        if name not in ("__slots__", "__dict__", "__weakref__")
+        and not isinstance(value, types.MemberDescriptorType)
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+@contextmanager
+def _dict_backed_records():
+    """Build with dict-backed twins of every record type (the pre-slots layout)."""
+    swapped = []
+    for cls in _record_types():
+        twin = _unslotted(cls)
+        for module in list(sys.modules.values()):
+            if getattr(module, cls.__name__, None) is cls:
+                setattr(module, cls.__name__, twin)
+                swapped.append((module, cls))
+    try:
+        yield
+    finally:
+        for module, cls in swapped:
+            setattr(module, cls.__name__, cls)
+
+
+def _slot_values(obj) -> dict:
+    """Attribute values held in an object's slots."""
+    values = {}
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(obj, name):
+                values[name] = getattr(obj, name)
+    return values
+
+
+def _traced_bytes_per_record(cls, values: dict, copies: int) -> float:
+    """Allocated bytes per instance of cls holding values (attribute values shared)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = []
+        for _ in range(copies):
+            record = object.__new__(cls)
+            for name, value in values.items():
+                object.__setattr__(record, name, value)
+            records.append(record)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return (used - sys.getsizeof(records)) / copies
+
+
+def _memory_samples(sim: CitySimulation) -> Dict[str, tuple]:
+    """(sample instance, live count) for each high-count record type."""
+    from city_entities import Clue, ClueType
+    from event_log import LogEntry, EventType
+    from interiors import BuildingInterior
+
+    clues = sim.investigation.clues_in_world
+    interior = BuildingInterior("house", seed=1)
+    samples = {
+        "SidewalkNode": (sim.city_map.sidewalk_nodes, None),
+        "RoadNode": (sim.road_network.nodes, None),
+        "Vehicle": (sim.vehicle_manager.vehicles, None),
+        "Animal": (sim.animal_manager.animals, None),
+        "CityNPC": (sim.all_npcs, None),
+        "Clue": (clues, Clue(0.0, 0.0, ClueType.FOOTPRINT, "sample")),
+        "LogEntry": ([], LogEntry(EventType.NARRATOR, "sample", 0.0)),
+        "InteriorObject": (interior.objects, None),
+    }
+    return {name: (live[0] if live else fallback, len(live))
+            for name, (live, fallback) in samples.items()
+            if live or fallback is not None}
+
+
+def measure_entity_memory(sim: CitySimulation, copies: int = MEMORY_COPIES) -> Dict[str, dict]:
+    """
+    Bytes per entity for each high-count record type, measured with tracemalloc.
+
+    Allocates copies of a live record in its slotted layout and in a
+    dict-backed twin of its class (attributes set in the same order, as
+    __init__ would). Only the records are counted - attribute values (path
+    lists, sprites, Rects) are shared between both layouts.
+
+    Returns:
+        {type name: {count, bytes, dict_bytes, saved_pct}}
+    """
+    report = {}
+    for name, (sample, count) in _memory_samples(sim).items():
+        values = _slot_values(sample)
+        slotted = _traced_bytes_per_record(type(sample), values, copies)
+        plain = _traced_bytes_per_record(_unslotted(type(sample)), values, copies)
+        report[name] = {
+            "count": count,
+            "bytes": round(slotted),
+            "dict_bytes": round(plain),
+            "saved_pct": round(100.0 * (plain - slotted) / plain, 1),
+        }
+    return report
+
+
+def _traced_build(scenario: BenchmarkScenario) -> tuple:
+    """Build the scenario's world under tracemalloc: (simulation, current, peak bytes)."""
+    # Collector runs would free earlier garbage mid-trace at arbitrary points
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        sim = build_simulation(scenario)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    sim.close()
+    return sim, current, peak
+
+
+def measure_world_memory(scenario: BenchmarkScenario) -> dict:
+    """
+    Memory used building a scenario's world, slotted vs dict-backed records.
+
+    Builds the world twice under tracemalloc - once as shipped, once with
+    every record class swapped for a dict-backed twin - and compares the
+    peaks. Everything else in the world (map, flow fields, surfaces) is
+    identical, so the difference is the records.
+
+    Returns:
+        {peak_kib, dict_peak_kib, current_kib, dict_current_kib, saved_pct}
+    """
+    # Untraced warm-up: one-time imports and module caches aren't records
+    build_simulation(scenario).close()
+
+    _, current, peak = _traced_build(scenario)
+    with _dict_backed_records():
+        _, dict_current, dict_peak = _traced_build(scenario)
+    return {
+        "peak_kib": round(peak / 1024),
+        "dict_peak_kib": round(dict_peak / 1024),
+        "current_kib": round(current / 1024),
+        "dict_current_kib": round(dict_current / 1024),
+        "saved_pct": round(100.0 * (dict_peak - peak) / dict_peak, 1),
+    }
+
+
+def _print_memory(name: str, report: Dict[str, dict], world: dict):
+    """Print a memory report table with record totals and the world peak."""
+    print(f"[{name}] bytes per entity (slotted vs dict-backed)")
+    total = total_plain = 0
+    for type_name, row in report.items():
+        total += row["bytes"] * row["count"]
+        total_plain += row["dict_bytes"] * row["count"]
+        print(f"    {type_name:<14} x{row['count']:<6} {row['bytes']:>4} B  "
+              f"vs {row['dict_bytes']:>4} B  (-{row['saved_pct']}%)")
+    print(f"    total records  {total / 1024:.0f} KiB vs {total_plain / 1024:.0f} KiB")
+    print(f"    world build    peak {world['peak_kib']} KiB vs {world['dict_peak_kib']} KiB "
+          f"(-{world['saved_pct']}%)")
+
+
+def _print_summary(results: dict):
+    """Print a compact table of results."""
+    for name, result in results["results"].items():
+        s = result["scenario"]
+        print(f"[{name}] {s['npc_count']} NPCs, {s['world_width']}x{s['world_height']}, "
+              f"{result['frames']} frames, setup {result['setup_ms']:.0f} ms")
+        print(f"    frame     mean {result['frame']['mean_ms']:.3f} ms  "
+              f"p95 {result['frame']['p95_ms']:.3f} ms")
+        for subsystem, stats in result["subsystems"].items():
+            print(f"    {subsystem:<9} mean {stats['mean_ms']:.3f} ms  "
+                  f"p95 {stats['p95_ms']:.3f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point. Returns a process exit code."""
+    parser = argparse.ArgumentParser(description="Headless Py City benchmark")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH,
+                        help="Baseline JSON to compare against (skipped if missing)")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="Write results as the new baseline and exit")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing (fraction)")
+    parser.add_argument("--seconds", type=float, help="Override simulated seconds")
+    parser.add_argument("--seed", type=int, help="Override the scenario seed")
+    parser.add_argument("--render", action="store_true",
+                        help="Include an off-screen render pass")
+    parser.add_argument("--scenario", action="append",
+                        help="Only run the named scenario(s)")
+    parser.add_argument("--memory", action="store_true",
+                        help="Report record and world-build memory instead of timing")
+    args = parser.parse_args(argv)
+
+    scenarios = []
+    for s in DEFAULT_SCENARIOS + [MEMORY_SCENARIO]:
+        if args.scenario and s.name not in args.scenario:
+            continue
+        if not args.scenario and (s is MEMORY_SCENARIO) != args.memory:
+            continue  # --memory defaults to the 10x world, timing to the rest
+        overrides = {}
+        if args.seconds is not None:
+            overrides["seconds"] = args.seconds
+        if args.seed is not None:
+            overrides["seed"] = args.seed
+        if args.render:
+            overrides["render"] = True
+        scenarios.append(BenchmarkScenario(**{**asdict(s), **overrides}))
+
+    if args.memory:
+        pygame.init()
+        for scenario in scenarios:
+            world = measure_world_memory(scenario)
+            sim = build_simulation(scenario)
+            _print_memory(scenario.name, measure_entity_memory(sim), world)
+            sim.close()
+        return 0
+
+    results = run_benchmarks(scenarios)
+    _print_summary(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+        return 0
+
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("Performance regressions:")
+            for line in regressions:
+                print(f"    {line}")
+            return 1
+        print("No regressions against baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
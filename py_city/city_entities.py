@@ -16,6 +16,10 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Callable
 from enum import Enum, auto
 
+from rng import get_rng, STREAM_ANIMALS, STREAM_CLUES, STREAM_VEHICLES
+from scheduler import Timer, TimerScheduler
+from spatial import PointGrid, poisson_disk_sample, spacing_for
+
 
 # =============================================================================
 # VEHICLES
@@ -31,7 +35,7 @@ class VehicleType(Enum):
     TAXI = "taxi"
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """A vehicle that travels on roads."""
     x: float
@@ -138,6 +142,11 @@ class Vehicle:
                 self.x += self.direction[0] * self.speed * dt * 60
                 self.y += self.direction[1] * self.speed * dt * 60
 
+    def bounds(self) -> pygame.Rect:
+        """World rect covering everything draw() paints, in any orientation."""
+        half = max(self.width, self.height) // 2 + 3  # Shadow sits 2px off the body
+        return pygame.Rect(int(self.x) - half, int(self.y) - half, half * 2, half * 2)
+
     def draw(self, screen: pygame.Surface, camera: 'Camera'):
         """Draw the vehicle with improved top-down graphics."""
         screen_x, screen_y = camera.apply(self.x, self.y)
@@ -298,26 +307,58 @@ class Vehicle:
                 pygame.draw.rect(screen, blue_color, (cx - 4, cy + 1, 6, 8), border_radius=2)
 
 
+# Minimum distance between lot cars on the first placement pass (about two spaces)
+LOT_CAR_SPACING = 70
+
+# Seconds between parked cars pulling out into traffic (uniform range)
+PULL_OUT_INTERVAL = (20.0, 40.0)
+# Seconds a car waits at the kerb (signalling) before it drives off
+PULL_OUT_WAIT = 1.5
+# Pulled-out cars allowed on the road on top of max_vehicles
+MAX_PULLED_OUT = 5
+
+
 class VehicleManager:
     """Manages all vehicles in the city."""
 
-    def __init__(self, world_width: int, world_height: int, road_network: 'RoadNetwork' = None):
+    def __init__(self, world_width: int, world_height: int, road_network: 'RoadNetwork' = None,
+                 rng: random.Random = None, scheduler: Optional[TimerScheduler] = None):
+        """
+        Args:
+            scheduler: Timer scheduler that releases held vehicles and pulls
+                parked cars out (without one, held vehicles count down in
+                Vehicle.update and parked cars stay put)
+        """
         self.world_width = world_width
         self.world_height = world_height
         self.road_network = road_network
+        self.rng = rng or get_rng().stream(STREAM_VEHICLES)
+        self.scheduler = scheduler
         self.vehicles: List[Vehicle] = []
         self.max_vehicles = 15
         self.max_parked = 20  # Additional parked vehicles on roads
         self.max_lot_parked = 30  # Vehicles in parking lots
 
+        # Vehicles visited by update() - parked and held ones are left out
+        self._active: List[Vehicle] = []
+        self._active_source_count = -1  # len(vehicles) when _active was built
+
+        # Parked vehicles stamped into the city map's road layer (id -> vehicle)
+        # aren't drawn here until they start moving
+        self._baked: Dict[int, Vehicle] = {}
+        self._bake_target = None  # CityMap holding the stamps
+        self._drawn: List[Vehicle] = []
+        self._pull_out_timer: Optional[Timer] = None
+        self.pulled_out = 0  # Parked cars that have driven off (for tests / debug overlay)
+
     def spawn_vehicles(self, road_segments: List[Tuple[int, int, int, int]], parking_lots: List = None):
         """Spawn initial vehicles on road segments."""
         # Spawn moving vehicles
         for _ in range(self.max_vehicles):
             if road_segments:
                 # Pick random road segment
-                x1, y1, x2, y2 = random.choice(road_segments)
-                t = random.random()
+                x1, y1, x2, y2 = self.rng.choice(road_segments)
+                t = self.rng.random()
                 x = x1 + t * (x2 - x1)
                 y = y1 + t * (y2 - y1)
 
@@ -330,7 +371,7 @@ class VehicleManager:
                     direction = (1, 0)
 
                 # Random vehicle type (weighted)
-                vtype = random.choices(
+                vtype = self.rng.choices(
                     [VehicleType.CAR, VehicleType.TAXI, VehicleType.TRUCK,
                      VehicleType.BUS, VehicleType.POLICE_CAR],
                     weights=[60, 15, 10, 8, 7]
@@ -357,8 +398,8 @@ class VehicleManager:
         for _ in range(self.max_parked):
             if road_segments:
                 # Pick random road segment
-                x1, y1, x2, y2 = random.choice(road_segments)
-                t = random.random()
+                x1, y1, x2, y2 = self.rng.choice(road_segments)
+                t = self.rng.random()
 
                 # Position along the road
                 road_x = x1 + t * (x2 - x1)
@@ -371,21 +412,21 @@ class VehicleManager:
                     # Perpendicular offset (park on side of road)
                     perp_x, perp_y = -dy / length, dx / length
                     # Randomly choose left or right side, offset by ~20 pixels
-                    side = random.choice([-1, 1])
-                    offset = 18 + random.randint(-3, 3)
+                    side = self.rng.choice([-1, 1])
+                    offset = 18 + self.rng.randint(-3, 3)
                     x = road_x + perp_x * offset * side
                     y = road_y + perp_y * offset * side
 
                     # Direction aligned with road (parked cars face along road)
                     direction = (dx / length, dy / length)
-                    if random.random() < 0.5:  # Sometimes face opposite direction
+                    if self.rng.random() < 0.5:  # Sometimes face opposite direction
                         direction = (-direction[0], -direction[1])
                 else:
                     x, y = road_x, road_y
                     direction = (1, 0)
 
                 # Only cars and trucks park (no buses, taxis, police, ambulances)
-                vtype = random.choices(
+                vtype = self.rng.choices(
                     [VehicleType.CAR, VehicleType.TRUCK],
                     weights=[85, 15]
                 )[0]
@@ -407,9 +448,10 @@ class VehicleManager:
         if not all_spaces:
             return
 
-        # Randomly select spaces to fill (about 60-80% occupancy)
-        random.shuffle(all_spaces)
-        num_to_spawn = min(self.max_lot_parked, int(len(all_spaces) * random.uniform(0.6, 0.8)))
+        # Select spaces to fill (about 60-80% occupancy), spread across the
+        # lots before any lot fills up
+        num_to_spawn = min(self.max_lot_parked, int(len(all_spaces) * self.rng.uniform(0.6, 0.8)))
+        all_spaces = poisson_disk_sample(all_spaces, num_to_spawn, LOT_CAR_SPACING, self.rng)
 
         for i in range(num_to_spawn):
             if i >= len(all_spaces):
@@ -418,11 +460,11 @@ class VehicleManager:
             x, y, dir_x, dir_y = all_spaces[i]
 
             # Mostly cars, occasionally trucks and one police car
-            if i == 0 and random.random() < 0.3:
+            if i == 0 and self.rng.random() < 0.3:
                 # First car might be a police car parked in the lot
                 vtype = VehicleType.POLICE_CAR
             else:
-                vtype = random.choices(
+                vtype = self.rng.choices(
                     [VehicleType.CAR, VehicleType.TRUCK],
                     weights=[90, 10]
                 )[0]
@@ -435,15 +477,111 @@ class VehicleManager:
             )
             self.vehicles.append(vehicle)
 
-    def update(self, dt: float):
-        """Update all vehicles."""
+    def _refresh_active(self):
+        """Rebuild the list of vehicles that need a per-frame update."""
+        held = self.scheduler is not None
+        self._active = [v for v in self.vehicles
+                        if not v.parked and not (held and v.waiting)]
+        self._drawn = [v for v in self.vehicles if id(v) not in self._baked]
+        self._active_source_count = len(self.vehicles)
+
+    def bake_parked(self, city_map) -> int:
+        """
+        Stamp parked vehicles into the city map's road layer.
+
+        Police cars stay live (their light bar flashes).
+
+        Returns:
+            Number of vehicles baked.
+        """
+        self._bake_target = city_map
+        baked = 0
         for vehicle in self.vehicles:
+            if (not vehicle.parked or vehicle.vehicle_type == VehicleType.POLICE_CAR
+                    or id(vehicle) in self._baked):
+                continue
+            if city_map.stamp(id(vehicle), vehicle.bounds(), vehicle.draw):
+                self._baked[id(vehicle)] = vehicle
+                baked += 1
+        self._active_source_count = -1
+        return baked
+
+    def start_vehicle(self, vehicle: Vehicle):
+        """Pull a parked vehicle out (lifting it off the road layer if baked)."""
+        if self._baked.pop(id(vehicle), None) is not None:
+            self._bake_target.unstamp(id(vehicle))
+        vehicle.parked = False
+        if self.road_network and not vehicle.path:
+            vehicle.path = self.road_network.get_random_path(vehicle.x, vehicle.y)
+            vehicle.path_index = 0
+        self._active_source_count = -1
+
+    def hold_vehicle(self, vehicle: Vehicle, seconds: float):
+        """Stop a vehicle for a while (e.g. at a crossing)."""
+        vehicle.waiting = True
+        vehicle.wait_timer = seconds
+        if self.scheduler is not None:
+            self.scheduler.schedule(seconds, self._release_vehicle, vehicle)
+            self._active_source_count = -1
+
+    def start_pull_outs(self):
+        """Every PULL_OUT_INTERVAL seconds, a parked kerbside car pulls out."""
+        if self.scheduler is None:
+            return
+        self.scheduler.cancel(self._pull_out_timer)
+        self._pull_out_timer = self.scheduler.schedule(
+            self.rng.uniform(*PULL_OUT_INTERVAL), self._pull_out)
+
+    def _pull_out(self):
+        """Scheduler callback: start a parked car, wait at the kerb, drive off."""
+        if self.pulled_out < MAX_PULLED_OUT:
+            parked = [v for v in self.vehicles
+                      if v.parked and v.vehicle_type != VehicleType.POLICE_CAR]
+            if parked:
+                vehicle = self.rng.choice(parked)
+                self.start_vehicle(vehicle)
+                self.hold_vehicle(vehicle, PULL_OUT_WAIT)
+                self.pulled_out += 1
+        self.start_pull_outs()
+
+    def _release_vehicle(self, vehicle: Vehicle):
+        """Scheduler callback: a held vehicle drives on."""
+        vehicle.waiting = False
+        vehicle.wait_timer = 0.0
+        self._active_source_count = -1
+
+    def update(self, dt: float):
+        """Update moving vehicles (parked and held vehicles are skipped)."""
+        if self._active_source_count != len(self.vehicles):
+            self._refresh_active()
+        for vehicle in self._active:
             vehicle.update(dt, self.road_network)
 
-    def draw(self, screen: pygame.Surface, camera: 'Camera'):
-        """Draw all vehicles."""
-        for vehicle in self.vehicles:
-            vehicle.draw(screen, camera)
+    def draw(self, screen: pygame.Surface, camera: 'Camera',
+             draw_distance: Optional[float] = None):
+        """
+        Draw all vehicles (baked parked ones are part of the road layer).
+
+        Args:
+            draw_distance: Skip vehicles farther than this from the view
+                center in pixels (quality setting); None draws all
+        """
+        if self._active_source_count != len(self.vehicles):
+            self._refresh_active()
+        if draw_distance is None:
+            for vehicle in self._drawn:
+                vehicle.draw(screen, camera)
+            return
+
+        center_x = camera.screen_width / 2
+        center_y = camera.screen_height / 2
+        max_dist_sq = draw_distance * draw_distance
+        for vehicle in self._drawn:
+            screen_x, screen_y = camera.apply(vehicle.x, vehicle.y)
+            dx = screen_x - center_x
+            dy = screen_y - center_y
+            if dx * dx + dy * dy <= max_dist_sq:
+                vehicle.draw(screen, camera)
 
 
 # =============================================================================
@@ -458,7 +596,12 @@ class AnimalType(Enum):
     RAT = "rat"
 
 
-@dataclass
+# Animals that bolt when the player comes within FLEE_RADIUS px (dogs don't)
+SKITTISH_ANIMALS = (AnimalType.PIGEON, AnimalType.CAT, AnimalType.RAT)
+FLEE_RADIUS = 80
+
+
+@dataclass(slots=True)
 class Animal:
     """An animal that wanders the city."""
     x: float
@@ -470,15 +613,23 @@ class Animal:
 
     # State
     state: str = "idle"  # idle, walking, running, fleeing
-    state_timer: float = 0.0
+    state_timer: float = 0.0  # Countdown (standalone) or length of the current state (scheduled)
     direction: Tuple[float, float] = (0, 0)
 
     # Behavior
     flee_from: Optional[Tuple[float, float]] = None
     follow_target: Optional[any] = None  # For dogs following owner
 
+    # Random stream for wandering (shared per manager)
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+
+    # Pending state change when AnimalManager drives the state machine
+    timer: Optional[Timer] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """Set properties based on animal type."""
+        if self.rng is None:
+            self.rng = get_rng().stream(STREAM_ANIMALS)
         type_props = {
             AnimalType.DOG: {
                 "colors": [(139, 90, 43), (80, 50, 30), (200, 180, 160), (50, 50, 50)],
@@ -502,53 +653,67 @@ class Animal:
             },
         }
         props = type_props.get(self.animal_type, {})
-        self.color = random.choice(props.get("colors", [(100, 80, 60)]))
+        self.color = self.rng.choice(props.get("colors", [(100, 80, 60)]))
         self.size = props.get("size", 15)
         self.speed = props.get("speed", 1.0)
-        self.state_timer = random.uniform(1.0, 5.0)
-
-    def update(self, dt: float, player_x: float = 0, player_y: float = 0):
-        """Update animal behavior."""
-        self.state_timer -= dt
+        self.state_timer = self.rng.uniform(1.0, 5.0)
 
-        # Check for nearby threats (player too close)
+    def check_flee(self, player_x: float, player_y: float) -> bool:
+        """Start fleeing if the player is too close. Returns True if fleeing."""
+        if self.animal_type not in SKITTISH_ANIMALS:
+            return False
         dx = player_x - self.x
         dy = player_y - self.y
-        dist_to_player = math.sqrt(dx * dx + dy * dy)
-
-        # Flee behavior
-        if dist_to_player < 80 and self.animal_type in [AnimalType.PIGEON, AnimalType.CAT, AnimalType.RAT]:
-            self.state = "fleeing"
-            if dist_to_player > 0:
-                self.direction = (-dx / dist_to_player, -dy / dist_to_player)
-            self.state_timer = 2.0
-
-        # State machine
-        if self.state == "idle":
-            if self.state_timer <= 0:
-                # Transition to walking
-                self.state = "walking"
-                angle = random.uniform(0, 2 * math.pi)
-                self.direction = (math.cos(angle), math.sin(angle))
-                self.state_timer = random.uniform(2.0, 6.0)
-
-        elif self.state == "walking":
-            # Move in direction
+        dist_sq = dx * dx + dy * dy
+        if dist_sq >= FLEE_RADIUS * FLEE_RADIUS:
+            return False
+
+        self.state = "fleeing"
+        if dist_sq > 0:
+            dist_to_player = math.sqrt(dist_sq)
+            self.direction = (-dx / dist_to_player, -dy / dist_to_player)
+        return True
+
+    def move(self, dt: float):
+        """Move for one frame in the current state (idle animals stay put)."""
+        if self.state == "walking":
             self.x += self.direction[0] * self.speed * dt * 60
             self.y += self.direction[1] * self.speed * dt * 60
-
-            if self.state_timer <= 0:
-                self.state = "idle"
-                self.state_timer = random.uniform(1.0, 4.0)
-
         elif self.state == "fleeing":
             # Move faster away from threat
             self.x += self.direction[0] * self.speed * 2 * dt * 60
             self.y += self.direction[1] * self.speed * 2 * dt * 60
 
-            if self.state_timer <= 0:
-                self.state = "idle"
-                self.state_timer = random.uniform(2.0, 5.0)
+    def next_state(self) -> float:
+        """
+        Leave the current state once its time is up.
+
+        Returns:
+            How long the new state lasts in seconds.
+        """
+        if self.state == "idle":
+            # Transition to walking
+            self.state = "walking"
+            angle = self.rng.uniform(0, 2 * math.pi)
+            self.direction = (math.cos(angle), math.sin(angle))
+            return self.rng.uniform(2.0, 6.0)
+        if self.state == "walking":
+            self.state = "idle"
+            return self.rng.uniform(1.0, 4.0)
+        self.state = "idle"
+        return self.rng.uniform(2.0, 5.0)
+
+    def update(self, dt: float, player_x: float = 0, player_y: float = 0):
+        """Update animal behavior (standalone countdown; AnimalManager schedules instead)."""
+        self.state_timer -= dt
+
+        # Check for nearby threats (player too close)
+        if self.check_flee(player_x, player_y):
+            self.state_timer = 2.0
+
+        self.move(dt)
+        if self.state_timer <= 0:
+            self.state_timer = self.next_state()
 
     def draw(self, screen: pygame.Surface, camera: 'Camera'):
         """Draw the animal with improved pixel-art style graphics."""
@@ -731,14 +896,33 @@ class Animal:
 
 
 class AnimalManager:
-    """Manages all animals in the city."""
-
-    def __init__(self, world_width: int, world_height: int):
+    """
+    Manages all animals in the city.
+
+    State changes run on a timer scheduler, so update() only visits animals
+    that are moving. Idle skittish animals sit in a grid of FLEE_RADIUS
+    cells and are only looked at when the player is in a neighbouring cell.
+    """
+
+    def __init__(self, world_width: int, world_height: int, rng: random.Random = None,
+                 scheduler: Optional[TimerScheduler] = None):
+        """
+        Args:
+            scheduler: Shared timer scheduler, advanced by its owner. Without
+                one the manager advances a private scheduler in update().
+        """
         self.world_width = world_width
         self.world_height = world_height
+        self.rng = rng or get_rng().stream(STREAM_ANIMALS)
         self.animals: List[Animal] = []
         self.building_rects: List[pygame.Rect] = []  # For collision avoidance
 
+        self.scheduler = scheduler or TimerScheduler()
+        self._owns_scheduler = scheduler is None
+        self._moving: Dict[int, Animal] = {}  # id -> animal, insertion-ordered
+        self._idle_cells: Dict[Tuple[int, int], Dict[int, Animal]] = {}
+        self._idle_cell_of: Dict[int, Tuple[int, int]] = {}
+
     def set_building_rects(self, rects: List[pygame.Rect]):
         """Set building rectangles for collision avoidance."""
         self.building_rects = rects
@@ -760,35 +944,90 @@ class AnimalManager:
             attempts += 1
 
             if sidewalk_nodes:
-                node = random.choice(sidewalk_nodes)
+                node = self.rng.choice(sidewalk_nodes)
                 # Stay close to sidewalk center
-                x = node.x + random.randint(-15, 15)
-                y = node.y + random.randint(-15, 15)
+                x = node.x + self.rng.randint(-15, 15)
+                y = node.y + self.rng.randint(-15, 15)
             else:
-                x = random.randint(0, self.world_width)
-                y = random.randint(0, self.world_height)
+                x = self.rng.randint(0, self.world_width)
+                y = self.rng.randint(0, self.world_height)
 
             # Skip if inside building
             if self._is_in_building(x, y):
                 continue
 
             # Weighted animal types
-            animal_type = random.choices(
+            animal_type = self.rng.choices(
                 [AnimalType.PIGEON, AnimalType.DOG, AnimalType.CAT, AnimalType.RAT],
                 weights=[40, 25, 25, 10]
             )[0]
 
-            animal = Animal(x=x, y=y, animal_type=animal_type)
+            animal = Animal(x=x, y=y, animal_type=animal_type, rng=self.rng)
             self.animals.append(animal)
+            self._set_timer(animal, animal.state_timer)
+            self._file_animal(animal)
             spawned += 1
 
+    def _set_timer(self, animal: Animal, seconds: float):
+        """(Re)schedule the animal's next state change."""
+        self.scheduler.cancel(animal.timer)
+        animal.state_timer = seconds
+        animal.timer = self.scheduler.schedule(seconds, self._on_state_timer, animal)
+
+    def _on_state_timer(self, animal: Animal):
+        """Scheduler callback: the animal's current state has run out."""
+        animal.timer = None
+        self._set_timer(animal, animal.next_state())
+        self._file_animal(animal)
+
+    def _file_animal(self, animal: Animal):
+        """Put an animal in the moving set or, if idle, the idle grid."""
+        key = id(animal)
+        if animal.state != "idle":
+            cell = self._idle_cell_of.pop(key, None)
+            if cell is not None:
+                del self._idle_cells[cell][key]
+            self._moving[key] = animal
+            return
+
+        self._moving.pop(key, None)
+        if animal.animal_type in SKITTISH_ANIMALS and key not in self._idle_cell_of:
+            # Only skittish animals can be woken early (by the player)
+            cell = (int(animal.x // FLEE_RADIUS), int(animal.y // FLEE_RADIUS))
+            self._idle_cells.setdefault(cell, {})[key] = animal
+            self._idle_cell_of[key] = cell
+
+    def _wake_near(self, x: float, y: float):
+        """Move idle skittish animals within FLEE_RADIUS of (x, y) to the moving set."""
+        cx, cy = int(x // FLEE_RADIUS), int(y // FLEE_RADIUS)
+        radius_sq = FLEE_RADIUS * FLEE_RADIUS
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = self._idle_cells.get((gx, gy))
+                if not cell:
+                    continue
+                for key, animal in list(cell.items()):
+                    dx = x - animal.x
+                    dy = y - animal.y
+                    if dx * dx + dy * dy < radius_sq:
+                        del cell[key]
+                        del self._idle_cell_of[key]
+                        self._moving[key] = animal
+
     def update(self, dt: float, player_x: float, player_y: float):
-        """Update all animals with building collision avoidance."""
-        for animal in self.animals:
+        """Update moving animals with building collision avoidance."""
+        if self._owns_scheduler:
+            self.scheduler.advance(dt)
+
+        self._wake_near(player_x, player_y)
+
+        for animal in list(self._moving.values()):
             # Store old position
             old_x, old_y = animal.x, animal.y
 
-            animal.update(dt, player_x, player_y)
+            if animal.check_flee(player_x, player_y):
+                self._set_timer(animal, 2.0)
+            animal.move(dt)
 
             # Check if animal moved into a building
             if self._is_in_building(animal.x, animal.y):
@@ -797,16 +1036,38 @@ class AnimalManager:
                 # Reverse direction
                 animal.direction = (-animal.direction[0], -animal.direction[1])
                 animal.state = "idle"
-                animal.state_timer = random.uniform(0.5, 1.5)
+                self._set_timer(animal, self.rng.uniform(0.5, 1.5))
 
             # Keep in bounds (wraparound)
             animal.x = animal.x % self.world_width
             animal.y = animal.y % self.world_height
 
-    def draw(self, screen: pygame.Surface, camera: 'Camera'):
-        """Draw all animals."""
+            if animal.state == "idle":
+                self._file_animal(animal)
+
+    def draw(self, screen: pygame.Surface, camera: 'Camera',
+             draw_distance: Optional[float] = None):
+        """
+        Draw all animals.
+
+        Args:
+            draw_distance: Skip animals farther than this from the view
+                center in pixels (quality setting); None draws all
+        """
+        if draw_distance is None:
+            for animal in self.animals:
+                animal.draw(screen, camera)
+            return
+
+        center_x = camera.screen_width / 2
+        center_y = camera.screen_height / 2
+        max_dist_sq = draw_distance * draw_distance
         for animal in self.animals:
-            animal.draw(screen, camera)
+            screen_x, screen_y = camera.apply(animal.x, animal.y)
+            dx = screen_x - center_x
+            dy = screen_y - center_y
+            if dx * dx + dy * dy <= max_dist_sq:
+                animal.draw(screen, camera)
 
 
 # =============================================================================
@@ -894,6 +1155,16 @@ class SpecialBuilding:
         self.door_x = self.x + self.width // 2
         self.door_y = self.y + self.height
 
+    @property
+    def building_id(self) -> int:
+        """
+        Stable id from the building's position (buildings never overlap).
+
+        Unlike id(building) it survives garbage collection and is the same
+        every session, so it doubles as the interior generation seed.
+        """
+        return (int(self.x) * 73856093 ^ int(self.y) * 19349663) & 0x7FFFFFFF
+
     def is_near_door(self, px: float, py: float, radius: float = 30) -> bool:
         """Check if position is near the door."""
         dx = px - self.door_x
@@ -1062,7 +1333,7 @@ class ClueType(Enum):
     FINGERPRINT = "fingerprint"
 
 
-@dataclass
+@dataclass(slots=True)
 class Clue:
     """A clue in a crime investigation."""
     x: float
@@ -1101,13 +1372,27 @@ class CrimeCase:
     clues_required: int = 3
 
 
+# Bucket size for the undiscovered-clue grid (about twice the discovery radius)
+CLUE_CELL_SIZE = 64
+
+
 class InvestigationManager:
     """Manages crime investigations."""
 
-    def __init__(self):
+    def __init__(self, clue_sites: Optional[List[Tuple[float, float]]] = None,
+                 rng: random.Random = None):
+        """
+        Args:
+            clue_sites: Walkable positions clues may be placed on (e.g.
+                CityMap.get_walkable_points()); None places them anywhere
+            rng: Stream for clue placement, types and descriptions
+        """
+        self.rng = rng or get_rng().stream(STREAM_CLUES)
         self.active_cases: List[CrimeCase] = []
         self.solved_cases: List[CrimeCase] = []
         self.clues_in_world: List[Clue] = []
+        self.clue_sites = clue_sites
+        self._clue_grid = PointGrid(CLUE_CELL_SIZE)  # Undiscovered clues
 
     def create_case(self, crime_type: str, world_width: int, world_height: int) -> CrimeCase:
         """Create a new crime case with clues."""
@@ -1118,18 +1403,28 @@ class InvestigationManager:
             clues_required=3
         )
 
-        # Generate clues
+        # Generate clues, spread over the valid sites
         clue_types = list(ClueType)
-        for i in range(case.clues_required):
+        if self.clue_sites:
+            sites = [(x, y) for x, y in self.clue_sites
+                     if 100 <= x <= world_width - 100 and 100 <= y <= world_height - 100]
+        else:
+            sites = [(self.rng.randint(100, world_width - 100), self.rng.randint(100, world_height - 100))
+                     for _ in range(case.clues_required * 8)]
+        spacing = spacing_for(world_width - 200, world_height - 200, case.clues_required)
+        positions = poisson_disk_sample(sites, case.clues_required, spacing, self.rng)
+
+        for x, y in positions:
             clue = Clue(
-                x=random.randint(100, world_width - 100),
-                y=random.randint(100, world_height - 100),
-                clue_type=random.choice(clue_types),
+                x=x,
+                y=y,
+                clue_type=self.rng.choice(clue_types),
                 description=self._generate_clue_description(crime_type),
                 linked_crime_id=case.case_id
             )
             case.clues.append(clue)
             self.clues_in_world.append(clue)
+            self._clue_grid.insert(clue, clue.x, clue.y)
 
         self.active_cases.append(case)
         return case
@@ -1155,28 +1450,25 @@ class InvestigationManager:
             "A discarded weapon nearby.",
             "Financial records showing motive.",
         ]
-        return random.choice(clues)
+        return self.rng.choice(clues)
 
     def check_clue_discovery(self, player_x: float, player_y: float, radius: float = 30) -> Optional[Clue]:
-        """Check if player discovered a clue."""
-        for clue in self.clues_in_world:
+        """Check if player discovered a clue (only clues bucketed near the player)."""
+        for clue in self._clue_grid.nearby(player_x, player_y, radius):
+            self._clue_grid.remove(clue)
             if clue.discovered:
                 continue
+            clue.discovered = True
 
-            dx = player_x - clue.x
-            dy = player_y - clue.y
-            if math.sqrt(dx * dx + dy * dy) < radius:
-                clue.discovered = True
-
-                # Update case progress
-                for case in self.active_cases:
-                    if case.case_id == clue.linked_crime_id:
-                        case.clues_found += 1
-                        if case.clues_found >= case.clues_required:
-                            self._solve_case(case)
-                        break
+            # Update case progress
+            for case in self.active_cases:
+                if case.case_id == clue.linked_crime_id:
+                    case.clues_found += 1
+                    if case.clues_found >= case.clues_required:
+                        self._solve_case(case)
+                    break
 
-                return clue
+            return clue
 
         return None
 
@@ -1196,7 +1488,7 @@ class InvestigationManager:
 # ROAD NETWORK (for vehicle pathfinding)
 # =============================================================================
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class RoadNode:
     """A node in the road network."""
     x: float
@@ -1211,7 +1503,8 @@ class RoadNode:
 class RoadNetwork:
     """Network of roads for vehicle navigation."""
 
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or get_rng().stream(STREAM_VEHICLES)
         self.nodes: List[RoadNode] = []
         self.segments: List[Tuple[int, int, int, int]] = []
 
@@ -1286,7 +1579,7 @@ class RoadNetwork:
                 options = current.connections
 
             if options:
-                next_node = random.choice(options)
+                next_node = self.rng.choice(options)
                 path.append((next_node.x, next_node.y))
                 visited.add(next_node)
                 current = next_node
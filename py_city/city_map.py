@@ -7,17 +7,24 @@ Features:
 - Proper city grid with blocks
 - Wide roads with sidewalks
 - Rain weather system with wind
-- Day/night cycle
-- Varied building styles
+- Lakes animated from pre-rendered, shared wave frames
+- Water beds, bridges, parking lots and parked cars baked into the
+  pre-rendered road layer
+- Day/night cycle with a per-game-minute lighting table
+- Varied building styles, darkened per building once per lighting change
 """
 
 import random
 import math
 import pygame
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 from enum import Enum
 
+from rng import get_rng, STREAM_CITY, STREAM_WEATHER
+from postprocess import get_post_processor
+
 
 class TimeOfDay(Enum):
     """Time periods affecting gameplay and visuals."""
@@ -28,8 +35,29 @@ class TimeOfDay(Enum):
     NIGHT = "night"      # 20:00 - 5:00
 
 
+# Lighting table resolution: one entry per game minute
+MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class LightingSnapshot:
+    """Everything the renderer needs to know about the light at one game minute."""
+    time_of_day: TimeOfDay
+    tint: Tuple[int, int, int]
+    darkness_alpha: int
+    window_lit_chance: float
+    darkness_tint: Optional[Tuple[int, int, int, int]]  # Full-screen night tint (None by day)
+    is_night: bool
+
+
 class DayNightCycle:
-    """Manages game time and day/night transitions."""
+    """
+    Manages game time and day/night transitions.
+
+    Lighting is looked up, not computed: the first query builds a table
+    with one LightingSnapshot per game minute (minutes with the same light
+    share one snapshot), and every getter reads the current entry.
+    """
 
     def __init__(self, start_hour: float = 8.0, time_scale: float = 60.0):
         """
@@ -59,6 +87,17 @@ class DayNightCycle:
             TimeOfDay.NIGHT: 120,
         }
 
+        # Probability of a window being lit
+        self.window_lit_chances = {
+            TimeOfDay.DAWN: 0.6,
+            TimeOfDay.MORNING: 0.2,
+            TimeOfDay.AFTERNOON: 0.1,
+            TimeOfDay.EVENING: 0.7,
+            TimeOfDay.NIGHT: 0.8,
+        }
+
+        self._lighting_table: Optional[List[LightingSnapshot]] = None
+
     def update(self, dt: float) -> Optional[str]:
         """Update time. Returns narrator message if time period changes."""
         old_period = self.get_time_of_day()
@@ -87,9 +126,9 @@ class DayNightCycle:
 
         return None
 
-    def get_time_of_day(self) -> TimeOfDay:
-        """Get current time period."""
-        h = self.game_hour
+    @staticmethod
+    def period_at(h: float) -> TimeOfDay:
+        """Time period for an hour of the day (0-24)."""
         if 5 <= h < 7:
             return TimeOfDay.DAWN
         elif 7 <= h < 12:
@@ -101,6 +140,32 @@ class DayNightCycle:
         else:
             return TimeOfDay.NIGHT
 
+    def _build_lighting_table(self) -> List[LightingSnapshot]:
+        """One snapshot per game minute, shared by minutes in the same period."""
+        snapshots = {}
+        for period in TimeOfDay:
+            darkness_alpha = self.darkness_alpha.get(period, 0)
+            snapshots[period] = LightingSnapshot(
+                time_of_day=period,
+                tint=self.lighting_colors.get(period, (255, 255, 255)),
+                darkness_alpha=darkness_alpha,
+                window_lit_chance=self.window_lit_chances.get(period, 0.4),
+                darkness_tint=CityMap.get_darkness_tint(darkness_alpha),
+                is_night=period in (TimeOfDay.NIGHT, TimeOfDay.EVENING),
+            )
+        return [snapshots[self.period_at(minute / 60)] for minute in range(MINUTES_PER_DAY)]
+
+    def get_lighting(self) -> LightingSnapshot:
+        """Lighting for the current game minute (one table lookup)."""
+        table = self._lighting_table
+        if table is None:
+            table = self._lighting_table = self._build_lighting_table()
+        return table[int(self.game_hour * 60) % MINUTES_PER_DAY]
+
+    def get_time_of_day(self) -> TimeOfDay:
+        """Get current time period."""
+        return self.get_lighting().time_of_day
+
     def get_hour_minute(self) -> Tuple[int, int]:
         """Get current time as (hour, minute)."""
         hour = int(self.game_hour) % 24
@@ -118,27 +183,19 @@ class DayNightCycle:
 
     def is_night(self) -> bool:
         """Check if it's nighttime (for crime bonus, etc)."""
-        return self.get_time_of_day() in (TimeOfDay.NIGHT, TimeOfDay.EVENING)
+        return self.get_lighting().is_night
 
     def get_lighting_tint(self) -> Tuple[int, int, int]:
         """Get current lighting color tint."""
-        return self.lighting_colors.get(self.get_time_of_day(), (255, 255, 255))
+        return self.get_lighting().tint
 
     def get_darkness_alpha(self) -> int:
         """Get current darkness overlay alpha."""
-        return self.darkness_alpha.get(self.get_time_of_day(), 0)
+        return self.get_lighting().darkness_alpha
 
     def get_window_lit_chance(self) -> float:
         """Get probability of windows being lit based on time."""
-        period = self.get_time_of_day()
-        chances = {
-            TimeOfDay.DAWN: 0.6,
-            TimeOfDay.MORNING: 0.2,
-            TimeOfDay.AFTERNOON: 0.1,
-            TimeOfDay.EVENING: 0.7,
-            TimeOfDay.NIGHT: 0.8,
-        }
-        return chances.get(period, 0.4)
+        return self.get_lighting().window_lit_chance
 
 
 @dataclass
@@ -250,9 +307,11 @@ class Camera:
 class WeatherSystem:
     """Weather system with rain, wind, and temperature."""
 
-    def __init__(self, world_width: int, world_height: int):
+    def __init__(self, world_width: int, world_height: int,
+                 rng: random.Random = None):
         self.world_width = world_width
         self.world_height = world_height
+        self.rng = rng or get_rng().stream(STREAM_WEATHER)
 
         # Rain state
         self.is_raining = False
@@ -313,9 +372,9 @@ class WeatherSystem:
         self.wind_timer += dt
         if self.wind_timer >= self.wind_change_interval:
             self.wind_timer = 0.0
-            self.wind_change_interval = random.uniform(20.0, 60.0)
+            self.wind_change_interval = self.rng.uniform(20.0, 60.0)
             # Change wind direction/speed
-            self.target_wind = random.uniform(-80, 80)
+            self.target_wind = self.rng.uniform(-80, 80)
 
         # Smoothly transition wind
         wind_diff = self.target_wind - self.wind_speed
@@ -343,17 +402,17 @@ class WeatherSystem:
         self.rain_timer += dt
         if self.rain_timer >= self.rain_change_interval:
             self.rain_timer = 0.0
-            self.rain_change_interval = random.uniform(90.0, 180.0)  # Longer intervals
+            self.rain_change_interval = self.rng.uniform(90.0, 180.0)  # Longer intervals
 
             # Decide weather change
-            if not self.is_raining and random.random() < 0.35:
+            if not self.is_raining and self.rng.random() < 0.35:
                 # Start raining
                 self.is_raining = True
-                self.target_intensity = random.uniform(0.3, 1.0)
+                self.target_intensity = self.rng.uniform(0.3, 1.0)
                 self.narrator_notified = False
                 # Rain often brings wind
-                self.target_wind = random.uniform(40, 80) * random.choice([-1, 1])
-            elif self.is_raining and random.random() < 0.25:  # Less likely to stop
+                self.target_wind = self.rng.uniform(40, 80) * self.rng.choice([-1, 1])
+            elif self.is_raining and self.rng.random() < 0.25:  # Less likely to stop
                 # Stop raining
                 self.target_intensity = 0.0
 
@@ -389,10 +448,10 @@ class WeatherSystem:
         for _ in range(drops_to_add):
             if len(self.raindrops) < self.max_drops:
                 self.raindrops.append([
-                    random.uniform(0, self.world_width),
-                    random.uniform(-100, 0),
-                    random.uniform(400, 700),  # Fall speed
-                    random.uniform(8, 20)  # Length
+                    self.rng.uniform(0, self.world_width),
+                    self.rng.uniform(-100, 0),
+                    self.rng.uniform(400, 700),  # Fall speed
+                    self.rng.uniform(8, 20)  # Length
                 ])
 
         # Update existing drops with wind
@@ -408,16 +467,32 @@ class WeatherSystem:
         for i in reversed(drops_to_remove):
             self.raindrops.pop(i)
 
-    def draw(self, screen: pygame.Surface, camera: Camera):
-        """Draw rain effect with wind-angled drops."""
+    def get_tint(self) -> Optional[Tuple[int, int, int, int]]:
+        """Get the full-screen rain tint (RGBA), or None when too light to show."""
+        if self.rain_intensity <= 0.3:
+            return None
+        return (100, 110, 130, int(30 * self.rain_intensity))
+
+    def draw(self, screen: pygame.Surface, camera: Camera, drop_scale: float = 1.0):
+        """
+        Draw rain effect with wind-angled drops.
+
+        Args:
+            drop_scale: Fraction of simulated drops to draw (quality setting)
+        """
         if self.rain_intensity <= 0.01:
             return
 
         # Calculate wind angle offset for raindrop rendering
         wind_offset = self.wind_speed * 0.1  # How much the drop slants
 
+        # Drops spawn at random x, so any prefix is an even sample
+        drops = self.raindrops
+        if drop_scale < 1.0:
+            drops = drops[:int(len(drops) * drop_scale)]
+
         # Draw visible raindrops
-        for drop in self.raindrops:
+        for drop in drops:
             screen_x, screen_y = camera.apply(drop[0], drop[1])
 
             # Skip if off screen
@@ -437,11 +512,8 @@ class WeatherSystem:
                 1
             )
 
-        # Rain overlay for atmosphere
-        if self.rain_intensity > 0.3:
-            overlay = pygame.Surface((camera.screen_width, camera.screen_height), pygame.SRCALPHA)
-            overlay.fill((100, 110, 130, int(30 * self.rain_intensity)))
-            screen.blit(overlay, (0, 0))
+        # Rain overlay for atmosphere (over the sprites, as the drops are)
+        get_post_processor().draw_tint(screen, [self.get_tint()])
 
 
 class BuildingStyle(Enum):
@@ -469,13 +541,17 @@ class CityBlock:
             return True
         return False
 
-    def __init__(self, x: int, y: int, width: int, height: int):
+    def __init__(self, x: int, y: int, width: int, height: int,
+                 rng: random.Random = None):
         self.rect = pygame.Rect(x, y, width, height)
+        self.rng = rng or get_rng().stream(STREAM_CITY)
         self.buildings: List[pygame.Rect] = []
         self.building_colors: List[Tuple[int, int, int]] = []
         self.building_styles: List[BuildingStyle] = []
         self.building_window_states: List[List[bool]] = []  # Cached lit/unlit states
         self._generate_buildings()
+        self._shaded_alpha = 0  # Darkness the shaded colours were made for
+        self._shaded_colors = self.building_colors
 
     def _generate_buildings(self):
         """Generate buildings within this block."""
@@ -489,17 +565,17 @@ class CityBlock:
         )
 
         # Randomly place 1-4 buildings
-        num_buildings = random.randint(1, 4)
+        num_buildings = self.rng.randint(1, 4)
 
         if num_buildings == 1:
             # Single large building
             self.buildings.append(inner_rect.copy())
-            style = random.choice(list(BuildingStyle))
+            style = self.rng.choice(list(BuildingStyle))
             self.building_styles.append(style)
             self.building_colors.append(self._style_color(style))
         else:
             # Split into smaller buildings
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 # Horizontal split
                 h1 = inner_rect.height // 2 - 5
                 self.buildings.append(pygame.Rect(
@@ -523,14 +599,14 @@ class CityBlock:
                 ))
 
             for _ in self.buildings:
-                style = random.choice(list(BuildingStyle))
+                style = self.rng.choice(list(BuildingStyle))
                 self.building_styles.append(style)
                 self.building_colors.append(self._style_color(style))
 
         # Initialize window states for each building
         for building in self.buildings:
             window_count = self._count_windows(building)
-            self.building_window_states.append([random.random() > 0.4 for _ in range(window_count)])
+            self.building_window_states.append([self.rng.random() > 0.4 for _ in range(window_count)])
 
     def _style_color(self, style: BuildingStyle) -> Tuple[int, int, int]:
         """Get base color for building style."""
@@ -541,9 +617,9 @@ class CityBlock:
             BuildingStyle.ART_DECO: [(140, 130, 100), (150, 140, 110), (130, 120, 90)],
             BuildingStyle.INDUSTRIAL: [(70, 70, 80), (60, 65, 75), (80, 80, 85)],
         }
-        base = random.choice(style_colors.get(style, [(100, 100, 100)]))
+        base = self.rng.choice(style_colors.get(style, [(100, 100, 100)]))
         # Add slight variation
-        return tuple(max(0, min(255, c + random.randint(-10, 10))) for c in base)
+        return tuple(max(0, min(255, c + self.rng.randint(-10, 10))) for c in base)
 
     def _count_windows(self, building: pygame.Rect) -> int:
         """Count how many windows a building has."""
@@ -562,8 +638,17 @@ class CityBlock:
             window_count = len(self.building_window_states[i])
             # Only change some windows, not all at once
             for j in range(window_count):
-                if random.random() < 0.2:  # 20% chance each window changes
-                    self.building_window_states[i][j] = random.random() < lit_chance
+                if self.rng.random() < 0.2:  # 20% chance each window changes
+                    self.building_window_states[i][j] = self.rng.random() < lit_chance
+
+    def _colors_for(self, darkness_alpha: int) -> List[Tuple[int, int, int]]:
+        """Building colours darkened for a darkness level (cached until it changes)."""
+        if darkness_alpha != self._shaded_alpha:
+            shade = darkness_alpha // 3
+            self._shaded_alpha = darkness_alpha
+            self._shaded_colors = [tuple(max(0, c - shade) for c in color)
+                                   for color in self.building_colors]
+        return self._shaded_colors
 
     def draw(self, screen: pygame.Surface, camera: Camera, darkness_alpha: int = 0):
         """Draw the block and its buildings."""
@@ -580,8 +665,9 @@ class CityBlock:
     def _draw_buildings(self, screen: pygame.Surface, camera: Camera,
                         darkness_alpha: int, offset_x: int, offset_y: int):
         """Internal method to draw buildings with optional world offset."""
+        colors = self._colors_for(darkness_alpha)
         for idx, (building, color, style) in enumerate(zip(
-            self.buildings, self.building_colors, self.building_styles
+            self.buildings, colors, self.building_styles
         )):
             # Create offset building rect for wraparound
             offset_building = pygame.Rect(
@@ -602,12 +688,8 @@ class CityBlock:
                 screen_rect.bottom < 0 or screen_rect.top > camera.screen_height):
                 continue
 
-            # Apply darkness tint
-            if darkness_alpha > 0:
-                darkened = tuple(max(0, c - darkness_alpha // 3) for c in color)
-                pygame.draw.rect(screen, darkened, screen_rect)
-            else:
-                pygame.draw.rect(screen, color, screen_rect)
+            # Colour is already darkened for the time of day
+            pygame.draw.rect(screen, color, screen_rect)
 
             # Building details based on style
             self._draw_style_details(screen, screen_rect, style)
@@ -682,6 +764,60 @@ class CityBlock:
         return False
 
 
+def _subtract_rect(rect: tuple, cover: tuple) -> List[tuple]:
+    """Parts of an (x, y, w, h) rect outside another, as up to four rects."""
+    x, y, w, h = rect
+    left = max(x, cover[0])
+    top = max(y, cover[1])
+    right = min(x + w, cover[0] + cover[2])
+    bottom = min(y + h, cover[1] + cover[3])
+    if left >= right or top >= bottom:
+        return [rect]
+
+    parts = []
+    if top > y:
+        parts.append((x, y, w, top - y))
+    if bottom < y + h:
+        parts.append((x, bottom, w, y + h - bottom))
+    if left > x:
+        parts.append((x, top, left - x, bottom - top))
+    if right < x + w:
+        parts.append((right, top, x + w - right, bottom - top))
+    return parts
+
+
+class _WorldCamera:
+    """Camera stand-in mapping world coordinates 1:1, for drawing into world-size layers."""
+
+    def __init__(self, width: int, height: int):
+        self.x = 0
+        self.y = 0
+        self.screen_width = width
+        self.screen_height = height
+
+    def apply(self, world_x: float, world_y: float) -> Tuple[int, int]:
+        return (int(world_x), int(world_y))
+
+    def apply_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        return pygame.Rect(rect.x, rect.y, rect.width, rect.height)
+
+
+# Water animation loops over this period: every wave frequency in
+# WaterBody._draw_waves completes a whole number of cycles in it (the second
+# row's width wobble runs at 1.0 rather than 0.8 so that it does)
+WATER_WAVE_PERIOD = 4 * math.pi
+
+# Pre-rendered frames per loop (about 5 per second)
+WATER_FRAMES = 64
+
+# Seconds a size's frames stay cached after its last lake left the screen
+WATER_FRAME_TTL = 10.0
+
+# Wave rows as (top, height) strips relative to the lake; "mid" is from the center
+WATER_TOP_STRIP = (8, 16)
+WATER_MID_STRIP = (-8, 16)
+
+
 class WaterBody:
     """A lake or pond in the city."""
 
@@ -695,52 +831,179 @@ class WaterBody:
         self.water_highlight = (60, 100, 140)
         self.shore_color = (100, 90, 70)  # Sandy/muddy shore
 
-    def draw(self, screen: pygame.Surface, camera: 'Camera', time: float = 0):
-        """Draw the water body with animated waves."""
+        # Parts of the wave strips left uncovered by bridges
+        self._wave_pieces: List[Tuple[int, int, int, int, int]] = []
+        self.set_covers([])
+
+    def frame_key(self) -> tuple:
+        """Water bodies with equal keys share animation frames."""
+        return (self.rect.width, self.rect.height,
+                self.water_color, self.water_highlight, self.shore_color)
+
+    def set_covers(self, covers: List[pygame.Rect]):
+        """Set the world rects drawn over the water (bridges); waves skip them."""
+        pieces = []
+        for index, (top, height) in enumerate(self._strip_rows()):
+            parts = [(0, top, self.rect.width, height)]
+            for cover in covers:
+                local = (cover.x - self.rect.x, cover.y - self.rect.y, cover.width, cover.height)
+                parts = [piece for part in parts for piece in _subtract_rect(part, local)]
+            pieces.extend((index, x, y - top, w, h) for x, y, w, h in parts)
+        self._wave_pieces = pieces
+
+    def _strip_rows(self) -> List[Tuple[int, int]]:
+        """(top, height) of the two wave strips, relative to the lake."""
+        return [WATER_TOP_STRIP,
+                (self.rect.height // 2 + WATER_MID_STRIP[0], WATER_MID_STRIP[1])]
+
+    def _screen_rect(self, camera: 'Camera') -> Optional[pygame.Rect]:
+        """The lake on screen, or None if it's off screen."""
         screen_rect = camera.apply_rect(self.rect)
-
-        # Skip if off screen
         if (screen_rect.right < 0 or screen_rect.left > camera.screen_width or
             screen_rect.bottom < 0 or screen_rect.top > camera.screen_height):
-            return
+            return None
+        return screen_rect
 
-        # Shore/bank (slightly larger rectangle)
-        shore_rect = screen_rect.inflate(6, 6)
-        pygame.draw.rect(screen, self.shore_color, shore_rect, border_radius=8)
+    def draw(self, screen: pygame.Surface, camera: 'Camera', time: float = 0,
+             frames: 'WaterFrameCache' = None):
+        """
+        Draw the water body with animated waves.
 
-        # Water base
-        pygame.draw.rect(screen, self.water_color, screen_rect, border_radius=6)
+        Args:
+            time: Animation time (CityMap.time)
+            frames: Frame cache to blit the waves from (None draws them directly)
+        """
+        screen_rect = self._screen_rect(camera)
+        if screen_rect is None:
+            return
 
-        # Animated wave highlights
-        wave_time = time + self.wave_offset
-        num_waves = max(1, screen_rect.width // 40)
+        self._draw_base(screen, screen_rect)
+        if frames is None:
+            self._draw_waves(screen, screen_rect.x, screen_rect.y, time + self.wave_offset)
+        else:
+            self._blit_waves(screen, screen_rect, frames.get(self, time))
+
+    def draw_waves(self, screen: pygame.Surface, camera: 'Camera', time: float,
+                   frames: 'WaterFrameCache'):
+        """Draw only the waves (the shore and water are baked into the road layer)."""
+        screen_rect = self._screen_rect(camera)
+        if screen_rect is not None:
+            self._blit_waves(screen, screen_rect, frames.get(self, time))
+
+    def _blit_waves(self, screen: pygame.Surface, screen_rect: pygame.Rect, strips: tuple):
+        """Blit the uncovered parts of both wave strips."""
+        tops = [screen_rect.y + top for top, _ in self._strip_rows()]
+        for index, x, y, w, h in self._wave_pieces:
+            screen.blit(strips[index], (screen_rect.x + x, tops[index] + y),
+                        pygame.Rect(x, y, w, h))
+
+    def _draw_base(self, surface: pygame.Surface, rect: pygame.Rect):
+        """Shore/bank (slightly larger rectangle) and the water under it."""
+        shore_rect = rect.inflate(6, 6)
+        pygame.draw.rect(surface, self.shore_color, shore_rect, border_radius=8)
+        pygame.draw.rect(surface, self.water_color, rect, border_radius=6)
+
+    def _draw_waves(self, surface: pygame.Surface, origin_x: int, origin_y: int,
+                    wave_time: float):
+        """Draw both rows of wave highlights with the lake's top-left at origin."""
+        width, height = self.rect.width, self.rect.height
+        num_waves = max(1, width // 40)
 
         for i in range(num_waves):
-            wave_x = screen_rect.x + 20 + i * 40
-            wave_y = screen_rect.y + 15 + math.sin(wave_time * 2 + i * 0.5) * 5
+            wave_x = origin_x + 20 + i * 40
+            wave_y = origin_y + 15 + math.sin(wave_time * 2 + i * 0.5) * 5
             wave_width = 25 + math.sin(wave_time + i) * 5
 
-            if wave_x + wave_width < screen_rect.right - 10:
-                pygame.draw.line(screen, self.water_highlight,
+            if wave_x + wave_width < origin_x + width - 10:
+                pygame.draw.line(surface, self.water_highlight,
                                (wave_x, int(wave_y)),
                                (wave_x + int(wave_width), int(wave_y)), 2)
 
         # Second row of waves
         for i in range(num_waves):
-            wave_x = screen_rect.x + 30 + i * 40
-            wave_y = screen_rect.y + screen_rect.height // 2 + math.sin(wave_time * 1.5 + i * 0.7) * 4
-            wave_width = 20 + math.sin(wave_time * 0.8 + i) * 4
+            wave_x = origin_x + 30 + i * 40
+            wave_y = origin_y + height // 2 + math.sin(wave_time * 1.5 + i * 0.7) * 4
+            wave_width = 20 + math.sin(wave_time + i) * 4
 
-            if wave_x + wave_width < screen_rect.right - 10:
-                pygame.draw.line(screen, self.water_highlight,
+            if wave_x + wave_width < origin_x + width - 10:
+                pygame.draw.line(surface, self.water_highlight,
                                (wave_x, int(wave_y)),
                                (wave_x + int(wave_width), int(wave_y)), 2)
 
+    def draw_bed(self, surface: pygame.Surface):
+        """Draw the shore and still water at world coordinates (for baking)."""
+        self._draw_base(surface, self.rect)
+
+    def render_strips(self, wave_time: float) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Pre-render the two wave rows at one point in the loop."""
+        strips = []
+        for top, strip_height in self._strip_rows():
+            strip = pygame.Surface((self.rect.width, strip_height))
+            strip.fill(self.water_color)
+            # The other row's lines fall outside the strip and are clipped
+            self._draw_waves(strip, 0, -top, wave_time)
+            strips.append(strip)
+        return strips[0], strips[1]
+
     def is_colliding(self, rect: pygame.Rect) -> bool:
         """Check if a rect collides with the water."""
         return self.rect.colliderect(rect)
 
 
+class WaterFrameCache:
+    """
+    Looped water animation frames, shared by water bodies of the same size.
+
+    Frames are rendered the first time they're shown. A size's frames are
+    dropped once none of its lakes has been on screen for `ttl` seconds.
+    """
+
+    def __init__(self, frame_count: int = WATER_FRAMES, ttl: float = WATER_FRAME_TTL):
+        self.frame_count = frame_count
+        self.ttl = ttl
+        self.renders = 0  # Frames rendered (for tests / debug overlay)
+        # frame key -> [frames (None until rendered), last seen]
+        self._entries: Dict[tuple, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, water: WaterBody, time: float) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Get a water body's wave strips for the given time.
+
+        Returns:
+            (top strip, middle strip)
+        """
+        key = water.frame_key()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = [[None] * self.frame_count, time]
+            self._entries[key] = entry
+        entry[1] = time
+
+        phase = (time + water.wave_offset) % WATER_WAVE_PERIOD
+        index = int(phase / WATER_WAVE_PERIOD * self.frame_count) % self.frame_count
+        frames = entry[0]
+        strips = frames[index]
+        if strips is None:
+            strips = water.render_strips(index * WATER_WAVE_PERIOD / self.frame_count)
+            frames[index] = strips
+            self.renders += 1
+        return strips
+
+    def evict(self, time: float) -> int:
+        """Drop frames not shown for `ttl` seconds. Returns how many sizes were dropped."""
+        stale = [key for key, entry in self._entries.items() if time - entry[1] > self.ttl]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Drop every cached frame."""
+        self._entries.clear()
+
+
 class Bridge:
     """A bridge that spans over water."""
 
@@ -906,6 +1169,8 @@ class ParkingLot:
 class SidewalkNode:
     """A node in the sidewalk pathfinding network."""
 
+    __slots__ = ("x", "y", "neighbors")
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -919,25 +1184,134 @@ class SidewalkNode:
             other.neighbors.append(self)
 
 
+class SidewalkGraph:
+    """
+    Read-only snapshot of the sidewalk network for path searches.
+
+    Nodes are indices into flat coordinate tuples, so the graph can be
+    shared with path-planning worker threads without locking. Nearest-node
+    lookups use a bucket grid instead of scanning every node.
+    """
+
+    def __init__(self, nodes: List[SidewalkNode], cell_size: int = 128):
+        self.nodes = tuple(nodes)
+        index_of = {id(node): i for i, node in enumerate(self.nodes)}
+        self.xs = tuple(node.x for node in self.nodes)
+        self.ys = tuple(node.y for node in self.nodes)
+        self.neighbors = tuple(tuple(index_of[id(n)] for n in node.neighbors)
+                               for node in self.nodes)
+
+        self.cell_size = cell_size
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            cells.setdefault((int(x // cell_size), int(y // cell_size)), []).append(i)
+        self._cells = cells
+        if cells:
+            self._max_ring = max(max(abs(cx), abs(cy)) for cx, cy in cells) + 1
+        else:
+            self._max_ring = 0
+
+    def nearest(self, x: float, y: float) -> Optional[int]:
+        """
+        Index of the node nearest (x, y); ties go to the lowest index.
+
+        Searches rings of cells outward and stops once no unsearched cell
+        can hold a closer node.
+        """
+        if not self.nodes:
+            return None
+
+        size = self.cell_size
+        cx, cy = int(x // size), int(y // size)
+        max_ring = self._max_ring + max(abs(cx), abs(cy))
+        best = None
+        best_dist = float('inf')
+        xs, ys, cells = self.xs, self.ys, self._cells
+
+        for ring in range(max_ring + 1):
+            for gx in range(cx - ring, cx + ring + 1):
+                edge_x = gx in (cx - ring, cx + ring)
+                for gy in range(cy - ring, cy + ring + 1):
+                    if not edge_x and gy not in (cy - ring, cy + ring):
+                        continue  # Inside the ring, already searched
+                    for i in cells.get((gx, gy), ()):
+                        dx = xs[i] - x
+                        dy = ys[i] - y
+                        dist = dx * dx + dy * dy
+                        if dist < best_dist or (dist == best_dist and i < best):
+                            best_dist = dist
+                            best = i
+            # Anything beyond this ring is at least ring * size away
+            if best is not None and best_dist < (ring * size) ** 2:
+                break
+
+        return best
+
+    def find_path(self, start_x: float, start_y: float,
+                  end_x: float, end_y: float) -> List[Tuple[float, float]]:
+        """
+        Breadth-first path between the nodes nearest start and end.
+
+        Returns the same waypoints as searching the SidewalkNode objects.
+        """
+        start = self.nearest(start_x, start_y)
+        end = self.nearest(end_x, end_y)
+
+        if start is None or end is None:
+            return [(end_x, end_y)]
+
+        if start == end:
+            return [(self.xs[end], self.ys[end])]
+
+        parent = {start: start}
+        queue = deque([start])
+        neighbors = self.neighbors
+        while queue:
+            node = queue.popleft()
+            if node == end:
+                path = []
+                while node != start:
+                    path.append((self.xs[node], self.ys[node]))
+                    node = parent[node]
+                path.append((self.xs[start], self.ys[start]))
+                path.reverse()
+                return path
+
+            for neighbor in neighbors[node]:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+
+        # No path found, return direct
+        return [(end_x, end_y)]
+
+
 class CityMap:
     """
     The main city map with streets, sidewalks, and buildings.
     """
 
-    def __init__(self, config: CityConfig = None):
+    def __init__(self, config: CityConfig = None, rng: random.Random = None):
         self.config = config or CityConfig()
+        self.rng = rng or get_rng().stream(STREAM_CITY)
         self.blocks: List[CityBlock] = []
         self.parking_lots: List[ParkingLot] = []
         self.water_bodies: List[WaterBody] = []
         self.bridges: List[Bridge] = []
         self.sidewalk_nodes: List[SidewalkNode] = []
         self.sidewalk_rects: List[pygame.Rect] = []  # For rendering
+        self.sidewalk_graph: Optional[SidewalkGraph] = None  # Built with the sidewalks
         self.time = 0.0  # For water animation
+        self.water_frames = WaterFrameCache()
+        self._walkable_points: Dict[int, List[Tuple[float, float]]] = {}  # spacing -> points
 
         # Pre-render surfaces for performance
         self._road_surface: Optional[pygame.Surface] = None
         self._sidewalk_surface: Optional[pygame.Surface] = None
 
+        # Entities stamped into the road layer: key -> (rect, pixels under it, draw)
+        self._stamps: Dict[Hashable, Tuple[pygame.Rect, pygame.Surface, Callable]] = {}
+
         self._generate_city()
 
     def _generate_city(self):
@@ -971,16 +1345,16 @@ class CityMap:
                     continue  # Don't place buildings in water
 
                 # Some blocks are empty (parks/lots)
-                if random.random() < 0.15:
+                if self.rng.random() < 0.15:
                     empty_cells.append((x, y, cfg.block_width, cfg.block_height))
                     continue
 
-                block = CityBlock(x, y, cfg.block_width, cfg.block_height)
+                block = CityBlock(x, y, cfg.block_width, cfg.block_height, rng=self.rng)
                 self.blocks.append(block)
 
         # Turn some empty cells into parking lots (about 40% of empty spaces)
         for x, y, w, h in empty_cells:
-            if random.random() < 0.4:
+            if self.rng.random() < 0.4:
                 lot = ParkingLot(x, y, w, h)
                 self.parking_lots.append(lot)
 
@@ -989,16 +1363,17 @@ class CityMap:
 
         # Pre-render static elements
         self._render_roads()
+        self._bake_static_features()
 
     def _generate_lake(self, cols: int, rows: int, cell_width: int, cell_height: int, cfg):
         """Generate a lake with a bridge crossing it."""
         # Place lake in a random area (not too close to edges)
-        lake_col = random.randint(2, max(3, cols - 4))
-        lake_row = random.randint(2, max(3, rows - 4))
+        lake_col = self.rng.randint(2, max(3, cols - 4))
+        lake_row = self.rng.randint(2, max(3, rows - 4))
 
         # Lake spans 2-3 cells wide and 3-4 cells tall (or vice versa)
-        lake_width_cells = random.randint(2, 3)
-        lake_height_cells = random.randint(3, 4)
+        lake_width_cells = self.rng.randint(2, 3)
+        lake_height_cells = self.rng.randint(3, 4)
 
         # Calculate lake position and size
         lake_x = lake_col * cell_width
@@ -1052,6 +1427,9 @@ class CityMap:
             if (col, row + 1) in node_grid:
                 node.connect(node_grid[(col, row + 1)])
 
+        # Read-only search graph (shared with path-planning workers)
+        self.sidewalk_graph = SidewalkGraph(self.sidewalk_nodes)
+
         # Generate sidewalk rectangles for rendering
         for node in self.sidewalk_nodes:
             for neighbor in node.neighbors:
@@ -1244,57 +1622,114 @@ class CityMap:
         for rect in self.sidewalk_rects:
             pygame.draw.rect(self._road_surface, cfg.sidewalk_color, rect)
 
+    def _bake_static_features(self):
+        """Draw water beds, bridges and parking lots into the road layer (they never change)."""
+        cfg = self.config
+        world = _WorldCamera(cfg.world_width, cfg.world_height)
+        for water in self.water_bodies:
+            water.draw_bed(self._road_surface)
+            water.set_covers([bridge.rect for bridge in self.bridges
+                              if bridge.rect.colliderect(water.rect)])
+        for bridge in self.bridges:
+            bridge.draw(self._road_surface, world)
+        for lot in self.parking_lots:
+            lot.draw(self._road_surface, world)
+
+    def stamp(self, key: Hashable, rect: pygame.Rect,
+              draw: Callable[[pygame.Surface, object], None]) -> bool:
+        """
+        Bake a still entity (e.g. a parked car) into the road layer.
+
+        Args:
+            key: Identifies the stamp for unstamp()
+            rect: World area the entity covers
+            draw: draw(surface, camera), called with a 1:1 world camera
+
+        Returns:
+            False if there is no road layer or the rect is off the world.
+        """
+        if self._road_surface is None or key in self._stamps:
+            return False
+        cfg = self.config
+        left, top = max(0, rect.x), max(0, rect.y)
+        right = min(cfg.world_width, rect.x + rect.width)
+        bottom = min(cfg.world_height, rect.y + rect.height)
+        if left >= right or top >= bottom:
+            return False
+
+        area = pygame.Rect(left, top, right - left, bottom - top)
+        under = self._road_surface.subsurface(area).copy()
+        draw(self._road_surface, _WorldCamera(cfg.world_width, cfg.world_height))
+        self._stamps[key] = (area, under, draw)
+        return True
+
+    def unstamp(self, key: Hashable) -> bool:
+        """Remove a stamp, restoring the road layer under it. Returns False if unknown."""
+        if key not in self._stamps:
+            return False
+
+        # Stamps made later that overlap this one (directly or through each
+        # other) are lifted first and stamped again afterwards
+        keys = list(self._stamps)
+        lifted = [key]
+        for later in keys[keys.index(key) + 1:]:
+            area = self._stamps[later][0]
+            if any(self._stamps[k][0].colliderect(area) for k in lifted):
+                lifted.append(later)
+
+        entries = {k: self._stamps.pop(k) for k in lifted}
+        for k in reversed(lifted):
+            area, under, _ = entries[k]
+            self._road_surface.blit(under, (area.x, area.y))
+        for k in lifted[1:]:
+            area, _, draw = entries[k]
+            self.stamp(k, area, draw)
+        return True
+
     def get_nearest_sidewalk_node(self, x: float, y: float) -> Optional[SidewalkNode]:
         """Find the nearest sidewalk node to a position."""
         if not self.sidewalk_nodes:
             return None
+        return self.sidewalk_graph.nodes[self.sidewalk_graph.nearest(x, y)]
 
-        nearest = None
-        nearest_dist = float('inf')
+    def get_walkable_points(self, spacing: int = 40) -> List[Tuple[float, float]]:
+        """
+        Positions every `spacing` px along the sidewalk network (cached).
 
-        for node in self.sidewalk_nodes:
-            dx = node.x - x
-            dy = node.y - y
-            dist = dx * dx + dy * dy
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest = node
+        Points over water are left out, so everything returned is somewhere
+        a player can stand - used as sites for placing anomalies and clues.
+        """
+        points = self._walkable_points.get(spacing)
+        if points is not None:
+            return points
 
-        return nearest
+        points = []
+        for node in self.sidewalk_nodes:
+            for neighbor in node.neighbors:
+                # Each edge once, walking right or down from the node
+                if neighbor.x < node.x or neighbor.y < node.y:
+                    continue
+                length = abs(neighbor.x - node.x) + abs(neighbor.y - node.y)
+                steps = max(1, int(length // spacing))
+                for i in range(steps):
+                    t = i / steps
+                    x = node.x + (neighbor.x - node.x) * t
+                    y = node.y + (neighbor.y - node.y) * t
+                    if not any(water.rect.collidepoint(x, y) for water in self.water_bodies):
+                        points.append((x, y))
+
+        self._walkable_points[spacing] = points
+        return points
 
     def find_path(self, start_x: float, start_y: float,
                   end_x: float, end_y: float) -> List[Tuple[float, float]]:
         """
         Find a path along sidewalks from start to end.
-        Uses simple BFS pathfinding.
+        Uses simple BFS pathfinding over the sidewalk graph.
         """
-        start_node = self.get_nearest_sidewalk_node(start_x, start_y)
-        end_node = self.get_nearest_sidewalk_node(end_x, end_y)
-
-        if not start_node or not end_node:
+        if self.sidewalk_graph is None:
             return [(end_x, end_y)]
-
-        if start_node == end_node:
-            return [(end_node.x, end_node.y)]
-
-        # BFS
-        from collections import deque
-        queue = deque([(start_node, [start_node])])
-        visited = {start_node}
-
-        while queue:
-            node, path = queue.popleft()
-
-            if node == end_node:
-                return [(n.x, n.y) for n in path]
-
-            for neighbor in node.neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-        # No path found, return direct
-        return [(end_x, end_y)]
+        return self.sidewalk_graph.find_path(start_x, start_y, end_x, end_y)
 
     def is_on_sidewalk(self, x: float, y: float, margin: int = 20) -> bool:
         """Check if a position is on or near a sidewalk."""
@@ -1323,8 +1758,21 @@ class CityMap:
         """Update window states periodically. (Legacy - use update() instead)"""
         self.update(dt, lit_chance)
 
-    def draw(self, screen: pygame.Surface, camera: Camera, darkness_alpha: int = 0):
-        """Draw the city with optional darkness overlay."""
+    @staticmethod
+    def get_darkness_tint(darkness_alpha: int) -> Optional[Tuple[int, int, int, int]]:
+        """Get the full-screen night tint (RGBA) for a darkness level, or None."""
+        if darkness_alpha <= 20:
+            return None
+        return (20, 25, 50, darkness_alpha // 2)
+
+    def draw(self, screen: pygame.Surface, camera: Camera, darkness_alpha: int = 0,
+             overlay: bool = True):
+        """
+        Draw the city with optional darkness overlay.
+
+        Args:
+            overlay: Blit the night tint here (False when the caller composites it)
+        """
         # Draw pre-rendered roads/sidewalks with wraparound support
         if self._road_surface:
             cam_x = int(camera.x) % self.config.world_width
@@ -1357,17 +1805,11 @@ class CityMap:
                 wrap_rect = pygame.Rect(0, 0, right_overflow, bottom_overflow)
                 screen.blit(self._road_surface, (main_width, main_height), wrap_rect)
 
-        # Draw water bodies (lakes, ponds)
+        # Lake waves (water beds, bridges and parking lots are baked into
+        # the road layer; waves skip the parts under bridges)
         for water in self.water_bodies:
-            water.draw(screen, camera, self.time)
-
-        # Draw bridges over water
-        for bridge in self.bridges:
-            bridge.draw(screen, camera)
-
-        # Draw parking lots (before buildings so they appear behind)
-        for lot in self.parking_lots:
-            lot.draw(screen, camera)
+            water.draw_waves(screen, camera, self.time, self.water_frames)
+        self.water_frames.evict(self.time)
 
         # Draw buildings with darkness (handle wraparound by drawing at multiple positions)
         for block in self.blocks:
@@ -1403,7 +1845,5 @@ class CityMap:
                     block.draw_at_offset(screen, camera, self.config.world_width, self.config.world_height, darkness_alpha)
 
         # Apply overall darkness overlay for night
-        if darkness_alpha > 20:
-            overlay = pygame.Surface((camera.screen_width, camera.screen_height), pygame.SRCALPHA)
-            overlay.fill((20, 25, 50, darkness_alpha // 2))
-            screen.blit(overlay, (0, 0))
+        if overlay:
+            get_post_processor().draw_tint(screen, [self.get_darkness_tint(darkness_alpha)])
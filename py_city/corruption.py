@@ -17,6 +17,9 @@ import random
 import math
 import pygame
 
+from rng import get_rng, STREAM_CORRUPTION
+from postprocess import get_post_processor
+
 
 class CorruptionManager:
     """Manages entropy-based corruption effects across the game loop."""
@@ -30,7 +33,11 @@ class CorruptionManager:
         "COMPLETED": 0.8,
     }
 
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
+        # Simulation rolls use the seeded stream; on-screen glitch jitter in
+        # the draw methods stays on the random module so rendering never
+        # perturbs a replay
+        self.rng = rng or get_rng().stream(STREAM_CORRUPTION)
         self.entropy = 0.0
         self.target_entropy = 0.0
 
@@ -84,7 +91,7 @@ class CorruptionManager:
         if (self.entropy > 0.2 and
             not self._time_warp_active and
             self._time_warp_cooldown <= 0):
-            if random.random() < self.entropy * 0.005:  # ~0.15% at 0.3 entropy
+            if self.rng.random() < self.entropy * 0.005:  # ~0.15% at 0.3 entropy
                 self._trigger_time_warp()
 
         # Update input lag timer
@@ -110,41 +117,41 @@ class CorruptionManager:
 
         # Random chance to skip next frame clear (afterimage effect)
         if self.entropy > 0.25:
-            if random.random() < self.entropy * 0.008:  # ~0.24% at 0.3 entropy
+            if self.rng.random() < self.entropy * 0.008:  # ~0.24% at 0.3 entropy
                 self._skip_clear_next_frame = True
 
         # Random visual glitch
         if self.entropy > 0.15:
-            if random.random() < self.entropy * 0.01:
+            if self.rng.random() < self.entropy * 0.01:
                 self._spawn_glitch_rect()
 
     def _trigger_time_warp(self):
         """Trigger a brief time dilation effect."""
         self._time_warp_active = True
-        self._time_warp_cooldown = 5.0 + random.random() * 10.0  # 5-15 second cooldown
+        self._time_warp_cooldown = 5.0 + self.rng.random() * 10.0  # 5-15 second cooldown
 
         # At lower entropy: subtle (0.85-1.15)
         # At higher entropy: dramatic (0.5-1.5)
         if self.entropy < 0.4:
-            self._time_warp_factor = random.uniform(0.85, 1.15)
-            self._time_warp_duration = random.uniform(0.5, 1.5)
+            self._time_warp_factor = self.rng.uniform(0.85, 1.15)
+            self._time_warp_duration = self.rng.uniform(0.5, 1.5)
         else:
-            self._time_warp_factor = random.choice([
-                random.uniform(0.5, 0.7),   # Slow motion
-                random.uniform(1.3, 1.8),   # Fast forward
+            self._time_warp_factor = self.rng.choice([
+                self.rng.uniform(0.5, 0.7),   # Slow motion
+                self.rng.uniform(1.3, 1.8),   # Fast forward
             ])
-            self._time_warp_duration = random.uniform(0.3, 0.8)
+            self._time_warp_duration = self.rng.uniform(0.3, 0.8)
 
         self.time_warps_triggered += 1
 
     def _spawn_glitch_rect(self):
         """Create a visual glitch rectangle."""
         # Will be positioned during draw phase
-        w = random.randint(20, 100)
-        h = random.randint(10, 60)
+        w = self.rng.randint(20, 100)
+        h = self.rng.randint(10, 60)
 
         # Glitch colors: void black, static white, or corruption purple
-        color = random.choice([
+        color = self.rng.choice([
             (0, 0, 0),          # Void
             (255, 255, 255),    # Static flash
             (128, 0, 128),      # Corruption purple
@@ -174,7 +181,7 @@ class CorruptionManager:
 
         # Higher entropy = higher chance of blocking
         block_chance = (self.entropy - 0.3) * 0.2  # Max ~10% at 0.8 entropy
-        if random.random() < block_chance:
+        if self.rng.random() < block_chance:
             self.blocked_escapes += 1
             return True
         return False
@@ -188,8 +195,8 @@ class CorruptionManager:
             return 0.0
 
         # Occasional hesitation spikes
-        if random.random() < self.entropy * 0.02:
-            return random.uniform(0.05, 0.15)  # 50-150ms hesitation
+        if self.rng.random() < self.entropy * 0.02:
+            return self.rng.uniform(0.05, 0.15)  # 50-150ms hesitation
         return 0.0
 
     def get_movement_drift(self) -> tuple:
@@ -220,11 +227,11 @@ class CorruptionManager:
             return (0, 0)
 
         # At high entropy, occasional wrap distortion
-        if random.random() < self.entropy * 0.01:
+        if self.rng.random() < self.entropy * 0.01:
             # Subtle offset that feels "wrong"
             return (
-                random.randint(-50, 50),
-                random.randint(-50, 50),
+                self.rng.randint(-50, 50),
+                self.rng.randint(-50, 50),
             )
         return (0, 0)
 
@@ -235,7 +242,29 @@ class CorruptionManager:
         """
         if self.entropy < 0.2:
             return False
-        return random.random() < self.entropy * 0.003  # ~0.1% at 0.3 entropy
+        return self.rng.random() < self.entropy * 0.003  # ~0.1% at 0.3 entropy
+
+    def pick_frozen_npcs(self, count: int) -> list:
+        """
+        Pick which of `count` NPCs skip this frame's update (freeze glitch).
+
+        Same odds per NPC as should_skip_npc_update(), but the random draws
+        scale with the NPCs picked rather than with count.
+
+        Returns:
+            Ascending NPC indices in range(count).
+        """
+        if self.entropy < 0.2 or count <= 0:
+            return []
+        log_miss = math.log(1.0 - self.entropy * 0.003)
+        picked = []
+        index = -1
+        while True:
+            # Geometric gap to the next frozen NPC
+            index += 1 + int(math.log(1.0 - self.rng.random()) / log_miss)
+            if index >= count:
+                return picked
+            picked.append(index)
 
     def get_flicker_building_id(self):
         """
@@ -271,6 +300,7 @@ class CorruptionManager:
             return
 
         screen_w, screen_h = screen.get_size()
+        post = get_post_processor()
 
         for rect, alpha, color in self._glitch_rects:
             # Clamp alpha to valid range
@@ -284,34 +314,23 @@ class CorruptionManager:
             rect.x = random.randint(0, max_x) if max_x > 0 else 0
             rect.y = random.randint(0, max_y) if max_y > 0 else 0
 
-            # Create semi-transparent glitch surface
-            glitch_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            glitch_color = (color[0], color[1], color[2], clamped_alpha)
-            glitch_surf.fill(glitch_color)
+            # Semi-transparent glitch from the pooled stamp set
+            post.draw_glitch(screen, rect, color, clamped_alpha)
 
-            screen.blit(glitch_surf, rect.topleft)
-
-    def draw_scan_lines(self, screen: pygame.Surface):
+    def get_scan_line_alpha(self) -> int:
         """
-        Draw CRT-style scan lines at high entropy.
-        Subtle visual degradation effect.
+        Alpha of this frame's CRT-style scan lines (0 for none).
+        Subtle visual degradation effect at high entropy; the lines are
+        drawn as part of the post-processor's overlay layer.
         """
         if self.entropy < 0.4:
-            return
+            return 0
 
         # Only draw occasionally to avoid constant visual noise
         if random.random() > self.entropy * 0.3:
-            return
-
-        screen_h = screen.get_height()
-        line_spacing = 4
-
-        line_surf = pygame.Surface((screen.get_width(), 1), pygame.SRCALPHA)
-        alpha = int(20 * self.entropy)  # Max ~16 alpha
-        line_surf.fill((0, 0, 0, alpha))
+            return 0
 
-        for y in range(0, screen_h, line_spacing):
-            screen.blit(line_surf, (0, y))
+        return int(20 * self.entropy)  # Max ~16 alpha
 
     def get_narrator_trigger(self) -> str | None:
         """
@@ -0,0 +1,105 @@
+"""
+Character Decorations for Py City
+=================================
+
+Pre-rendered stamps for what gets drawn around every character: the ground
+shadow, the health bar and the status dots. Characters blit these instead of
+allocating a shadow surface and drawing primitives each frame, so an NPC
+draws as a few blits with no allocations.
+
+Features:
+- One shadow stamp per (character size, alpha), with its blit offset
+- Health-bar stamps per (width, height, health step); health is quantized
+  to 5% steps so the whole population shares 21 bars per size
+- Status dots (crime, trust) per (color, radius)
+"""
+
+from typing import Dict, Tuple
+
+import pygame
+
+
+Color = Tuple[int, int, int]
+
+# Health bars are rendered for every HEALTH_STEP percent
+HEALTH_STEP = 5
+
+HEALTH_BAR_BACK = (255, 0, 0)
+HEALTH_BAR_FILL = (0, 255, 0)
+
+
+class CharacterDecorations:
+    """Cache of shadow, health-bar and status-dot stamps."""
+
+    def __init__(self):
+        self._shadows: Dict[Tuple[int, int], Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._bars: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self._dots: Dict[Tuple[Color, int], pygame.Surface] = {}
+        self.renders = 0  # Stamps rendered (for tests / debug overlay)
+
+    def shadow(self, size: int, alpha: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Get the ellipse shadow for a character of the given size.
+
+        Returns:
+            (stamp, (dx, dy)) - blit at the character's screen position + offset.
+        """
+        key = (size, alpha)
+        entry = self._shadows.get(key)
+        if entry is None:
+            width = int(size * 0.8)
+            height = int(size * 0.3)
+            stamp = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.ellipse(stamp, (0, 0, 0, alpha), (0, 0, width, height))
+            entry = (stamp, ((size - width) // 2, size - height // 2))
+            self._shadows[key] = entry
+            self.renders += 1
+        return entry
+
+    def health_bar(self, width: int, height: int, health: float) -> pygame.Surface:
+        """Get the health-bar stamp for health (0-100, rounded to HEALTH_STEP)."""
+        step = int(max(0.0, min(100.0, health)) / HEALTH_STEP + 0.5) * HEALTH_STEP
+        key = (width, height, step)
+        stamp = self._bars.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((width, height))
+            stamp.fill(HEALTH_BAR_BACK)
+            pygame.draw.rect(stamp, HEALTH_BAR_FILL, (0, 0, int(width * step / 100), height))
+            self._bars[key] = stamp
+            self.renders += 1
+        return stamp
+
+    def dot(self, color: Color, radius: int) -> pygame.Surface:
+        """Get a filled circle stamp; blit it at (center - radius)."""
+        key = (color, radius)
+        stamp = self._dots.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, (radius, radius), radius)
+            self._dots[key] = stamp
+            self.renders += 1
+        return stamp
+
+    def clear(self):
+        """Drop every stamp (e.g. after a display mode change)."""
+        self._shadows.clear()
+        self._bars.clear()
+        self._dots.clear()
+
+
+# Global decoration cache
+_decorations = None
+
+
+def get_decorations() -> CharacterDecorations:
+    """Get the global character decoration cache."""
+    global _decorations
+    if _decorations is None:
+        _decorations = CharacterDecorations()
+    return _decorations
+
+
+def reset_decorations():
+    """Drop the global decoration cache and its stamps."""
+    global _decorations
+    _decorations = None
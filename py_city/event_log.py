@@ -6,15 +6,30 @@ Tracks and displays game events including:
 - Narrator lines
 - Quest updates
 - Discoveries
+
+Recent entries live in a fixed-size ring buffer (O(1) append/evict) with
+per-type index views. The full session history can be kept in an optional
+append-only journal (JSON lines) written by a background thread and
+queried by time range and type.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from itertools import islice
+from typing import Callable, Optional
 from enum import Enum
 from datetime import datetime
+import bisect
+import json
+import queue
+import threading
 import time
 
 
+# Environment variable naming a journal file for run_wrapped sessions
+JOURNAL_ENV_VAR = "PY_CITY_EVENT_JOURNAL"
+
+
 class EventType(Enum):
     """Types of events that can be logged."""
     NARRATOR = "narrator"
@@ -24,7 +39,7 @@ class EventType(Enum):
     SYSTEM = "system"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A single event log entry."""
     event_type: EventType
@@ -59,19 +74,150 @@ class LogEntry:
         else:
             return (150, 150, 160)  # Gray for system
 
+    def to_dict(self) -> dict:
+        """Serialize for the journal."""
+        return {
+            "t": round(self.timestamp, 3),
+            "type": self.event_type.value,
+            "text": self.text,
+            "speaker": self.speaker,
+            "location": self.location,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogEntry":
+        """Rebuild an entry from a journal line."""
+        return cls(
+            event_type=EventType(data["type"]),
+            text=data["text"],
+            timestamp=data["t"],
+            speaker=data.get("speaker", ""),
+            location=data.get("location", ""),
+        )
+
+
+class EventJournal:
+    """
+    Append-only JSON-lines journal of every log entry.
+
+    Writes happen on a background thread. A sparse (timestamp, offset) index
+    lets time-range queries seek instead of scanning the whole file.
+    """
+
+    INDEX_STRIDE = 64  # Entries between index points
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "ab")
+        self._offset = self._file.tell()
+        self._start_offset = self._offset  # Earlier sessions may share the file
+        self._index: list[tuple[float, int]] = []
+        self._written = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="event-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, entry: LogEntry):
+        """Queue an entry for writing."""
+        self._queue.put(entry)
+
+    def _run(self):
+        """Writer thread: encode and append entries until a None sentinel."""
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is None:
+                    return
+                line = (json.dumps(entry.to_dict()) + "\n").encode("utf-8")
+                with self._lock:
+                    if self._written % self.INDEX_STRIDE == 0:
+                        self._index.append((entry.timestamp, self._offset))
+                    self._file.write(line)
+                    self._offset += len(line)
+                    self._written += 1
+                    if self._queue.empty():
+                        self._file.flush()
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait for queued entries to reach the file."""
+        self._queue.join()
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              event_type: Optional[EventType] = None) -> list[LogEntry]:
+        """
+        Read entries in a time range (inclusive), optionally of one type.
+
+        Args:
+            start: Earliest timestamp (None = session start)
+            end: Latest timestamp (None = now)
+            event_type: Only entries of this type
+        """
+        self.flush()
+        with self._lock:
+            offset = self._start_offset
+            if start is not None and self._index:
+                i = bisect.bisect_right(self._index, (start, float("inf"))) - 1
+                if i >= 0:
+                    offset = self._index[i][1]
+            stop = self._offset
+
+        results = []
+        type_value = event_type.value if event_type else None
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            pos = offset
+            for raw in f:
+                pos += len(raw)
+                if pos > stop:
+                    break  # Written after the flush (possibly partial)
+                data = json.loads(raw)
+                if start is not None and data["t"] < start:
+                    continue
+                if end is not None and data["t"] > end:
+                    break  # Timestamps only increase
+                if type_value and data["type"] != type_value:
+                    continue
+                results.append(LogEntry.from_dict(data))
+        return results
+
+    def count(self) -> int:
+        """Entries written this session."""
+        with self._lock:
+            return self._written
+
+    def close(self):
+        """Flush, stop the writer thread and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=2.0)
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
 
 class EventLog:
     """
     Manages a log of game events.
 
     Stores recent dialogue, narrator lines, and other events
-    for display in the Tab menu.
+    for display in the Tab menu. Only the newest max_entries stay in
+    memory; pass journal_path to keep the whole session on disk.
     """
 
-    def __init__(self, max_entries: int = 100):
-        self.entries: list[LogEntry] = []
+    def __init__(self, max_entries: int = 100, journal_path: Optional[str] = None):
+        self.entries: deque[LogEntry] = deque(maxlen=max_entries)
         self.max_entries = max_entries
+        self._by_type: dict[EventType, deque[LogEntry]] = {t: deque() for t in EventType}
+        self.total_count = 0  # Entries logged this session (including evicted)
+        self.journal = EventJournal(journal_path) if journal_path else None
         self._start_time = time.time()
+        self.on_add: Optional[Callable[[LogEntry], None]] = None  # New entry (UI refresh)
 
     def _get_game_time(self) -> float:
         """Get elapsed time since log started."""
@@ -87,11 +233,20 @@ class EventLog:
             speaker=speaker,
             location=location,
         )
+        # Ring buffer is full: the oldest entry is also the oldest of its type
+        if len(self.entries) == self.max_entries:
+            oldest = self.entries[0]
+            self._by_type[oldest.event_type].popleft()
+
         self.entries.append(entry)
+        self._by_type[event_type].append(entry)
+        self.total_count += 1
 
-        # Trim old entries if needed
-        while len(self.entries) > self.max_entries:
-            self.entries.pop(0)
+        if self.journal:
+            self.journal.append(entry)
+
+        if self.on_add:
+            self.on_add(entry)
 
     def log_narrator(self, text: str):
         """Log a narrator/guide line."""
@@ -115,11 +270,29 @@ class EventLog:
 
     def get_recent(self, count: int = 20) -> list[LogEntry]:
         """Get the most recent entries."""
-        return self.entries[-count:] if self.entries else []
+        recent = list(islice(reversed(self.entries), count))
+        recent.reverse()
+        return recent
 
     def get_by_type(self, event_type: EventType) -> list[LogEntry]:
-        """Get all entries of a specific type."""
-        return [e for e in self.entries if e.event_type == event_type]
+        """Get all in-memory entries of a specific type."""
+        return list(self._by_type[event_type])
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              event_type: Optional[EventType] = None) -> list[LogEntry]:
+        """
+        Get entries in a time range, optionally of one type.
+
+        Reads the journal (full session) when there is one, otherwise
+        searches the in-memory ring buffer.
+        """
+        if self.journal:
+            return self.journal.query(start, end, event_type)
+
+        source = self._by_type[event_type] if event_type else self.entries
+        return [e for e in source
+                if (start is None or e.timestamp >= start)
+                and (end is None or e.timestamp <= end)]
 
     def get_narrator_lines(self) -> list[LogEntry]:
         """Get all narrator lines."""
@@ -130,13 +303,20 @@ class EventLog:
         return self.get_by_type(EventType.NPC_DIALOGUE)
 
     def clear(self):
-        """Clear all log entries."""
+        """Clear all in-memory log entries (the journal is append-only)."""
         self.entries.clear()
+        for entries in self._by_type.values():
+            entries.clear()
 
     def count(self) -> int:
-        """Get total entry count."""
+        """Get in-memory entry count."""
         return len(self.entries)
 
+    def close(self):
+        """Finish writing and close the journal, if any."""
+        if self.journal:
+            self.journal.close()
+
 
 # Global event log instance
 _event_log: Optional[EventLog] = None
@@ -150,7 +330,9 @@ def get_event_log() -> EventLog:
     return _event_log
 
 
-def reset_event_log():
-    """Reset the global event log."""
+def reset_event_log(journal_path: Optional[str] = None):
+    """Reset the global event log (optionally journaling to a file)."""
     global _event_log
-    _event_log = EventLog()
+    if _event_log is not None:
+        _event_log.close()
+    _event_log = EventLog(journal_path=journal_path)
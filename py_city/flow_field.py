@@ -0,0 +1,222 @@
+"""
+Flow Field for Py City
+======================
+
+Dijkstra map over a coarse grid of the city: every walkable cell stores its
+step distance to one goal (the player). Anyone chasing the goal walks
+downhill, anyone running from it walks uphill, and each of those moves is a
+table lookup - the search is paid once per rebuild and shared by every
+pursuer and fleeing NPC.
+
+Features:
+- Grid cells blocked where a building covers the cell center
+- Two bytes per cell until the first rebuild (passable flag and
+  open-neighbor bits, no per-cell neighbor lists); distances are only
+  allocated once someone chases or flees
+- Breadth-first rebuild from the goal cell, only when the goal changes
+  cell, at most once per rebuild interval, and only once someone asks
+  for a direction (no pursuers, no cost)
+- Per-cell step directions (8-way, no cutting building corners) cached
+  until the next rebuild
+- Lookups outside the reachable area return None so callers fall back
+  to a straight line
+
+The grid does not wrap at the world edges the way the player does.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+
+# Grid cell size in pixels (roads are 80px wide, so every street stays open)
+FLOW_CELL_SIZE = 40
+
+# Minimum seconds between rebuilds while the goal keeps moving
+REBUILD_INTERVAL = 0.25
+
+# Distance stored for cells the goal can't be reached from
+UNREACHED = -1
+
+# Open-neighbor bits stored per cell
+_OPEN_LEFT, _OPEN_RIGHT, _OPEN_UP, _OPEN_DOWN = 1, 2, 4, 8
+
+# Step offsets, orthogonal first (ties prefer straight moves)
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+_DIAGONAL = 1 / math.sqrt(2)
+
+
+class FlowField:
+    """Shared distance-to-goal grid with per-cell chase and flee directions."""
+
+    def __init__(self, width: int, height: int, blocked: Iterable[pygame.Rect] = (),
+                 cell_size: int = FLOW_CELL_SIZE, rebuild_interval: float = REBUILD_INTERVAL):
+        """
+        Args:
+            width, height: World size in pixels
+            blocked: Rects nothing can walk through (buildings)
+            cell_size: Grid cell size in pixels
+            rebuild_interval: Minimum seconds between rebuilds
+        """
+        self.cell_size = cell_size
+        self.rebuild_interval = rebuild_interval
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.builds = 0  # Rebuilds so far (for tests / debug overlay)
+
+        self.passable = bytearray([1]) * (self.cols * self.rows)
+        half = cell_size / 2
+        for rect in blocked:
+            first_cx = max(0, int((rect.x - half) // cell_size))
+            first_cy = max(0, int((rect.y - half) // cell_size))
+            for cy in range(first_cy, min(self.rows, int((rect.y + rect.height) // cell_size) + 1)):
+                center_y = cy * cell_size + half
+                if not rect.y <= center_y < rect.y + rect.height:
+                    continue
+                for cx in range(first_cx, min(self.cols, int((rect.x + rect.width) // cell_size) + 1)):
+                    center_x = cx * cell_size + half
+                    if rect.x <= center_x < rect.x + rect.width:
+                        self.passable[cy * self.cols + cx] = 0
+
+        # Open 4-way neighbors of every cell as bits, so a rebuild is a
+        # plain BFS without a neighbor tuple per cell
+        cols, rows, passable = self.cols, self.rows, self.passable
+        self._open = bytearray(cols * rows)
+        for cell in range(cols * rows):
+            cx, cy = cell % cols, cell // cols
+            bits = 0
+            if cx > 0 and passable[cell - 1]:
+                bits |= _OPEN_LEFT
+            if cx < cols - 1 and passable[cell + 1]:
+                bits |= _OPEN_RIGHT
+            if cy > 0 and passable[cell - cols]:
+                bits |= _OPEN_UP
+            if cy < rows - 1 and passable[cell + cols]:
+                bits |= _OPEN_DOWN
+            self._open[cell] = bits
+
+        self.dist: List[int] = []  # Steps to the goal per cell, filled by the first rebuild
+        self.goal: Optional[int] = None  # Cell the distances currently lead to
+        self._wanted: Optional[int] = None  # Cell the goal is in now
+        self._since_build = 0.0
+        self._toward: Dict[int, Optional[Tuple[float, float]]] = {}
+        self._away: Dict[int, Optional[Tuple[float, float]]] = {}
+
+    @classmethod
+    def for_city(cls, city_map, **kwargs) -> "FlowField":
+        """Build a field over a CityMap with its buildings blocked."""
+        buildings = [building for block in city_map.blocks for building in block.buildings]
+        return cls(city_map.config.world_width, city_map.config.world_height,
+                   buildings, **kwargs)
+
+    def cell_at(self, x: float, y: float) -> int:
+        """Index of the cell containing (x, y) (clamped to the grid)."""
+        cx = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        cy = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return cy * self.cols + cx
+
+    def update(self, dt: float, goal_x: float, goal_y: float):
+        """Track the goal's position (cheap; the rebuild waits for a query)."""
+        self._since_build += dt
+        self._wanted = self.cell_at(goal_x, goal_y)
+
+    def _refresh(self):
+        """Rebuild if the goal changed cell and the interval has passed."""
+        wanted = self._wanted
+        if wanted is None or wanted == self.goal:
+            return
+        if self.goal is None or self._since_build >= self.rebuild_interval:
+            self._build(wanted)
+
+    def _build(self, goal: int):
+        """Breadth-first distances from the goal cell over passable cells."""
+        open_bits, cols = self._open, self.cols
+        dist = [UNREACHED] * len(open_bits)
+        dist[goal] = 0  # Seeded even if blocked (the goal may hug a wall)
+        frontier = deque([goal])
+        popleft, append = frontier.popleft, frontier.append
+
+        while frontier:
+            cell = popleft()
+            next_dist = dist[cell] + 1
+            bits = open_bits[cell]
+            if bits & _OPEN_LEFT and dist[cell - 1] < 0:
+                dist[cell - 1] = next_dist
+                append(cell - 1)
+            if bits & _OPEN_RIGHT and dist[cell + 1] < 0:
+                dist[cell + 1] = next_dist
+                append(cell + 1)
+            if bits & _OPEN_UP and dist[cell - cols] < 0:
+                dist[cell - cols] = next_dist
+                append(cell - cols)
+            if bits & _OPEN_DOWN and dist[cell + cols] < 0:
+                dist[cell + cols] = next_dist
+                append(cell + cols)
+
+        self.dist = dist
+        self.goal = goal
+        self._since_build = 0.0
+        self._toward.clear()
+        self._away.clear()
+        self.builds += 1
+
+    def distance(self, x: float, y: float) -> Optional[int]:
+        """Steps from (x, y) to the goal (None if unreachable or no goal yet)."""
+        self._refresh()
+        if self.goal is None:
+            return None
+        steps = self.dist[self.cell_at(x, y)]
+        return None if steps == UNREACHED else steps
+
+    def direction(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """Unit step toward the goal (None in the goal cell or off the field)."""
+        return self._lookup(x, y, self._toward, -1)
+
+    def flee_direction(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """Unit step away from the goal (None if cornered or off the field)."""
+        return self._lookup(x, y, self._away, 1)
+
+    def _lookup(self, x: float, y: float, cache: dict, sign: int) -> Optional[Tuple[float, float]]:
+        """Cached step direction for the cell at (x, y)."""
+        self._refresh()
+        if self.goal is None:
+            return None
+        cell = self.cell_at(x, y)
+        if cell in cache:
+            return cache[cell]
+        step = self._best_step(cell, sign)
+        cache[cell] = step
+        return step
+
+    def _best_step(self, cell: int, sign: int) -> Optional[Tuple[float, float]]:
+        """Neighbor step that most lowers (sign -1) or raises (sign 1) the distance."""
+        dist = self.dist
+        here = dist[cell]
+        if here == UNREACHED:
+            return None
+
+        cols, rows, passable = self.cols, self.rows, self.passable
+        cx, cy = cell % cols, cell // cols
+        best, best_score = None, 0
+        for dx, dy in _STEPS:
+            nx, ny = cx + dx, cy + dy
+            if not (0 <= nx < cols and 0 <= ny < rows):
+                continue
+            neighbor = ny * cols + nx
+            if dist[neighbor] == UNREACHED or not passable[neighbor]:
+                continue
+            # Diagonals only when both straight cells are open (no corner cutting)
+            if dx and dy and not (passable[cy * cols + nx] and passable[ny * cols + cx]):
+                continue
+            score = (dist[neighbor] - here) * sign
+            if score > best_score:
+                best, best_score = (dx, dy), score
+
+        if best is None:
+            return None
+        dx, dy = best
+        if dx and dy:
+            return dx * _DIAGONAL, dy * _DIAGONAL
+        return float(dx), float(dy)
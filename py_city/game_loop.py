@@ -18,6 +18,13 @@ from dataclasses import dataclass, field
 from typing import Callable, Optional
 from collections import deque
 
+from rng import get_rng, STREAM_CRIME, STREAM_PHASES
+from spatial import PointGrid, poisson_disk_sample, spacing_for
+
+
+# Bucket size for the undiscovered-anomaly grid (about twice the discovery radius)
+ANOMALY_CELL_SIZE = 100
+
 
 class NarratorQueue:
     """
@@ -238,9 +245,11 @@ class Crime:
 class CrimeSimulation:
     """Manages crime events in the city."""
 
-    def __init__(self, world_width: int, world_height: int):
+    def __init__(self, world_width: int, world_height: int,
+                 rng: random.Random = None):
         self.world_width = world_width
         self.world_height = world_height
+        self.rng = rng or get_rng().stream(STREAM_CRIME)
         self.active_crimes: list[Crime] = []
         self.crime_cooldown: float = 0.0
         self.min_cooldown: float = 12.0  # Faster crimes by default
@@ -303,10 +312,10 @@ class CrimeSimulation:
         if not available_criminals:
             return None
 
-        criminal = random.choice(available_criminals)
+        criminal = self.rng.choice(available_criminals)
 
         # Decide crime type
-        crime_type = random.choice(["mugging", "mugging", "burglary"])  # Mugging more common
+        crime_type = self.rng.choice(["mugging", "mugging", "burglary"])  # Mugging more common
 
         if crime_type == "mugging":
             # Find nearby civilian
@@ -317,7 +326,7 @@ class CrimeSimulation:
             ]
 
             if nearby_civilians:
-                victim = random.choice(nearby_civilians)
+                victim = self.rng.choice(nearby_civilians)
                 crime = Crime(
                     criminal_id=id(criminal),
                     victim_id=id(victim),
@@ -328,7 +337,7 @@ class CrimeSimulation:
                 self.active_crimes.append(crime)
                 criminal.committed_crime = True
                 self.total_muggings += 1
-                self.crime_cooldown = random.uniform(self.min_cooldown, self.max_cooldown)
+                self.crime_cooldown = self.rng.uniform(self.min_cooldown, self.max_cooldown)
 
                 if self.on_crime_start:
                     self.on_crime_start(crime)
@@ -347,7 +356,7 @@ class CrimeSimulation:
             criminal.committed_crime = True
             criminal.breaking_in = True
             self.total_burglaries += 1
-            self.crime_cooldown = random.uniform(self.min_cooldown, self.max_cooldown)
+            self.crime_cooldown = self.rng.uniform(self.min_cooldown, self.max_cooldown)
 
             if self.on_crime_start:
                 self.on_crime_start(crime)
@@ -497,13 +506,26 @@ class GameLoopManager:
     """Manages the Py City game loop and progression."""
 
     def __init__(self, world_width: int, world_height: int,
-                 guide=None, overlay=None, narrator_queue: NarratorQueue = None):
+                 guide=None, overlay=None, narrator_queue: NarratorQueue = None,
+                 city_map=None, rng: random.Random = None):
+        """
+        Args:
+            city_map: CityMap whose sidewalks anomalies are placed on (without
+                one, sites are guessed from the usual road grid)
+            rng: Stream for progression draws (anomaly and exit placement);
+                narration line picks stay on the random module
+        """
         self.world_width = world_width
         self.world_height = world_height
         self.guide = guide
         self.overlay = overlay
+        self.city_map = city_map
+        self.rng = rng or get_rng().stream(STREAM_PHASES)
         self.state = GameState()
 
+        # Undiscovered anomalies, bucketed for the per-frame discovery check
+        self._anomaly_grid = PointGrid(ANOMALY_CELL_SIZE)
+
         # Narrator queue to prevent overlapping speech (use provided or create new)
         self.narrator = narrator_queue or NarratorQueue(min_gap=5.0, max_queue=4)
 
@@ -591,33 +613,22 @@ class GameLoopManager:
             ),
         ]
 
-        # Place anomalies on sidewalks (not in buildings)
+        # Place anomalies on sidewalks (not in buildings), spread evenly
+        # with Poisson-disk sampling so they don't clump together
         # Use 6 anomalies, need 5 to progress
         # Only spawn first anomaly initially, rest spawn on discovery
         margin = 200
-        for i, anomaly in enumerate(anomaly_templates[:6]):
-            # Find valid sidewalk position (not in building)
-            max_attempts = 50
-            for _ in range(max_attempts):
-                x = random.randint(margin, self.world_width - margin)
-                y = random.randint(margin, self.world_height - margin)
-
-                # Check if position is on a road/sidewalk (not in a building block)
-                # Buildings are on a grid - roads are the gaps
-                block_size = 200  # Approximate block + road size
-                road_width = 40
-                x_in_grid = x % block_size
-                y_in_grid = y % block_size
-
-                # If x or y coordinate is in the road area (first 40px of each grid cell)
-                if x_in_grid < road_width or y_in_grid < road_width:
-                    anomaly.x = x
-                    anomaly.y = y
-                    break
+        chosen = anomaly_templates[:6]
+        spacing = spacing_for(self.world_width - margin * 2,
+                              self.world_height - margin * 2, len(chosen))
+        positions = poisson_disk_sample(self._anomaly_sites(margin), len(chosen), spacing, self.rng)
+        for i, anomaly in enumerate(chosen):
+            if i < len(positions):
+                anomaly.x, anomaly.y = positions[i]
             else:
-                # Fallback if no valid position found
-                anomaly.x = random.randint(margin, self.world_width - margin)
-                anomaly.y = random.randint(margin, self.world_height - margin)
+                # Fallback if the world has no valid sites
+                anomaly.x = self.rng.randint(margin, self.world_width - margin)
+                anomaly.y = self.rng.randint(margin, self.world_height - margin)
 
             # Only first anomaly is initially active, rest hidden until previous discovered
             if i > 0:
@@ -626,6 +637,24 @@ class GameLoopManager:
                 anomaly.hidden = False
 
             self.state.anomalies.append(anomaly)
+            self._anomaly_grid.insert(anomaly, anomaly.x, anomaly.y)
+
+    def _anomaly_sites(self, margin: int) -> list:
+        """Walkable positions at least `margin` px from the world edge."""
+        max_x = self.world_width - margin
+        max_y = self.world_height - margin
+        if self.city_map is not None:
+            return [(x, y) for x, y in self.city_map.get_walkable_points()
+                    if margin <= x <= max_x and margin <= y <= max_y]
+
+        # No map: buildings are on a grid - roads are the gaps
+        # (first 40px of each ~200px block + road cell)
+        block_size = 200  # Approximate block + road size
+        road_width = 40
+        return [(x, y)
+                for x in range(margin, max_x + 1, 20)
+                for y in range(margin, max_y + 1, 20)
+                if x % block_size < road_width or y % block_size < road_width]
 
     def start(self):
         """Start the game loop."""
@@ -721,17 +750,19 @@ class GameLoopManager:
             self._living_city_comment()
 
     def _update_anomalies(self, dt: float, player_x: float, player_y: float):
-        """Check for anomaly discovery."""
-        for anomaly in self.state.anomalies:
+        """Check for anomaly discovery (only anomalies bucketed near the player)."""
+        grid = self._anomaly_grid
+        for anomaly in grid.nearby(player_x, player_y, ANOMALY_CELL_SIZE):
             if anomaly.discovered:
+                # Marked found elsewhere (e.g. dev phase skip)
+                grid.remove(anomaly)
                 continue
 
             # Check if player is near anomaly
             dx = anomaly.x - player_x
             dy = anomaly.y - player_y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist < anomaly.radius:
+            if dx * dx + dy * dy < anomaly.radius * anomaly.radius:
+                grid.remove(anomaly)
                 self._discover_anomaly(anomaly)
 
         # Check if enough anomalies discovered
@@ -742,7 +773,7 @@ class GameLoopManager:
         """Update exit search phase."""
         if not self.state.exit_spawned:
             # Spawn exit at edge of world
-            edge = random.choice(['top', 'bottom', 'left', 'right'])
+            edge = self.rng.choice(['top', 'bottom', 'left', 'right'])
             if edge == 'top':
                 self.state.exit_x = self.world_width // 2
                 self.state.exit_y = 50
@@ -9,9 +9,17 @@ Supports multi-level buildings:
 - Ground floor (level 0): Main interior
 - Basement (level -1): Darker, more horror content
 - Upper floor (level 1): Additional exploration (hospital, bank)
+
+Floors are generated on first visit. InteriorManager keeps a bounded LRU of
+full interiors; evicted ones shrink to an InteriorDelta (what was searched or
+taken) and are rebuilt from their seed on re-entry. Interiors near the
+player can be pre-generated on a background thread so entering is free.
 """
 
+import queue
 import random
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import IntEnum
@@ -34,7 +42,7 @@ class FloorLevel(IntEnum):
     UPPER = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class InteriorObject:
     """
     A searchable object inside a building.
@@ -265,6 +273,30 @@ UPPER_FLOOR_ITEMS = {
 }
 
 
+# Margin around baked rooms so labels below/above objects aren't clipped
+ROOM_PADDING = 24
+
+_font_cache: dict[int, "pygame.font.Font"] = {}
+
+
+def _get_font(size: int):
+    """Get a cached default font of the given size."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
+
+def _searched_mask(level: "InteriorLevel") -> int:
+    """Bitmask of searched objects on a level (changes when a room needs re-baking)."""
+    mask = 0
+    for i, obj in enumerate(level.objects):
+        if obj.searched:
+            mask |= 1 << i
+    return mask
+
+
 @dataclass
 class InteriorLevel:
     """
@@ -277,6 +309,10 @@ class InteriorLevel:
     wall_color: tuple[int, int, int] = (35, 35, 40)
     floor_color: tuple[int, int, int] = (50, 50, 55)
 
+    # Baked room (see BuildingInterior.draw), keyed by the searched bitmask
+    room_surface: Optional[pygame.Surface] = field(default=None, repr=False, compare=False)
+    room_key: int = field(default=-1, repr=False, compare=False)
+
     def get_level_name(self) -> str:
         """Get human-readable level name."""
         if self.level == FloorLevel.BASEMENT:
@@ -286,13 +322,32 @@ class InteriorLevel:
         return "Ground Floor"
 
 
+@dataclass
+class InteriorDelta:
+    """
+    What the player changed in an interior, keyed by level.
+
+    Bitmasks index InteriorLevel.objects, which regenerate in the same order
+    from the interior's seed. Searching empties an object, so a searched
+    object comes back without its item.
+    """
+    building_type: str
+    seed: int
+    searched: dict[int, int] = field(default_factory=dict)  # level -> object bitmask
+    items_taken: list[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """True if nothing was changed (no need to keep the record)."""
+        return not self.searched and not self.items_taken
+
+
 @dataclass
 class BuildingInterior:
     """
     A multi-level building interior.
 
     Contains multiple floors with objects to search.
-    Supports stairs between levels.
+    Supports stairs between levels. Floors are generated on first visit.
     """
     building_type: str
     width: int = 400
@@ -301,43 +356,81 @@ class BuildingInterior:
     current_level: int = FloorLevel.GROUND
     seed: int = 0
     items_placed: list[str] = field(default_factory=list)
+    items_taken: list[str] = field(default_factory=list)
+    delta: Optional[InteriorDelta] = field(default=None, repr=False)  # Applied as levels generate
 
     # Convenience properties for backwards compatibility
     @property
     def objects(self) -> list[InteriorObject]:
         """Get objects on current level."""
-        if self.current_level in self.levels:
-            return self.levels[self.current_level].objects
-        return []
+        level = self.get_current_level()
+        return level.objects if level else []
 
     @property
     def wall_color(self) -> tuple[int, int, int]:
         """Get wall color for current level."""
-        if self.current_level in self.levels:
-            return self.levels[self.current_level].wall_color
-        return (35, 35, 40)
+        level = self.get_current_level()
+        return level.wall_color if level else (35, 35, 40)
 
     @property
     def floor_color(self) -> tuple[int, int, int]:
         """Get floor color for current level."""
-        if self.current_level in self.levels:
-            return self.levels[self.current_level].floor_color
-        return (50, 50, 55)
+        level = self.get_current_level()
+        return level.floor_color if level else (50, 50, 55)
+
+    @property
+    def available_floors(self) -> list[int]:
+        """Floors this building type has (generated or not)."""
+        return BUILDING_FLOORS.get(self.building_type, [FloorLevel.GROUND])
 
     def __post_init__(self):
-        if not self.levels:
-            self._generate_all_levels()
+        if self.delta is not None and not self.items_taken:
+            self.items_taken = list(self.delta.items_taken)
 
     def _generate_all_levels(self):
         """Generate all levels for this building type."""
-        available_floors = BUILDING_FLOORS.get(self.building_type, [FloorLevel.GROUND])
-
-        for floor_level in available_floors:
-            self._generate_level(floor_level)
+        for floor_level in self.available_floors:
+            self.ensure_level(floor_level)
+
+    def ensure_level(self, level: int) -> Optional[InteriorLevel]:
+        """Get a level, generating it on first visit. None if the floor doesn't exist."""
+        level_obj = self.levels.get(level)
+        if level_obj is None and level in self.available_floors:
+            self._generate_level(level)
+            level_obj = self.levels[level]
+            self._apply_delta(level_obj)
+        return level_obj
+
+    def _apply_delta(self, level_obj: InteriorLevel):
+        """Re-apply searched state recorded before eviction."""
+        if self.delta is None:
+            return
+        searched = self.delta.searched.get(level_obj.level, 0)
+        for i, obj in enumerate(level_obj.objects):
+            if searched >> i & 1:
+                obj.searched = True
+                obj.item_id = None
+
+    def to_delta(self) -> InteriorDelta:
+        """Compact record of player changes, for rebuilding after eviction."""
+        delta = InteriorDelta(self.building_type, self.seed,
+                              items_taken=list(self.items_taken))
+        if self.delta is not None:
+            # Keep state for levels that were never regenerated
+            delta.searched.update(self.delta.searched)
+
+        for level_num, level_obj in self.levels.items():
+            searched = _searched_mask(level_obj)
+            delta.searched.pop(level_num, None)
+            if searched:
+                delta.searched[level_num] = searched
+        return delta
 
     def _generate_level(self, level: int):
         """Generate a single level."""
-        random.seed(self.seed + level * 1000)  # Different seed per level
+        # Own generator (different seed per level) - never touches the global
+        # random module, so it's safe on the prefetch thread
+        rng = random.Random(self.seed + level * 1000)
 
         # Get templates and items based on level
         if level == FloorLevel.BASEMENT:
@@ -363,8 +456,8 @@ class BuildingInterior:
         )
 
         # Place 3-5 objects randomly
-        num_objects = random.randint(3, min(5, len(templates)))
-        selected = random.sample(templates, num_objects) if templates else []
+        num_objects = rng.randint(3, min(5, len(templates)))
+        selected = rng.sample(templates, num_objects) if templates else []
 
         # Grid-based placement to avoid overlap
         grid_cols = 3
@@ -375,21 +468,21 @@ class BuildingInterior:
         positions = []
         for row in range(grid_rows):
             for col in range(grid_cols):
-                x = 30 + col * cell_w + random.randint(10, max(11, cell_w - 60))
-                y = 30 + row * cell_h + random.randint(10, max(11, cell_h - 60))
+                x = 30 + col * cell_w + rng.randint(10, max(11, cell_w - 60))
+                y = 30 + row * cell_h + rng.randint(10, max(11, cell_h - 60))
                 positions.append((x, y))
 
-        random.shuffle(positions)
+        rng.shuffle(positions)
 
         for i, template in enumerate(selected):
             pos = positions[i] if i < len(positions) else (
-                random.randint(30, self.width - 80),
-                random.randint(30, self.height - 80)
+                rng.randint(30, self.width - 80),
+                rng.randint(30, self.height - 80)
             )
 
             # Maybe place an item in this object
             item_id = None
-            if available_items and template.get("searchable", True) and random.random() < 0.5:
+            if available_items and template.get("searchable", True) and rng.random() < 0.5:
                 item_id = available_items.pop(0)
                 self.items_placed.append(item_id)
 
@@ -489,7 +582,7 @@ class BuildingInterior:
 
     def get_current_level(self) -> InteriorLevel:
         """Get the current level object."""
-        return self.levels.get(self.current_level)
+        return self.ensure_level(self.current_level)
 
     def get_level_name(self) -> str:
         """Get name of current level."""
@@ -499,13 +592,14 @@ class BuildingInterior:
     def can_change_level(self, direction: int) -> bool:
         """Check if we can go up (+1) or down (-1)."""
         new_level = self.current_level + direction
-        return new_level in self.levels
+        return new_level in self.available_floors
 
     def change_level(self, direction: int) -> bool:
         """Go up (+1) or down (-1). Returns True if successful."""
         new_level = self.current_level + direction
-        if new_level in self.levels:
+        if new_level in self.available_floors:
             self.current_level = new_level
+            self.ensure_level(new_level)
             return True
         return False
 
@@ -520,17 +614,17 @@ class BuildingInterior:
     def get_nearby_object(self, x: int, y: int, radius: int = 50) -> Optional[InteriorObject]:
         """Get nearest interactable object within radius on current level."""
         nearest = None
-        nearest_dist = float('inf')
+        nearest_dist_sq = radius * radius
 
         for obj in self.objects:
             if not obj.interactable:
                 continue
-            rect = obj.get_rect()
-            cx, cy = rect.centerx, rect.centery
-            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-            if dist < radius and dist < nearest_dist:
+            cx = obj.position[0] + obj.size[0] // 2
+            cy = obj.position[1] + obj.size[1] // 2
+            dist_sq = (x - cx) ** 2 + (y - cy) ** 2
+            if dist_sq < nearest_dist_sq:
                 nearest = obj
-                nearest_dist = dist
+                nearest_dist_sq = dist_sq
 
         return nearest
 
@@ -571,126 +665,292 @@ class BuildingInterior:
         if obj.item_id:
             item_id = obj.item_id
             obj.item_id = None  # Remove from object
+            self.items_taken.append(item_id)
             return (message, item_id)
 
         return (f"{message}\n\n{obj.empty_text}", None)
 
     def draw(self, screen: pygame.Surface, offset_x: int = 0, offset_y: int = 0,
-             player_pos: tuple[int, int] = None):
+             player_pos: tuple[int, int] = None,
+             nearby: Optional[InteriorObject] = None):
         """
         Draw the current level.
 
+        The static room comes from the level's baked surface; only the
+        object nearest the player is drawn dynamically (highlight + hint).
+
         Args:
             screen: Surface to draw on
             offset_x, offset_y: Position offset for centering
-            player_pos: Player position for highlighting nearby objects
+            player_pos: Player screen position, used to find the nearby
+                        object when `nearby` isn't given
+            nearby: Object to highlight (reuse get_nearby_object() from update)
         """
         level = self.get_current_level()
         if not level:
             return
 
+        room = self._get_room_surface(level)
+        screen.blit(room, (offset_x - ROOM_PADDING, offset_y - ROOM_PADDING))
+
+        if nearby is None and player_pos:
+            nearby = self.get_nearby_object(player_pos[0] - offset_x,
+                                            player_pos[1] - offset_y)
+        if nearby is None or not nearby.interactable:
+            return
+
+        # Searched objects stay dimmed and get no hint
+        if nearby.searched and not (nearby.is_door or nearby.is_stairs):
+            return
+
+        rect = nearby.get_rect(offset_x, offset_y)
+        color = tuple(min(255, c + 40) for c in nearby.color)
+        self._draw_object_body(screen, nearby, rect, color)
+
+        if nearby.is_door:
+            hint_text = "[E] Exit"
+        elif nearby.is_stairs:
+            hint_text = "[E] Go Up" if nearby.stairs_direction > 0 else "[E] Go Down"
+        else:
+            hint_text = "[E] Search"
+        hint_surf = _get_font(18).render(hint_text, True, (255, 255, 100))
+        hint_x = rect.centerx - hint_surf.get_width() // 2
+        hint_y = rect.top - 18
+        screen.blit(hint_surf, (hint_x, hint_y))
+
+    @staticmethod
+    def _draw_object_body(surface: pygame.Surface, obj: InteriorObject,
+                          rect: pygame.Rect, color: tuple[int, int, int]):
+        """Draw an object's rect, outline and stair arrow."""
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, (80, 80, 85), rect, 2)
+
+        # Draw stair indicator (triangle)
+        if obj.is_stairs:
+            cx, cy = rect.centerx, rect.centery
+            if obj.stairs_direction > 0:  # Up arrow
+                points = [(cx, cy - 10), (cx - 8, cy + 5), (cx + 8, cy + 5)]
+            else:  # Down arrow
+                points = [(cx, cy + 10), (cx - 8, cy - 5), (cx + 8, cy - 5)]
+            pygame.draw.polygon(surface, (200, 200, 210), points)
+
+    def _get_room_surface(self, level: InteriorLevel) -> pygame.Surface:
+        """Get the level's baked room surface, re-baking if a searched flag flipped."""
+        key = _searched_mask(level)
+        if level.room_surface is None or level.room_key != key:
+            level.room_surface = self._bake_room(level)
+            level.room_key = key
+        return level.room_surface
+
+    def _bake_room(self, level: InteriorLevel) -> pygame.Surface:
+        """Render floor, walls, level name, objects and labels (no highlights)."""
+        pad = ROOM_PADDING
+        surface = pygame.Surface((self.width + pad * 2, self.height + pad * 2), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
         # Draw floor (darker for basement)
-        floor_rect = pygame.Rect(offset_x, offset_y, self.width, self.height)
-        pygame.draw.rect(screen, level.floor_color, floor_rect)
+        floor_rect = pygame.Rect(pad, pad, self.width, self.height)
+        pygame.draw.rect(surface, level.floor_color, floor_rect)
 
         # Draw walls (border)
-        pygame.draw.rect(screen, level.wall_color, floor_rect, 8)
+        pygame.draw.rect(surface, level.wall_color, floor_rect, 8)
 
         # Draw level indicator
-        font = pygame.font.Font(None, 20)
-        level_text = level.get_level_name()
-        level_surf = font.render(level_text, True, (150, 150, 160))
-        screen.blit(level_surf, (offset_x + 10, offset_y + 10))
+        level_surf = _get_font(20).render(level.get_level_name(), True, (150, 150, 160))
+        surface.blit(level_surf, (pad + 10, pad + 10))
 
-        # Draw objects
+        name_font = _get_font(18)
         for obj in level.objects:
-            rect = obj.get_rect(offset_x, offset_y)
-
-            # Highlight if player is nearby
-            highlight = False
-            if player_pos and obj.interactable:
-                dist = ((player_pos[0] - rect.centerx) ** 2 +
-                        (player_pos[1] - rect.centery) ** 2) ** 0.5
-                highlight = dist < 50
+            rect = obj.get_rect(pad, pad)
 
-            # Draw object
             color = obj.color
             if obj.searched:
                 # Dim searched objects
                 color = tuple(max(0, c - 30) for c in color)
-            elif highlight:
-                # Brighten highlighted objects
-                color = tuple(min(255, c + 40) for c in color)
-
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.rect(screen, (80, 80, 85), rect, 2)
-
-            # Draw stair indicator (triangle)
-            if obj.is_stairs:
-                cx, cy = rect.centerx, rect.centery
-                if obj.stairs_direction > 0:  # Up arrow
-                    points = [(cx, cy - 10), (cx - 8, cy + 5), (cx + 8, cy + 5)]
-                else:  # Down arrow
-                    points = [(cx, cy + 10), (cx - 8, cy - 5), (cx + 8, cy - 5)]
-                pygame.draw.polygon(screen, (200, 200, 210), points)
+            self._draw_object_body(surface, obj, rect, color)
 
             # Draw object name
-            name_font = pygame.font.Font(None, 18)
             name_surf = name_font.render(obj.name, True, (180, 180, 190))
             name_x = rect.centerx - name_surf.get_width() // 2
             name_y = rect.bottom + 2
-            screen.blit(name_surf, (name_x, name_y))
-
-            # Draw interaction hint if highlighted
-            if highlight:
-                if obj.is_door:
-                    hint_text = "[E] Exit"
-                elif obj.is_stairs:
-                    if obj.stairs_direction > 0:
-                        hint_text = "[E] Go Up"
-                    else:
-                        hint_text = "[E] Go Down"
-                elif obj.searched:
-                    continue  # No hint for already searched objects
-                else:
-                    hint_text = "[E] Search"
-                hint_surf = name_font.render(hint_text, True, (255, 255, 100))
-                hint_x = rect.centerx - hint_surf.get_width() // 2
-                hint_y = rect.top - 18
-                screen.blit(hint_surf, (hint_x, hint_y))
+            surface.blit(name_surf, (name_x, name_y))
+
+        return surface
 
     def reset(self):
         """Reset all objects on all levels to unsearched state."""
         for level in self.levels.values():
             for obj in level.objects:
                 obj.searched = False
+        self.delta = None
+        self.items_taken.clear()
         self.current_level = FloorLevel.GROUND
 
 
+# Pre-generate an interior when the player is this close to its door (px)
+PREFETCH_RADIUS = 200
+
+
 class InteriorManager:
     """
     Manages building interiors across the game.
 
-    Caches generated interiors so they persist during a session.
+    Keeps the most recently visited interiors fully built (bounded LRU).
+    Older ones are reduced to an InteriorDelta and rebuilt from their seed
+    on re-entry, so searched objects stay searched for the whole session
+    while memory stays flat.
+
+    prefetch() builds an interior on a worker thread ahead of time; the
+    finished interior is adopted by get_interior() on entry.
     """
 
-    def __init__(self):
-        self._interiors: dict[int, BuildingInterior] = {}  # building_id -> interior
+    def __init__(self, max_interiors: int = 8, background: bool = True):
+        """
+        Args:
+            max_interiors: Fully built interiors kept before evicting
+            background: Allow prefetching on a worker thread
+        """
+        self.max_interiors = max(1, max_interiors)
+        self.background = background
+        self._interiors: OrderedDict[int, BuildingInterior] = OrderedDict()  # building_id -> interior
+        self._deltas: dict[int, InteriorDelta] = {}  # building_id -> changes of evicted interiors
+
+        # Prefetch state (shared with the worker thread)
+        self._lock = threading.Lock()
+        self._ready: OrderedDict[int, BuildingInterior] = OrderedDict()
+        self._pending: dict[int, int] = {}  # building_id -> generation of its live job
+        self._generation = 0  # Bumped per prefetch, so stale jobs can't land
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self.prefetch_hits = 0
 
     def get_interior(self, building_id: int, building_type: str) -> BuildingInterior:
-        """Get or create interior for a building."""
-        if building_id not in self._interiors:
-            self._interiors[building_id] = BuildingInterior(
-                building_type=building_type,
-                seed=building_id  # Use building ID as seed for consistency
-            )
-        return self._interiors[building_id]
+        """
+        Get or create interior for a building.
+
+        Args:
+            building_id: Stable building id (e.g. SpecialBuilding.building_id),
+                         also used as the generation seed
+        """
+        interior = self._interiors.get(building_id)
+        if interior is not None:
+            self._interiors.move_to_end(building_id)
+            return interior
+
+        with self._lock:
+            interior = self._ready.pop(building_id, None)
+            delta = self._deltas.pop(building_id, None)
+            self._pending.pop(building_id, None)  # An in-flight prefetch is now stale
+        if delta is not None and delta.building_type != building_type:
+            delta = None  # Different building now uses this id
+
+        if interior is not None and interior.building_type == building_type:
+            self.prefetch_hits += 1
+        else:
+            interior = self._build(building_id, building_type, delta)
+        self._interiors[building_id] = interior
+
+        while len(self._interiors) > self.max_interiors:
+            old_id, old_interior = self._interiors.popitem(last=False)
+            old_delta = old_interior.to_delta()
+            if not old_delta.is_empty():
+                self._deltas[old_id] = old_delta
+
+        return interior
+
+    @staticmethod
+    def _build(building_id: int, building_type: str,
+               delta: Optional[InteriorDelta]) -> BuildingInterior:
+        """Create an interior for a building (ground floor generated)."""
+        interior = BuildingInterior(
+            building_type=building_type,
+            seed=building_id,  # Use building ID as seed for consistency
+            delta=delta,
+        )
+        interior.ensure_level(FloorLevel.GROUND)
+        return interior
+
+    def prefetch(self, building_id: int, building_type: str):
+        """Queue an interior for generation on the worker thread."""
+        if not self.background or building_id in self._interiors:
+            return
+        with self._lock:
+            if building_id in self._ready or building_id in self._pending:
+                return
+            self._generation += 1
+            generation = self._generation
+            self._pending[building_id] = generation
+
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._worker_loop,
+                                            name="interior-prefetch", daemon=True)
+            self._worker.start()
+        self._queue.put((building_id, building_type, generation))
+
+    def prefetch_near(self, special_buildings, x: float, y: float,
+                      radius: float = PREFETCH_RADIUS):
+        """Prefetch the interior of any SpecialBuilding whose door is within radius."""
+        building = special_buildings.get_building_near(x, y, radius)
+        if building is not None and building.enterable:
+            self.prefetch(building.building_id, building.building_type.value)
+
+    def _worker_loop(self):
+        """Build queued interiors until a None sentinel arrives."""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                building_id, building_type, generation = job
+                with self._lock:
+                    delta = self._deltas.get(building_id)
+                if delta is not None and delta.building_type != building_type:
+                    delta = None
+                interior = self._build(building_id, building_type, delta)
+                interior._generate_all_levels()
+                with self._lock:
+                    if self._pending.get(building_id) != generation:
+                        continue  # Entered, cleared or prefetched again while generating
+                    del self._pending[building_id]
+                    self._ready[building_id] = interior
+                    # Bounded: dropped entries just get rebuilt on entry
+                    while len(self._ready) > self.max_interiors:
+                        self._ready.popitem(last=False)
+            finally:
+                self._queue.task_done()
+
+    def wait_for_prefetch(self):
+        """Block until every queued prefetch has finished."""
+        self._queue.join()
+
+    def shutdown(self):
+        """Stop the worker thread."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout=1.0)
+        self._worker = None
 
     def reset_to_ground(self, building_id: int):
         """Reset a building interior to ground floor (for when player exits)."""
         if building_id in self._interiors:
             self._interiors[building_id].current_level = FloorLevel.GROUND
 
+    def get_cache_info(self) -> dict:
+        """Get cache sizes (for the debug overlay / tests)."""
+        with self._lock:
+            ready = len(self._ready)
+        return {
+            "interiors": len(self._interiors),
+            "deltas": len(self._deltas),
+            "prefetched": ready,
+            "prefetch_hits": self.prefetch_hits,
+            "max_interiors": self.max_interiors,
+        }
+
     def clear(self):
         """Clear all cached interiors."""
         self._interiors.clear()
+        with self._lock:
+            self._deltas.clear()
+            self._ready.clear()
+            self._pending.clear()
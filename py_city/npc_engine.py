@@ -0,0 +1,202 @@
+"""
+NPC Movement Engine for Py City
+===============================
+
+Structure-of-arrays storage for pedestrian movement. Positions, current
+waypoint, speed and state flags live in one row per NPC; CityNPC is a view
+over its row. Every walking NPC is advanced in a single step() and only the
+rows that reached their waypoint come back for Python-side handling (next
+waypoint, start a pause).
+
+Features:
+- NumPy arrays and a vectorized step when NumPy is installed
+- Plain-list fallback with the same results when it isn't
+- Flags: walking, in jail, in building, frozen (dialogue / corruption)
+- Rows grow by doubling; views stay valid (they index, not hold, arrays)
+
+Pauses between paths are not stored here - waiting NPCs are parked on the
+simulation's TimerScheduler and simply aren't flagged as walking.
+"""
+
+import math
+from typing import Iterable, List, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# Row flags
+WALKING = 0x01      # Has a waypoint to walk to
+IN_JAIL = 0x02
+IN_BUILDING = 0x04
+FROZEN = 0x08       # Held in place this frame
+
+# Distance at which a waypoint counts as reached (px)
+ARRIVE_DISTANCE = 3.0
+
+
+class NPCMovementEngine:
+    """Rows of NPC movement state advanced together."""
+
+    def __init__(self, capacity: int = 64, use_numpy: Optional[bool] = None):
+        """
+        Args:
+            capacity: Initial number of rows
+            use_numpy: Force the NumPy (True) or list (False) backend;
+                None picks NumPy when it is installed
+        """
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.count = 0
+        self.capacity = max(1, capacity)
+        self.owners: List[object] = []  # Row -> CityNPC (or whatever added it)
+
+        if self.use_numpy:
+            self.x = np.zeros(self.capacity)
+            self.y = np.zeros(self.capacity)
+            self.tx = np.zeros(self.capacity)
+            self.ty = np.zeros(self.capacity)
+            self.speed = np.zeros(self.capacity)
+            self.flags = np.zeros(self.capacity, dtype=np.uint8)
+        else:
+            self.x = [0.0] * self.capacity
+            self.y = [0.0] * self.capacity
+            self.tx = [0.0] * self.capacity
+            self.ty = [0.0] * self.capacity
+            self.speed = [0.0] * self.capacity
+            self.flags = [0] * self.capacity
+
+    def _grow(self):
+        """Double the row capacity."""
+        old = self.capacity
+        self.capacity = old * 2
+        if self.use_numpy:
+            for name in ("x", "y", "tx", "ty", "speed", "flags"):
+                array = getattr(self, name)
+                grown = np.zeros(self.capacity, dtype=array.dtype)
+                grown[:old] = array
+                setattr(self, name, grown)
+        else:
+            for name in ("x", "y", "tx", "ty", "speed", "flags"):
+                getattr(self, name).extend([0] * old)
+
+    def add(self, x: float, y: float, speed: float, owner: object = None) -> int:
+        """Add a row. Returns its index."""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.x[row] = x
+        self.y[row] = y
+        self.tx[row] = x
+        self.ty[row] = y
+        self.speed[row] = speed
+        self.flags[row] = 0
+        self.owners.append(owner)
+        self.count += 1
+        return row
+
+    def set_target(self, row: int, x: float, y: float):
+        """Walk a row toward (x, y)."""
+        self.tx[row] = x
+        self.ty[row] = y
+        self.flags[row] |= WALKING
+
+    def stop(self, row: int):
+        """Stop a row walking (keeps its other flags)."""
+        self.flags[row] &= ~WALKING & 0xFF
+
+    def set_flag(self, row: int, flag: int, on: bool):
+        """Set or clear one flag on a row."""
+        if on:
+            self.flags[row] |= flag
+        else:
+            self.flags[row] &= ~flag & 0xFF
+
+    def has_flag(self, row: int, flag: int) -> bool:
+        """Check one flag on a row."""
+        return bool(self.flags[row] & flag)
+
+    def walking_count(self) -> int:
+        """Rows that would move on the next step."""
+        if self.use_numpy:
+            return int(np.count_nonzero(self.flags[:self.count] == WALKING))
+        return sum(1 for f in self.flags[:self.count] if f == WALKING)
+
+    def step(self, dt: float, hold: Iterable[int] = ()) -> List[int]:
+        """
+        Advance every walking row toward its waypoint.
+
+        Rows that are close enough snap onto the waypoint and stop walking
+        instead of moving (same as CityNPC.move).
+
+        Args:
+            dt: Step length in seconds
+            hold: Rows to keep in place this step (frozen)
+
+        Returns:
+            Rows that reached their waypoint, in row order.
+        """
+        hold = [row for row in hold if row is not None and row < self.count]
+        for row in hold:
+            self.flags[row] |= FROZEN
+        try:
+            if self.use_numpy:
+                return self._step_numpy(dt)
+            return self._step_lists(dt)
+        finally:
+            for row in hold:
+                self.flags[row] &= ~FROZEN & 0xFF
+
+    def _step_numpy(self, dt: float) -> List[int]:
+        """Vectorized step over the walking rows."""
+        n = self.count
+        rows = np.flatnonzero(self.flags[:n] == WALKING)
+        if rows.size == 0:
+            return []
+
+        dx = self.tx[rows] - self.x[rows]
+        dy = self.ty[rows] - self.y[rows]
+        dist = np.hypot(dx, dy)
+
+        arrived = dist < ARRIVE_DISTANCE
+        moving = ~arrived
+        if moving.any():
+            moving_rows = rows[moving]
+            scale = self.speed[moving_rows] * (dt * 60) / dist[moving]
+            self.x[moving_rows] += dx[moving] * scale
+            self.y[moving_rows] += dy[moving] * scale
+
+        done = rows[arrived]
+        if done.size:
+            self.x[done] = self.tx[done]
+            self.y[done] = self.ty[done]
+            self.flags[done] &= ~WALKING & 0xFF
+        return done.tolist()
+
+    def _step_lists(self, dt: float) -> List[int]:
+        """Pure-Python step with the same results as the NumPy one."""
+        xs, ys, txs, tys = self.x, self.y, self.tx, self.ty
+        speeds, flags = self.speed, self.flags
+        frame_scale = dt * 60
+        sqrt = math.sqrt
+        done = []
+
+        for row in range(self.count):
+            if flags[row] != WALKING:
+                continue
+            dx = txs[row] - xs[row]
+            dy = tys[row] - ys[row]
+            dist = sqrt(dx * dx + dy * dy)
+            if dist < ARRIVE_DISTANCE:
+                xs[row] = txs[row]
+                ys[row] = tys[row]
+                flags[row] = 0
+                done.append(row)
+            else:
+                scale = speeds[row] * frame_scale / dist
+                xs[row] += dx * scale
+                ys[row] += dy * scale
+        return done
@@ -0,0 +1,256 @@
+"""
+NPC Registry for Py City
+========================
+
+Registers NPCs with the overlay's dialogue system only when they are
+about to matter. Scene start no longer creates a dialogue profile for the
+whole population: an NPC is registered the first time it comes near the
+player or is talked to, and NPCs the player is heading toward are
+prepared in batches on a worker thread ahead of time.
+
+The overlay is only ever touched from the game thread: the worker derives
+each profile's creation arguments (name, backstory, secret) into a ready
+queue, and drain() hands a budgeted number of them to the overlay per
+frame.
+
+Features:
+- Compact NPCProfile per NPC: id, type, spawn index and a seed derived
+  from the session seed; the name is re-derived from the seed and the
+  backstory and secret from the type and stage whenever the overlay
+  needs them
+- Horror stage changes just mark profiles stale; each one re-registers
+  the next time its NPC is approached
+- Prediction: NPCs near the player now or near where the player will be
+  after LOOKAHEAD seconds at the current velocity
+- Batched background preparation, at most create_budget overlay
+  registrations per frame; dialogue-range and inspected NPCs are
+  registered immediately
+"""
+
+import queue
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from rng import RNGService, STREAM_NAMES, get_rng
+
+
+# Register NPCs within this distance of the player (px)
+REGISTER_RADIUS = 200
+
+# Seconds ahead the player's position is predicted
+LOOKAHEAD = 1.0
+
+# Most NPCs sent to the worker per register_ahead() call
+BATCH_SIZE = 8
+
+# Most prepared NPCs handed to the overlay per drain() (i.e. per frame)
+CREATE_BUDGET = 2
+
+
+def dialogue_id(npc) -> str:
+    """Id an NPC is known by in the overlay's dialogue system."""
+    return f"npc_{id(npc)}"
+
+
+@dataclass(slots=True)
+class NPCProfile:
+    """What the registry keeps per NPC; everything else comes from the seed."""
+    npc_id: str
+    npc_type: str
+    index: int  # Spawn order (engine row), stable for the session
+    seed: int
+    name_draw: int = -1  # Name candidate picked (-1 = not named yet)
+    stage: Hashable = None  # Stage the overlay profile was created for (None = not yet)
+
+    def rng(self) -> random.Random:
+        """Fresh random stream for this NPC (same draws every time)."""
+        return random.Random(self.seed)
+
+
+class NPCRegistry:
+    """Lazy, batched registration of NPC profiles with the dialogue system."""
+
+    def __init__(self, prepare: Callable[[NPCProfile, Hashable], Any],
+                 create: Callable[[Any], None],
+                 rng: Optional[RNGService] = None, radius: float = REGISTER_RADIUS,
+                 lookahead: float = LOOKAHEAD, background: bool = True,
+                 create_budget: int = CREATE_BUDGET):
+        """
+        Args:
+            prepare: prepare(profile, stage) -> spec - derive what the overlay
+                     needs (may run on the worker thread, never concurrently)
+            create: create(spec) - register a prepared spec with the overlay
+                    (always called on the game thread)
+            rng: RNG service the per-NPC seeds are derived from
+            radius: Registration distance from the player in pixels
+            lookahead: Seconds ahead the player's position is predicted
+            background: Prepare predicted NPCs on a worker thread
+            create_budget: Most prepared NPCs registered per drain()
+        """
+        self.prepare = prepare
+        self.create = create
+        self.rng = rng or get_rng()
+        self.radius = radius
+        self.lookahead = lookahead
+        self.background = background
+        self.create_budget = create_budget
+        self.stage: Hashable = None
+        self.registrations = 0  # create() calls so far (for tests / debug overlay)
+
+        self._profiles: Dict[str, NPCProfile] = {}
+        self._prepare_lock = threading.Lock()  # Serializes prepare() calls
+        self._lock = threading.Lock()
+        self._queued: Set[str] = set()  # npc_ids prepared or waiting in a batch
+        self._ready: Deque[Tuple[NPCProfile, Hashable, Any]] = deque()  # Prepared, not yet created
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def set_stage(self, stage: Hashable):
+        """Switch horror stage; every profile re-registers on its next approach."""
+        self.stage = stage
+
+    def profile(self, npc) -> NPCProfile:
+        """Get (or create) the profile record for an NPC."""
+        npc_id = dialogue_id(npc)
+        profile = self._profiles.get(npc_id)
+        if profile is None:
+            profile = NPCProfile(npc_id, npc.type, npc.row,
+                                 self.rng.derive_seed(f"{STREAM_NAMES}:{npc.row}"))
+            self._profiles[npc_id] = profile
+        return profile
+
+    def is_registered(self, npc_id: str) -> bool:
+        """Check the overlay knows this NPC for the current stage."""
+        profile = self._profiles.get(npc_id)
+        return profile is not None and profile.stage == self.stage
+
+    def _prepare(self, profile: NPCProfile, stage: Hashable) -> Any:
+        """Derive the overlay arguments for a profile (any thread)."""
+        with self._prepare_lock:
+            return self.prepare(profile, stage)
+
+    def _create(self, profile: NPCProfile, stage: Hashable, spec: Any):
+        """Hand a prepared profile to the overlay (game thread)."""
+        self.create(spec)
+        profile.stage = stage
+        self.registrations += 1
+
+    def ensure(self, npc) -> NPCProfile:
+        """Register an NPC now (it's in dialogue range or being inspected)."""
+        profile = self.profile(npc)
+        stage = self.stage
+        if profile.stage != stage:
+            self._create(profile, stage, self._prepare(profile, stage))
+        return profile
+
+    def drain(self, budget: Optional[int] = None) -> int:
+        """
+        Register prepared NPCs with the overlay, at most `budget`
+        (default create_budget). Call once per frame on the game thread.
+
+        Returns:
+            Number of NPCs registered.
+        """
+        budget = self.create_budget if budget is None else budget
+        created = 0
+        while created < budget:
+            with self._lock:
+                if not self._ready:
+                    break
+                profile, stage, spec = self._ready.popleft()
+                self._queued.discard(profile.npc_id)
+            if stage != self.stage or profile.stage == stage:
+                continue  # Prepared for an old stage, or ensure() got there first
+            self._create(profile, stage, spec)
+            created += 1
+        return created
+
+    def register_ahead(self, npcs: Iterable, x: float, y: float,
+                       vx: float = 0.0, vy: float = 0.0) -> int:
+        """
+        Queue preparation for NPCs the player is about to reach.
+
+        Args:
+            npcs: CityNPCs to consider
+            x, y: Player position
+            vx, vy: Player velocity in px/s
+
+        Returns:
+            Number of NPCs queued (0 with background off).
+        """
+        if not self.background:
+            return 0
+        ahead_x = x + vx * self.lookahead
+        ahead_y = y + vy * self.lookahead
+        radius_sq = self.radius * self.radius
+        profiles = self._profiles
+        stage = self.stage
+
+        batch: List[NPCProfile] = []
+        with self._lock:
+            for npc in npcs:
+                profile = profiles.get(dialogue_id(npc))
+                if profile is not None and (profile.stage == stage or profile.npc_id in self._queued):
+                    continue
+                dx, dy = npc.x - x, npc.y - y
+                if dx * dx + dy * dy >= radius_sq:
+                    dx, dy = npc.x - ahead_x, npc.y - ahead_y
+                    if dx * dx + dy * dy >= radius_sq:
+                        continue
+                profile = profile or self.profile(npc)
+                self._queued.add(profile.npc_id)
+                batch.append(profile)
+                if len(batch) >= BATCH_SIZE:
+                    break
+        if not batch:
+            return 0
+
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._worker_loop,
+                                            name="npc-registry", daemon=True)
+            self._worker.start()
+        self._queue.put((stage, batch))
+        return len(batch)
+
+    def _worker_loop(self):
+        """Prepare queued batches into the ready queue until a None sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                stage, batch = item
+                for profile in batch:
+                    spec = self._prepare(profile, stage)
+                    with self._lock:
+                        self._ready.append((profile, stage, spec))
+            finally:
+                self._queue.task_done()
+
+    def wait_idle(self):
+        """Block until every queued batch has been prepared (tests)."""
+        self._queue.join()
+
+    def get_stats(self) -> dict:
+        """Profile and registration counts (for the debug overlay / tests)."""
+        with self._lock:
+            queued = len(self._queued)
+            ready = len(self._ready)
+        stage = self.stage
+        return {
+            "profiles": len(self._profiles),
+            "registered": sum(1 for p in self._profiles.values() if p.stage == stage),
+            "queued": queued,
+            "ready": ready,
+            "registrations": self.registrations,
+        }
+
+    def shutdown(self):
+        """Stop the worker thread."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout=1.0)
+        self._worker = None
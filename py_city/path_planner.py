@@ -0,0 +1,166 @@
+"""
+Path Planner for Py City
+========================
+
+Queue for NPC path requests so sidewalk searches never pile up on one
+frame. NPCs ask for a path and keep waiting; finished paths are handed back
+a few per frame.
+
+Features:
+- Requests keyed by owner (a newer request replaces an unserved one)
+- Worker threads searching a shared, read-only SidewalkGraph
+- Inline mode (no workers): searches run in collect() on the caller's
+  thread, so headless runs and replays stay deterministic
+- Per-frame budget on how many results are handed back
+- Metrics: queue depth, in-flight searches, request-to-delivery latency
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from city_map import SidewalkGraph
+
+
+Point = Tuple[float, float]
+Path = List[Point]
+
+# Latency samples kept for the rolling metrics
+LATENCY_WINDOW = 256
+
+
+class PathPlanner:
+    """Path-request queue served inline or by a pool of worker threads."""
+
+    def __init__(self, graph: SidewalkGraph, workers: int = 0, apply_budget: int = 64):
+        """
+        Args:
+            graph: Sidewalk graph to search (never modified)
+            workers: Worker threads (0 = search inline in collect())
+            apply_budget: Most results handed back per collect() call
+        """
+        self.graph = graph
+        self.apply_budget = apply_budget
+        self.completed = 0  # Results delivered so far
+
+        self._lock = threading.Lock()
+        self._tickets: Dict[Hashable, int] = {}  # owner -> live request ticket
+        self._next_ticket = 0
+        self._requested_at: Dict[int, float] = {}
+        self._inline: deque = deque()  # (ticket, owner, start, end) in inline mode
+        self._results: deque = deque()  # (ticket, owner, path)
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+        self._queue: Optional[queue.Queue] = None
+        self._workers: List[threading.Thread] = []
+        if workers > 0:
+            self._queue = queue.Queue()
+            for i in range(workers):
+                worker = threading.Thread(target=self._worker_loop,
+                                          name=f"path-planner-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def request(self, owner: Hashable, start: Point, end: Point):
+        """Ask for a path from start to end on behalf of owner."""
+        with self._lock:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            old = self._tickets.get(owner)
+            if old is not None:
+                self._requested_at.pop(old, None)
+            self._tickets[owner] = ticket
+            self._requested_at[ticket] = time.perf_counter()
+
+        job = (ticket, owner, start, end)
+        if self._queue is not None:
+            self._queue.put(job)
+        else:
+            self._inline.append(job)
+
+    def cancel(self, owner: Hashable):
+        """Drop an owner's outstanding request (its result is discarded)."""
+        with self._lock:
+            ticket = self._tickets.pop(owner, None)
+            if ticket is not None:
+                self._requested_at.pop(ticket, None)
+
+    def _search(self, job) -> None:
+        """Run one search and queue its result (stale requests are skipped)."""
+        ticket, owner, start, end = job
+        with self._lock:
+            if self._tickets.get(owner) != ticket:
+                return
+        path = self.graph.find_path(start[0], start[1], end[0], end[1])
+        with self._lock:
+            self._results.append((ticket, owner, path))
+
+    def _worker_loop(self):
+        """Worker thread: search queued requests until a None sentinel arrives."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._search(job)
+
+    def collect(self, budget: Optional[int] = None) -> List[Tuple[Hashable, Path]]:
+        """
+        Hand back finished paths, at most `budget` (default apply_budget).
+
+        Returns:
+            (owner, path) pairs in the order they finished.
+        """
+        budget = self.apply_budget if budget is None else budget
+
+        # Inline mode: do this frame's share of the searches now
+        while self._inline and len(self._results) < budget:
+            self._search(self._inline.popleft())
+
+        delivered = []
+        now = time.perf_counter()
+        with self._lock:
+            while self._results and len(delivered) < budget:
+                ticket, owner, path = self._results.popleft()
+                if self._tickets.get(owner) != ticket:
+                    continue  # Replaced or cancelled while in flight
+                del self._tickets[owner]
+                self._latencies.append(now - self._requested_at.pop(ticket))
+                delivered.append((owner, path))
+        self.completed += len(delivered)
+        return delivered
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until every outstanding search has finished (tests / shutdown)."""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            with self._lock:
+                finished = {ticket for ticket, _, _ in self._results}
+                outstanding = [t for t in self._tickets.values() if t not in finished]
+            if not outstanding or not self._workers:
+                return not outstanding
+            time.sleep(0.001)
+        return False
+
+    def get_stats(self) -> dict:
+        """Queue depth and latency metrics (for the debug overlay / benchmarks)."""
+        with self._lock:
+            outstanding = len(self._tickets)
+            ready = len(self._results)
+            latencies = list(self._latencies)
+        return {
+            "queued": outstanding - ready,
+            "ready": ready,
+            "completed": self.completed,
+            "avg_latency_ms": round(1000.0 * sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "max_latency_ms": round(1000.0 * max(latencies), 2) if latencies else 0.0,
+        }
+
+    def shutdown(self, timeout: float = 1.0):
+        """Stop the worker threads (pending requests are dropped)."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers.clear()
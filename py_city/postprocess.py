@@ -0,0 +1,163 @@
+"""
+Post-Processing Compositor for Py City
+======================================
+
+Owns the full-screen overlay surfaces (night darkness, rain tint, corruption
+scan lines) and the glitch stamps, so none of them are allocated per frame.
+
+Features:
+- Pooled surfaces, reused frame to frame
+- Darkness and scan lines folded into one cached layer (one full-screen
+  blit instead of a fill and ~150 line blits); the rain tint, drawn over
+  the sprites, is a layer of its own
+- Layers rebuilt only when their parameters (tint, alpha, spacing, size)
+  change; the last three are kept, so flickering scan lines don't rebuild
+- Glitch stamps pooled per (color, alpha step), blitted with a sub-rect
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import pygame
+
+
+Color = Tuple[int, int, int]
+Tint = Tuple[int, int, int, int]  # RGBA
+
+# Largest glitch rect CorruptionManager creates (stamps are cut to size)
+GLITCH_STAMP_SIZE = (100, 60)
+
+# Glitch alpha is quantized to this step so fading glitches share stamps
+GLITCH_ALPHA_STEP = 16
+
+# Cached overlay layers kept (darkness with and without scan lines, which
+# come and go frame to frame, plus the rain tint)
+LAYER_POOL_SIZE = 3
+
+
+def combine_tints(tints: Sequence[Optional[Tint]]) -> Optional[Tint]:
+    """
+    Fold stacked RGBA tints into one with the same result ("over" operator).
+
+    Blitting the combined tint once matches blitting each tint in order.
+
+    Returns:
+        Combined RGBA tint, or None if every tint is empty.
+    """
+    out_r = out_g = out_b = 0.0  # Premultiplied color
+    out_a = 0.0
+    for tint in tints:
+        if not tint or tint[3] <= 0:
+            continue
+        a = tint[3] / 255.0
+        keep = 1.0 - a
+        out_r = tint[0] * a + out_r * keep
+        out_g = tint[1] * a + out_g * keep
+        out_b = tint[2] * a + out_b * keep
+        out_a = a + out_a * keep
+
+    if out_a <= 0.0:
+        return None
+    return (
+        int(round(out_r / out_a)),
+        int(round(out_g / out_a)),
+        int(round(out_b / out_a)),
+        int(round(out_a * 255)),
+    )
+
+
+class PostProcessor:
+    """Cached full-screen overlays and pooled glitch stamps."""
+
+    def __init__(self):
+        self._layers: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._stamps: Dict[Tuple[Color, int], pygame.Surface] = {}
+        self.rebuilds = 0  # Layer rebuilds (for tests / debug overlay)
+
+    def draw_tint(self, screen: pygame.Surface, tints: Sequence[Optional[Tint]],
+                  scan_alpha: int = 0, scan_spacing: int = 4):
+        """
+        Blit the combined overlay layer: tints plus corruption scan lines.
+
+        Args:
+            tints: RGBA tints in the order they would have been stacked
+                (e.g. night darkness, rain tint)
+            scan_alpha: Alpha of the black scan lines (0 for none)
+            scan_spacing: Rows between scan lines
+        """
+        tint = combine_tints(tints)
+        if tint is None and scan_alpha <= 0:
+            return
+
+        size = (screen.get_width(), screen.get_height())
+        key = (size, tint, max(0, scan_alpha), scan_spacing)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._build_layer(size, tint, key[2], scan_spacing)
+            self._layers[key] = layer
+            if len(self._layers) > LAYER_POOL_SIZE:
+                self._layers.popitem(last=False)
+        else:
+            self._layers.move_to_end(key)
+
+        screen.blit(layer, (0, 0))
+
+    def _build_layer(self, size: Tuple[int, int], tint: Optional[Tint],
+                     scan_alpha: int, scan_spacing: int) -> pygame.Surface:
+        """Draw a tint fill with scan-line rows composited over it."""
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        layer.fill(tint or (0, 0, 0, 0))
+        if scan_alpha > 0:
+            line = combine_tints([tint, (0, 0, 0, scan_alpha)])
+            width, height = size
+            for y in range(0, height, scan_spacing):
+                pygame.draw.line(layer, line, (0, y), (width - 1, y))
+        self.rebuilds += 1
+        return layer
+
+    def glitch_stamp(self, color: Color, alpha: int) -> pygame.Surface:
+        """
+        Get the pooled stamp for a glitch color and alpha.
+
+        Stamps are GLITCH_STAMP_SIZE; blit with an area rect to cut to size.
+        """
+        step = max(GLITCH_ALPHA_STEP, min(255, alpha // GLITCH_ALPHA_STEP * GLITCH_ALPHA_STEP))
+        key = (tuple(color[:3]), step)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = pygame.Surface(GLITCH_STAMP_SIZE, pygame.SRCALPHA)
+            stamp.fill((key[0][0], key[0][1], key[0][2], step))
+            self._stamps[key] = stamp
+        return stamp
+
+    def draw_glitch(self, screen: pygame.Surface, rect: pygame.Rect,
+                    color: Color, alpha: int):
+        """Blit a glitch rect from the stamp pool."""
+        stamp = self.glitch_stamp(color, alpha)
+        if rect.width <= GLITCH_STAMP_SIZE[0] and rect.height <= GLITCH_STAMP_SIZE[1]:
+            screen.blit(stamp, (rect.x, rect.y), pygame.Rect(0, 0, rect.width, rect.height))
+        else:
+            # Oversized glitch: tile the stamp
+            for y in range(0, rect.height, GLITCH_STAMP_SIZE[1]):
+                for x in range(0, rect.width, GLITCH_STAMP_SIZE[0]):
+                    w = min(GLITCH_STAMP_SIZE[0], rect.width - x)
+                    h = min(GLITCH_STAMP_SIZE[1], rect.height - y)
+                    screen.blit(stamp, (rect.x + x, rect.y + y), pygame.Rect(0, 0, w, h))
+
+
+# Global post-processor instance
+_post_processor: Optional[PostProcessor] = None
+
+
+def get_post_processor() -> PostProcessor:
+    """Get the global post-processor."""
+    global _post_processor
+    if _post_processor is None:
+        _post_processor = PostProcessor()
+    return _post_processor
+
+
+def reset_post_processor():
+    """Drop the global post-processor and its pooled surfaces (display mode change)."""
+    global _post_processor
+    _post_processor = None
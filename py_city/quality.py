@@ -0,0 +1,139 @@
+"""
+Adaptive Quality Governor for Py City
+=====================================
+
+Watches a rolling window of frame times and steps the visual quality up or
+down so heavy scenes (night rain, many anomalies, lots of traffic) degrade
+gracefully instead of stuttering.
+
+Tiers scale:
+- Rain particle count
+- Glow ring count (anomaly markers, exit portal)
+- Animal and vehicle draw distance
+- Scan-line frequency (corruption effect)
+- NPC shadows
+
+Hysteresis: a tier drops only when the rolling average stays over budget,
+rises only when it is comfortably under budget, and every change is
+followed by a hold period so the governor doesn't flap between tiers.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    """Visual settings for one quality level."""
+    name: str
+    rain_drop_scale: float       # Fraction of WeatherSystem's max raindrops
+    glow_rings: int              # Rings drawn around anomalies / exit portal
+    draw_distance: Optional[int]  # Max px from camera center for animals/vehicles (None = all)
+    scan_line_spacing: int       # Rows between corruption scan lines
+    npc_shadows: bool            # Draw shadows under NPCs
+
+
+QUALITY_TIERS: List[QualityTier] = [
+    QualityTier("High", rain_drop_scale=1.0, glow_rings=3, draw_distance=None,
+                scan_line_spacing=4, npc_shadows=True),
+    QualityTier("Medium", rain_drop_scale=0.6, glow_rings=2, draw_distance=900,
+                scan_line_spacing=6, npc_shadows=True),
+    QualityTier("Low", rain_drop_scale=0.35, glow_rings=1, draw_distance=700,
+                scan_line_spacing=8, npc_shadows=False),
+    QualityTier("Minimal", rain_drop_scale=0.15, glow_rings=1, draw_distance=550,
+                scan_line_spacing=12, npc_shadows=False),
+]
+
+
+class QualityGovernor:
+    """Picks a quality tier from a rolling frame-time average."""
+
+    def __init__(self, target_fps: int = 60, window: int = 60,
+                 downgrade_ratio: float = 1.15, upgrade_ratio: float = 0.75,
+                 downgrade_hold: int = 60, upgrade_hold: int = 240,
+                 tiers: List[QualityTier] = None, start_tier: int = 0):
+        """
+        Args:
+            target_fps: Frame rate the budget is derived from
+            window: Frames in the rolling average
+            downgrade_ratio: Drop a tier when average > budget * ratio
+            upgrade_ratio: Raise a tier when average < budget * ratio
+            downgrade_hold: Frames after a change before dropping again
+            upgrade_hold: Frames after a change before raising again
+            tiers: Tier list, best first (defaults to QUALITY_TIERS)
+            start_tier: Index of the initial tier
+        """
+        self.tiers = tiers or QUALITY_TIERS
+        self.tier_index = max(0, min(len(self.tiers) - 1, start_tier))
+        self.budget = 1.0 / target_fps
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.downgrade_hold = downgrade_hold
+        self.upgrade_hold = upgrade_hold
+        self.enabled = True
+
+        self._samples = deque(maxlen=window)
+        self._sum = 0.0
+        self._frames_since_change = 0
+        self.tier_changes = 0
+
+    @property
+    def tier(self) -> QualityTier:
+        """Current quality tier."""
+        return self.tiers[self.tier_index]
+
+    @property
+    def average_frame_time(self) -> float:
+        """Rolling average frame time in seconds."""
+        if not self._samples:
+            return 0.0
+        return self._sum / len(self._samples)
+
+    def record_frame(self, frame_time: float) -> Optional[str]:
+        """
+        Add a frame's work time (seconds) and adjust the tier if needed.
+
+        Returns:
+            Name of the new tier if it changed, else None.
+        """
+        if len(self._samples) == self._samples.maxlen:
+            self._sum -= self._samples[0]
+        self._samples.append(frame_time)
+        self._sum += frame_time
+        self._frames_since_change += 1
+
+        # Only judge a full window
+        if not self.enabled or len(self._samples) < self._samples.maxlen:
+            return None
+
+        average = self.average_frame_time
+        if (average > self.budget * self.downgrade_ratio and
+                self.tier_index < len(self.tiers) - 1 and
+                self._frames_since_change >= self.downgrade_hold):
+            return self._set_tier(self.tier_index + 1)
+
+        if (average < self.budget * self.upgrade_ratio and
+                self.tier_index > 0 and
+                self._frames_since_change >= self.upgrade_hold):
+            return self._set_tier(self.tier_index - 1)
+
+        return None
+
+    def _set_tier(self, index: int) -> str:
+        """Switch tier and restart the window and hold count."""
+        self.tier_index = index
+        self._samples.clear()
+        self._sum = 0.0
+        self._frames_since_change = 0
+        self.tier_changes += 1
+        return self.tier.name
+
+    def get_debug_info(self) -> dict:
+        """Get debug info for the overlay."""
+        return {
+            "tier": self.tier.name,
+            "avg_ms": round(self.average_frame_time * 1000.0, 2),
+            "budget_ms": round(self.budget * 1000.0, 2),
+            "changes": self.tier_changes,
+        }
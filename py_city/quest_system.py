@@ -325,17 +325,78 @@ class QuestManager:
     - GameLoopManager for phase-based unlocks
     - NarratorQueue for quest delivery
     - PlotStateManager for horror integration
+
+    Quest definitions are compiled into indexes (event -> tracked quests,
+    quest -> dependents, phase -> gated quests) so events, completions and
+    phase changes only touch the quests they affect. Any number of quests
+    can be tracked at once. High-frequency events can be queued with
+    queue_event() and dispatched once per frame by flush_events().
     """
 
     def __init__(self):
         # Create copies of quests for this session
         self.quests = {q.id: Quest(**q.__dict__) for q in ALL_QUESTS}
-        self.active_quest_id: Optional[str] = None
+        self.active_quest_id: Optional[str] = None  # Focused quest (shown in UI)
         self.completed_quests: list[str] = []
+        self.tracked: dict[str, Quest] = {}  # Every ACTIVE quest, in start order
 
         # Callbacks
         self.on_quest_complete: Optional[Callable[[Quest], None]] = None
         self.on_quest_available: Optional[Callable[[Quest], None]] = None
+        self.on_change: Optional[Callable[[], None]] = None  # Any quest state changed (UI refresh)
+
+        self._completed: set[str] = set()
+        self._pending_events: dict[str, int] = {}  # Coalesced counts for flush_events()
+        self._save_snapshot: Optional[dict] = None  # Cached save(); None when stale
+        self._compile_indexes()
+
+    def _compile_indexes(self):
+        """Build the static dependency/phase indexes and the event index."""
+        self._dependents: dict[str, list[Quest]] = {}
+        self._phase_gated: dict[str, list[Quest]] = {}
+        self._ungated: list[Quest] = []  # No phase requirement
+        for quest in self.quests.values():
+            if quest.requires_quest:
+                self._dependents.setdefault(quest.requires_quest, []).append(quest)
+            if quest.requires_phase:
+                self._phase_gated.setdefault(quest.requires_phase, []).append(quest)
+            else:
+                self._ungated.append(quest)
+
+        # event type -> {quest_id: quest} for tracked quests only
+        self._listeners: dict[str, dict[str, Quest]] = {}
+        for quest in self.tracked.values():
+            self._index_listener(quest)
+
+    @staticmethod
+    def _event_keys(quest: Quest) -> set[str]:
+        """Event types that progress a quest (see Quest.check_objective)."""
+        obj_type, _, _ = quest.objective.partition(":")
+        return {obj_type, quest.objective}
+
+    def _index_listener(self, quest: Quest):
+        for key in self._event_keys(quest):
+            self._listeners.setdefault(key, {})[quest.id] = quest
+
+    def _unindex_listener(self, quest: Quest):
+        for key in self._event_keys(quest):
+            listeners = self._listeners.get(key)
+            if listeners is not None:
+                listeners.pop(quest.id, None)
+                if not listeners:
+                    del self._listeners[key]
+
+    def _changed(self):
+        """Drop the cached save snapshot and notify listeners."""
+        self._save_snapshot = None
+        if self.on_change:
+            self.on_change()
+
+    def _make_available(self, quest: Quest):
+        quest.status = QuestStatus.AVAILABLE
+        self._changed()
+        if self.on_quest_available:
+            self.on_quest_available(quest)
 
     def update_phase(self, phase_name: str):
         """
@@ -343,22 +404,20 @@ class QuestManager:
 
         Called when GamePhase changes.
         """
-        for quest in self.quests.values():
+        # Only quests gated on this phase (or not gated at all) can unlock
+        gated = self._phase_gated.get(phase_name, [])
+        for quest in self._ungated + gated:
             if quest.status == QuestStatus.LOCKED:
-                # Check if phase requirement met
-                if quest.requires_phase and quest.requires_phase != phase_name:
-                    continue
                 # Check if prerequisite quest complete
-                if quest.requires_quest and quest.requires_quest not in self.completed_quests:
+                if quest.requires_quest and quest.requires_quest not in self._completed:
                     continue
                 # Quest becomes available
-                quest.status = QuestStatus.AVAILABLE
-                if self.on_quest_available:
-                    self.on_quest_available(quest)
+                self._make_available(quest)
 
     def start_quest(self, quest_id: str) -> Optional[Quest]:
         """
-        Start a quest by ID.
+        Start a quest by ID. It is tracked alongside any already active quests
+        and becomes the focused quest.
 
         Returns the quest if started, None if not available.
         """
@@ -368,6 +427,9 @@ class QuestManager:
 
         quest.status = QuestStatus.ACTIVE
         self.active_quest_id = quest_id
+        self.tracked[quest_id] = quest
+        self._changed()
+        self._index_listener(quest)
         return quest
 
     def start_next_available(self) -> Optional[Quest]:
@@ -387,32 +449,70 @@ class QuestManager:
             return self.quests.get(self.active_quest_id)
         return None
 
+    def get_tracked_quests(self) -> list[Quest]:
+        """Get every quest currently in progress."""
+        return list(self.tracked.values())
+
     def on_event(self, event_type: str, count: int = 1) -> Optional[Quest]:
         """
-        Process a game event for quest progress.
+        Process a game event for quest progress immediately.
 
-        Returns completed quest if any.
+        Returns completed quest if any (the first, if several completed).
         """
-        active = self.get_active_quest()
-        if active and active.check_objective(event_type, count):
-            # Quest completed
-            self.completed_quests.append(active.id)
-            self.active_quest_id = None
-
-            # Unlock dependent quests
-            for quest in self.quests.values():
-                if quest.status == QuestStatus.LOCKED:
-                    if quest.requires_quest == active.id:
-                        quest.status = QuestStatus.AVAILABLE
-                        if self.on_quest_available:
-                            self.on_quest_available(quest)
+        completed = self._dispatch(event_type, count)
+        return completed[0] if completed else None
 
-            if self.on_quest_complete:
-                self.on_quest_complete(active)
+    def queue_event(self, event_type: str, count: int = 1):
+        """Queue an event for the next flush_events() (counts are summed per type)."""
+        self._pending_events[event_type] = self._pending_events.get(event_type, 0) + count
 
-            return active
+    def flush_events(self) -> list[Quest]:
+        """
+        Dispatch queued events, once per event type. Call once per frame.
 
-        return None
+        Returns quests completed by this batch.
+        """
+        if not self._pending_events:
+            return []
+        pending = self._pending_events
+        self._pending_events = {}
+
+        completed = []
+        for event_type, count in pending.items():
+            completed.extend(self._dispatch(event_type, count))
+        return completed
+
+    def _dispatch(self, event_type: str, count: int) -> list[Quest]:
+        """Advance the tracked quests listening for an event type."""
+        listeners = self._listeners.get(event_type)
+        if not listeners:
+            return []
+
+        self._changed()  # Progress counts change
+        completed = []
+        for quest in list(listeners.values()):
+            if quest.check_objective(event_type, count):
+                self._complete(quest)
+                completed.append(quest)
+        return completed
+
+    def _complete(self, quest: Quest):
+        """Record a completion, unlock dependents and notify."""
+        self.completed_quests.append(quest.id)
+        self._completed.add(quest.id)
+        self.tracked.pop(quest.id, None)
+        self._unindex_listener(quest)
+        if self.active_quest_id == quest.id:
+            # Focus the most recently started quest still in progress
+            self.active_quest_id = next(reversed(self.tracked), None)
+
+        # Unlock dependent quests
+        for dependent in self._dependents.get(quest.id, []):
+            if dependent.status == QuestStatus.LOCKED:
+                self._make_available(dependent)
+
+        if self.on_quest_complete:
+            self.on_quest_complete(quest)
 
     def get_available_quests(self) -> list[Quest]:
         """Get all available quests."""
@@ -426,16 +526,23 @@ class QuestManager:
         return ""
 
     def save(self) -> dict:
-        """Serialize for save game."""
-        return {
-            "completed": self.completed_quests,
-            "active": self.active_quest_id,
-            "progress": {
-                qid: {"status": q.status.name, "count": q.current_count}
-                for qid, q in self.quests.items()
-                if q.status != QuestStatus.LOCKED
+        """
+        Serialize for save game.
+
+        The snapshot is cached until quest state changes, and treated as
+        immutable so it can be handed to the background SaveService.
+        """
+        if self._save_snapshot is None:
+            self._save_snapshot = {
+                "completed": list(self.completed_quests),
+                "active": self.active_quest_id,
+                "progress": {
+                    qid: {"status": q.status.name, "count": q.current_count}
+                    for qid, q in self.quests.items()
+                    if q.status != QuestStatus.LOCKED
+                }
             }
-        }
+        return self._save_snapshot
 
     def load(self, data: dict):
         """Load from save game."""
@@ -447,6 +554,13 @@ class QuestManager:
                 self.quests[qid].status = QuestStatus[progress["status"]]
                 self.quests[qid].current_count = progress["count"]
 
+        self._completed = set(self.completed_quests)
+        self.tracked = {qid: q for qid, q in self.quests.items()
+                        if q.status == QuestStatus.ACTIVE}
+        self._pending_events.clear()
+        self._changed()
+        self._compile_indexes()
+
 
 # Legacy compatibility - original simple quests
 class LegacyQuest:
@@ -0,0 +1,390 @@
+"""
+Input Recording and Replay for Py City
+======================================
+
+Records what the player did each frame - frame time, pressed actions, held
+keys, click-to-move targets, the movement direction and the actions that
+landed (attacks, conversations, who stayed frozen in dialogue, quest events
+raised by the front-end, staying on at the exit menu) - into a
+compact binary file, then replays it into a headless CitySimulation. Since
+the simulation is seeded from the recorded master seed, the same recording
+produces the same frames on every build, so frame-time profiles from two
+builds can be compared directly.
+
+Features:
+- Compact zlib-compressed binary format (header + fixed-size frames)
+- Records raw dt, action bitmask, held game keys, click targets, movement
+- Player actions replay through the same CitySimulation methods run() uses
+- Headless replay with per-section profiling (reuses CitySimulation.profile)
+- Profile output compatible with the benchmark baseline comparison
+
+File layout (little-endian, body zlib-compressed):
+    header: magic "PCRP", version u16, master seed u64, frame count u32,
+            world w/h, block w/h, road, sidewalk (6 x u16),
+            criminals, police, civilians, animals (4 x u16)
+    frame:  raw dt f64, input mask u32, flags u8, move dx/dy (2 x f32),
+            frozen NPC row i16 (-1 for none)
+            [+ click x/y (2 x f32) when FLAG_CLICK is set]
+            [+ quest event mask u8 when FLAG_QUEST is set]
+
+Usage:
+    PY_CITY_RECORD=session.pcr  (while playing, records via run_wrapped)
+    python replay.py session.pcr --output profile.json
+    python replay.py session.pcr --baseline old_profile.json
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+PY_CITY_DIR = os.path.dirname(os.path.abspath(__file__))
+if PY_CITY_DIR not in sys.path:
+    sys.path.insert(0, PY_CITY_DIR)
+
+from city_map import CityConfig
+
+
+# Environment variable that turns on recording in run_wrapped.run()
+RECORD_ENV_VAR = "PY_CITY_RECORD"
+
+MAGIC = b"PCRP"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHQI6H4H")
+_FRAME = struct.Struct("<dIBffh")
+_CLICK = struct.Struct("<ff")
+_QUEST = struct.Struct("<B")
+
+# Input bits: controls.Action names first, then raw game keys
+RECORDED_ACTIONS = [
+    "PAUSE", "INSTRUCTIONS", "MUTE", "STATUS", "SKIP_PHASE",
+    "INTERACT", "ATTACK", "SECONDARY", "MOVE_LEFT", "MOVE_RIGHT",
+]
+RECORDED_KEYS = ["g", "n", "h", "j", "b"]
+INPUT_BITS = {name: 1 << i for i, name in enumerate(RECORDED_ACTIONS + RECORDED_KEYS)}
+
+# Quest events only the front-end sees (building interiors, the exit menu)
+RECORDED_QUEST_EVENTS = [
+    "building_entered", "found_hospital", "found_police_station",
+    "item_found", "exit_used_or_stayed",
+]
+QUEST_EVENT_BITS = {name: 1 << i for i, name in enumerate(RECORDED_QUEST_EVENTS)}
+
+# Frame flags
+FLAG_CLICK = 0x01     # A click-to-move target follows the frame
+FLAG_INTERIOR = 0x02  # Player was inside a building (move is interior-space)
+FLAG_PAUSED = 0x04    # A menu was open after ESC handling; the world didn't update
+FLAG_STEER = 0x08     # Move came from the keyboard (builds corruption drift)
+FLAG_ATTACK = 0x10    # The player attacked
+FLAG_TALK = 0x20      # The player started a conversation
+FLAG_QUEST = 0x40     # A quest event mask follows the frame
+FLAG_STAY = 0x80      # The player chose "Keep Exploring" at the exit menu
+
+
+@dataclass
+class ReplayFrame:
+    """One recorded frame of input."""
+    raw_dt: float
+    inputs: int = 0
+    flags: int = 0
+    move: Tuple[float, float] = (0.0, 0.0)
+    click: Optional[Tuple[float, float]] = None
+    frozen: int = -1  # NPC engine row held in dialogue, -1 for none
+    quest_events: Tuple[str, ...] = ()
+
+    def has(self, name: str) -> bool:
+        """Check whether an action or key was recorded this frame."""
+        return bool(self.inputs & INPUT_BITS[name])
+
+
+@dataclass
+class Recording:
+    """A loaded recording: how to rebuild the world plus its frames."""
+    seed: int
+    config: CityConfig
+    npc_counts: Tuple[int, int, int, int]  # criminals, police, civilians, animals
+    frames: List[ReplayFrame]
+
+
+def encode_inputs(actions=(), keys=()) -> int:
+    """Pack action and key names into an input bitmask."""
+    mask = 0
+    for name in list(actions) + list(keys):
+        mask |= INPUT_BITS.get(name, 0)
+    return mask
+
+
+class InputRecorder:
+    """Appends packed frames to an in-memory buffer; save() writes the file."""
+
+    def __init__(self, seed: int, config: CityConfig,
+                 npc_counts: Tuple[int, int, int, int] = (6, 5, 20, 25)):
+        self.seed = seed
+        self.config = config
+        self.npc_counts = npc_counts
+        self.frame_count = 0
+        self._buffer = bytearray()
+
+    def record_frame(self, raw_dt: float, inputs: int = 0,
+                     move: Tuple[float, float] = (0.0, 0.0),
+                     click: Optional[Tuple[float, float]] = None,
+                     interior: bool = False, paused: bool = False,
+                     steering: bool = False, attacked: bool = False,
+                     talked: bool = False, frozen: int = -1,
+                     quest_events: Sequence[str] = (),
+                     kept_exploring: bool = False):
+        """
+        Record one frame of input.
+
+        Args:
+            move: Movement direction before corruption drift
+            interior: Player was inside a building when moving
+            paused: A menu was open after the ESC handling
+            steering: move came from the keyboard
+            attacked: An attack was performed
+            talked: A conversation was started
+            frozen: NPC engine row held in dialogue (-1 for none)
+            quest_events: Front-end quest events (RECORDED_QUEST_EVENTS)
+            kept_exploring: "Keep Exploring" was chosen at the exit menu
+        """
+        flags = 0
+        if click is not None:
+            flags |= FLAG_CLICK
+        if interior:
+            flags |= FLAG_INTERIOR
+        if paused:
+            flags |= FLAG_PAUSED
+        if steering:
+            flags |= FLAG_STEER
+        if attacked:
+            flags |= FLAG_ATTACK
+        if talked:
+            flags |= FLAG_TALK
+        if kept_exploring:
+            flags |= FLAG_STAY
+        quest_mask = 0
+        for name in quest_events:
+            quest_mask |= QUEST_EVENT_BITS.get(name, 0)
+        if quest_mask:
+            flags |= FLAG_QUEST
+
+        self._buffer += _FRAME.pack(raw_dt, inputs, flags, move[0], move[1], frozen)
+        if click is not None:
+            self._buffer += _CLICK.pack(click[0], click[1])
+        if quest_mask:
+            self._buffer += _QUEST.pack(quest_mask)
+        self.frame_count += 1
+
+    def save(self, path: str):
+        """Write the recording (header + compressed frames)."""
+        cfg = self.config
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.seed, self.frame_count,
+            cfg.world_width, cfg.world_height, cfg.block_width,
+            cfg.block_height, cfg.road_width, cfg.sidewalk_width,
+            *self.npc_counts
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(bytes(self._buffer), 6))
+
+
+def load_recording(path: str) -> Recording:
+    """Load a recording written by InputRecorder.save()."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    fields = _HEADER.unpack_from(data, 0)
+    magic, version, seed, frame_count = fields[:4]
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a Py City recording")
+    if version != VERSION:
+        raise ValueError(f"Unsupported recording version {version}")
+
+    world_w, world_h, block_w, block_h, road_w, sidewalk_w = fields[4:10]
+    config = CityConfig(
+        world_width=world_w, world_height=world_h,
+        block_width=block_w, block_height=block_h,
+        road_width=road_w, sidewalk_width=sidewalk_w,
+    )
+
+    body = zlib.decompress(data[_HEADER.size:])
+    frames = []
+    offset = 0
+    for _ in range(frame_count):
+        raw_dt, inputs, flags, mx, my, frozen = _FRAME.unpack_from(body, offset)
+        offset += _FRAME.size
+        click = None
+        if flags & FLAG_CLICK:
+            click = _CLICK.unpack_from(body, offset)
+            offset += _CLICK.size
+        quest_events = ()
+        if flags & FLAG_QUEST:
+            (quest_mask,) = _QUEST.unpack_from(body, offset)
+            offset += _QUEST.size
+            quest_events = tuple(name for name in RECORDED_QUEST_EVENTS
+                                 if quest_mask & QUEST_EVENT_BITS[name])
+        frames.append(ReplayFrame(raw_dt, inputs, flags, (mx, my), click,
+                                  frozen, quest_events))
+
+    return Recording(seed, config, tuple(fields[10:14]), frames)
+
+
+def replay(recording: Recording, profile: bool = True) -> Tuple[object, List[float]]:
+    """
+    Replay a recording into a fresh headless CitySimulation.
+
+    Applies frame timing, escape attempts, alignment changes, crime
+    interventions, phase skips, conversations, attacks, staying on at the
+    exit menu and movement through the same CitySimulation methods run()
+    calls, so police pursuit, jail and corruption drift play out as they did
+    live. Menus, the status panel and
+    building interiors are front-end only; their effect on the world is
+    captured by the frame flags and recorded quest events.
+
+    Returns:
+        (simulation, per-frame wall-clock times in seconds)
+    """
+    from simulation import CitySimulation
+
+    criminals, police, civilians, animals = recording.npc_counts
+    sim = CitySimulation(
+        recording.config,
+        seed=recording.seed,
+        criminal_count=criminals,
+        police_count=police,
+        civilian_count=civilians,
+        animal_count=animals,
+    )
+    if profile:
+        sim.profile = {}
+    sim.start()
+
+    player = sim.player
+    owners = sim.npc_engine.owners
+    held = set()
+    frame_times = []
+    perf = time.perf_counter
+
+    for frame in recording.frames:
+        start = perf()
+        dt = sim.begin_frame(frame.raw_dt)
+
+        # Escape attempts draw from the corruption stream, paused or not
+        if frame.has("PAUSE"):
+            sim.corruption.should_block_escape()
+        for name in frame.quest_events:
+            sim.quests.queue_event(name)
+        if frame.flags & FLAG_STAY:
+            sim.keep_exploring()
+
+        if not frame.flags & FLAG_PAUSED:
+            # Edge-detect held keys the same way run() does (only while
+            # the game takes input)
+            pressed = {k for k in RECORDED_KEYS if frame.has(k)}
+            just_down = pressed - held
+            held = pressed
+
+            if "g" in just_down:
+                sim.set_alignment("good")
+            if "n" in just_down:
+                sim.set_alignment("neutral")
+            if frame.has("SKIP_PHASE"):
+                sim.skip_phase()
+            if "h" in just_down:
+                sim.intervene(True)
+            if "j" in just_down:
+                sim.intervene(False)
+            if frame.flags & FLAG_TALK:
+                npc = player.interact(sim.all_npcs)
+                if npc:
+                    sim.talk_to(npc)
+            if frame.flags & FLAG_ATTACK:
+                sim.attack()
+
+            player_moving = sim.check_player_moved()
+            if not frame.flags & FLAG_INTERIOR:
+                sim.move_player(frame.move[0], frame.move[1], dt,
+                                steering=bool(frame.flags & FLAG_STEER))
+
+            frozen_npc = owners[frame.frozen] if frame.frozen >= 0 else None
+            sim.step(dt, player_moving=player_moving, frozen_npc=frozen_npc)
+
+        frame_times.append(perf() - start)
+
+    return sim, frame_times
+
+
+def profile_recording(path: str) -> dict:
+    """
+    Replay a recording and summarize its frame-time profile.
+
+    The result uses the benchmark results layout, so it can be saved and
+    compared with benchmark.compare_to_baseline().
+    """
+    from benchmark import _summarize
+
+    recording = load_recording(path)
+    sim, frame_times = replay(recording)
+    return {
+        "recording": os.path.basename(path),
+        "seed": recording.seed,
+        "results": {
+            "replay": {
+                "frames": len(frame_times),
+                "frame": _summarize(frame_times),
+                "subsystems": {name: _summarize(s) for name, s in sim.profile.items()},
+                "final_player": [round(sim.player.x, 2), round(sim.player.y, 2)],
+            }
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point. Returns a process exit code."""
+    # Replays are always headless (set before pygame is first imported)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from benchmark import compare_to_baseline
+
+    parser = argparse.ArgumentParser(description="Replay a Py City input recording")
+    parser.add_argument("recording", help="Recording file (.pcr)")
+    parser.add_argument("--output", help="Write the frame-time profile as JSON")
+    parser.add_argument("--baseline", help="Profile from another build to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing (fraction)")
+    args = parser.parse_args(argv)
+
+    result = profile_recording(args.recording)
+    stats = result["results"]["replay"]
+    print(f"Replayed {stats['frames']} frames (seed {result['seed']}): "
+          f"mean {stats['frame']['mean_ms']:.3f} ms, p95 {stats['frame']['p95_ms']:.3f} ms")
+    for name, section in stats["subsystems"].items():
+        print(f"    {name:<12} mean {section['mean_ms']:.3f} ms  p95 {section['p95_ms']:.3f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(result, baseline, args.threshold)
+        if regressions:
+            print("Performance regressions:")
+            for line in regressions:
+                print(f"    {line}")
+            return 1
+        print("No regressions against baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Seeded RNG Service for Py City
+==============================
+
+One master seed fans out into independent, named random streams so each
+subsystem (city layout, weather, crime, corruption, animals, NPCs, names...)
+draws from its own generator. Adding a random call in one system no longer
+shifts the results of every other system, and a whole session can be
+replayed from a single integer.
+
+Features:
+- Stable per-stream seeds derived from (master seed, stream name)
+- random.Random streams, created on first use and cached
+- Global service accessor (get_rng / reset_rng)
+- Master seed can be pinned with the PY_CITY_SEED environment variable
+"""
+
+import hashlib
+import os
+import random
+from typing import Dict, Optional
+
+
+# Environment variable used to replay a session with a known seed
+SEED_ENV_VAR = "PY_CITY_SEED"
+
+# Well-known stream names (any string works; these keep call sites consistent)
+STREAM_CITY = "city"            # CityMap layout, CityBlock buildings/windows
+STREAM_WEATHER = "weather"      # Wind, rain and raindrops
+STREAM_CRIME = "crime"          # Crime selection and cooldowns
+STREAM_CORRUPTION = "corruption"  # Glitches, time warps, blocked escapes
+STREAM_ANIMALS = "animals"      # Animal spawning and wandering
+STREAM_NPCS = "npcs"            # NPC spawn points, wait timers, destinations
+STREAM_NAMES = "names"          # NPC name and backstory generation
+STREAM_VEHICLES = "vehicles"    # Vehicle spawning and routing
+STREAM_PHASES = "phases"        # Game loop progression (anomaly and exit placement)
+STREAM_CLUES = "clues"          # Crime case clue placement and descriptions
+STREAM_GLOBAL = "global"        # Seeds the random module for legacy callers
+
+
+def new_master_seed() -> int:
+    """Pick a fresh master seed (from PY_CITY_SEED if set)."""
+    env_seed = os.environ.get(SEED_ENV_VAR)
+    if env_seed:
+        try:
+            return int(env_seed)
+        except ValueError:
+            pass
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+class RNGService:
+    """Hands out independent, reproducible random streams from one master seed."""
+
+    def __init__(self, master_seed: Optional[int] = None):
+        self.master_seed = master_seed if master_seed is not None else new_master_seed()
+        self._streams: Dict[str, random.Random] = {}
+
+    def derive_seed(self, name: str) -> int:
+        """Stable 64-bit seed for a named stream (independent of PYTHONHASHSEED)."""
+        digest = hashlib.sha256(f"{self.master_seed}:{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    def stream(self, name: str) -> random.Random:
+        """Get (or create) the random.Random stream for a subsystem."""
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(self.derive_seed(name))
+            self._streams[name] = rng
+        return rng
+
+    def seed_global(self):
+        """Seed the random module from the master seed (for legacy callers)."""
+        random.seed(self.derive_seed(STREAM_GLOBAL))
+
+    def reseed(self, master_seed: int):
+        """Restart every stream from a new master seed."""
+        self.master_seed = master_seed
+        self._streams.clear()
+
+
+# Global service instance
+_rng_service: Optional[RNGService] = None
+
+
+def get_rng() -> RNGService:
+    """Get the global RNG service."""
+    global _rng_service
+    if _rng_service is None:
+        _rng_service = RNGService()
+    return _rng_service
+
+
+def reset_rng(master_seed: Optional[int] = None) -> RNGService:
+    """Replace the global RNG service (new session or replay)."""
+    global _rng_service
+    _rng_service = RNGService(master_seed)
+    return _rng_service
@@ -35,14 +35,24 @@ if PY_CITY_DIR not in sys.path:
     sys.path.insert(0, PY_CITY_DIR)
 
 # Import our new city systems
-from city_map import Camera, CityConfig, CityMap, WeatherSystem, DayNightCycle, TimeOfDay
-from game_loop import GameLoopManager, GamePhase, CrimeSimulation, NarratorQueue
-from corruption import CorruptionManager, CORRUPTION_NARRATOR_LINES
-from city_entities import (
-    VehicleManager, AnimalManager, SpecialBuildingManager,
-    InvestigationManager, RoadNetwork, SpecialBuildingType
+from city_map import Camera, CityConfig
+from game_loop import GamePhase
+from corruption import CORRUPTION_NARRATOR_LINES
+from decorations import reset_decorations
+from interiors import InteriorManager
+from npc_registry import NPCProfile, NPCRegistry
+from simulation import CitySimulation, CityNPC, CityPlayer, make_fallback_sprites
+from rng import reset_rng, SEED_ENV_VAR
+from quality import QualityGovernor
+from postprocess import get_post_processor, reset_post_processor
+from save_service import SaveService, SAVE_ENV_VAR, DEFAULT_SAVE_PATH
+from status_panel import (
+    StatusPanel, ITEMS_TAB, QUESTS_TAB, STATS_TAB, LOG_TAB, SCROLL_STEP
+)
+from replay import (
+    InputRecorder, encode_inputs, RECORDED_ACTIONS, RECORDED_KEYS,
+    RECORDED_QUEST_EVENTS, RECORD_ENV_VAR
 )
-from interiors import BuildingInterior, InteriorManager, InteriorObject
 
 # NPC type to archetype mapping
 NPC_TYPE_TO_ARCHETYPE = {
@@ -219,223 +229,6 @@ VIOLENCE_NARRATOR_LINES = {
 }
 
 
-class CityNPC:
-    """NPC that navigates the city using sidewalk pathfinding."""
-
-    def __init__(self, x: float, y: float, sprite: pygame.Surface,
-                 npc_type: str, city_map: CityMap):
-        self.x = x
-        self.y = y
-        self.size = 35
-        self.speed = 1.5
-        self.sprite = sprite
-        self.type = npc_type
-        self.city_map = city_map
-
-        # State
-        self.health = 100
-        self.in_jail = False
-        self.jail_timer = 600
-        self.committed_crime = False
-        self.in_building = False
-        self.breaking_in = False
-
-        # Trust/Hope system
-        self.trust = 0  # -100 to 100, starts neutral
-        self.times_helped = 0  # Track how many times player helped them
-        self.has_secret = random.random() < 0.3  # 30% chance NPC has a secret to share
-        self.secret_revealed = False
-
-        # Pathfinding
-        self.path = []
-        self.path_index = 0
-        self.wait_timer = random.uniform(0.5, 3.0)  # Stagger initial movement
-
-    def _generate_new_path(self):
-        """Generate a new path to a random destination."""
-        # Pick a random sidewalk node as destination
-        if self.city_map.sidewalk_nodes:
-            dest_node = random.choice(self.city_map.sidewalk_nodes)
-            self.path = self.city_map.find_path(
-                self.x, self.y,
-                dest_node.x, dest_node.y
-            )
-            self.path_index = 0
-
-    def move(self, dt: float):
-        """Move along the path."""
-        if self.in_jail or self.in_building:
-            return
-
-        # Waiting before moving?
-        if self.wait_timer > 0:
-            self.wait_timer -= dt
-            if self.wait_timer <= 0:
-                self._generate_new_path()
-            return
-
-        # No path? Generate one
-        if not self.path or self.path_index >= len(self.path):
-            self.wait_timer = random.uniform(1.0, 4.0)  # Pause before next path
-            return
-
-        # Follow path
-        target_x, target_y = self.path[self.path_index]
-        dx = target_x - self.x
-        dy = target_y - self.y
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist < 3:  # Close enough to waypoint
-            self.x, self.y = target_x, target_y
-            self.path_index += 1
-        else:
-            # Move toward waypoint
-            speed = self.speed * dt * 60
-            self.x += (dx / dist) * speed
-            self.y += (dy / dist) * speed
-
-    def draw(self, screen: pygame.Surface, camera: Camera):
-        """Draw NPC with shadow and health bar."""
-        screen_x, screen_y = camera.apply(self.x, self.y)
-
-        # Skip if off screen
-        if (screen_x < -self.size or screen_x > camera.screen_width + self.size or
-            screen_y < -self.size or screen_y > camera.screen_height + self.size):
-            return
-
-        # Draw shadow (ellipse under character)
-        shadow_width = int(self.size * 0.8)
-        shadow_height = int(self.size * 0.3)
-        shadow_x = screen_x + (self.size - shadow_width) // 2
-        shadow_y = screen_y + self.size - shadow_height // 2
-        shadow_surf = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, shadow_width, shadow_height))
-        screen.blit(shadow_surf, (shadow_x, shadow_y))
-
-        # Draw sprite
-        screen.blit(self.sprite, (screen_x, screen_y))
-
-        # Health bar
-        bar_width = self.size
-        bar_height = 4
-        pygame.draw.rect(screen, (255, 0, 0),
-                         (screen_x, screen_y - 8, bar_width, bar_height))
-        pygame.draw.rect(screen, (0, 255, 0),
-                         (screen_x, screen_y - 8,
-                          int(bar_width * (self.health / 100)), bar_height))
-
-        # Crime indicator
-        if self.breaking_in or self.committed_crime:
-            pygame.draw.circle(screen, (255, 255, 0),
-                               (int(screen_x + self.size / 2),
-                                int(screen_y + self.size / 2)), 5)
-
-        # Trust indicator (shows when trust > 0)
-        if self.trust > 0:
-            trust_color = (100, 200, 255) if self.trust < 50 else (150, 255, 150)
-            pygame.draw.circle(screen, trust_color,
-                               (int(screen_x + self.size - 5), int(screen_y + 5)), 3)
-
-    def increase_trust(self, amount: int = 20):
-        """Increase NPC trust level."""
-        self.trust = min(100, self.trust + amount)
-        self.times_helped += 1
-
-    def get_dialogue_tier(self) -> str:
-        """Get dialogue tier based on trust level."""
-        if self.trust < 20:
-            return "suspicious"
-        elif self.trust < 50:
-            return "neutral"
-        elif self.trust < 80:
-            return "friendly"
-        else:
-            return "trusting"
-
-    def can_reveal_secret(self) -> bool:
-        """Check if NPC can reveal their secret."""
-        return self.has_secret and not self.secret_revealed and self.trust >= 60
-
-
-class CityPlayer:
-    """Player that moves in the city with camera tracking."""
-
-    def __init__(self, x: float, y: float, sprite: pygame.Surface,
-                 world_width: int, world_height: int):
-        self.x = x
-        self.y = y
-        self.size = 35
-        self.speed = 5
-        self.sprite = sprite
-        self.health = 100
-        self.karma = 0
-        self.alignment = "neutral"
-        self.world_width = world_width
-        self.world_height = world_height
-
-    def move(self, dx: int, dy: int, city_map: CityMap, dt: float):
-        """Move with collision detection and wraparound edges."""
-        move_speed = self.speed * dt * 60
-
-        new_x = self.x + dx * move_speed
-        new_y = self.y + dy * move_speed
-
-        # Check collision
-        new_rect = pygame.Rect(new_x, new_y, self.size, self.size)
-        if not city_map.is_colliding(new_rect):
-            # Wraparound edges (Pac-Man style)
-            if new_x < 0:
-                self.x = self.world_width - self.size
-            elif new_x > self.world_width - self.size:
-                self.x = 0
-            else:
-                self.x = new_x
-
-            if new_y < 0:
-                self.y = self.world_height - self.size
-            elif new_y > self.world_height - self.size:
-                self.y = 0
-            else:
-                self.y = new_y
-
-    def draw(self, screen: pygame.Surface, camera: Camera):
-        """Draw player with shadow and health bar."""
-        screen_x, screen_y = camera.apply(self.x, self.y)
-
-        # Draw shadow (ellipse under character)
-        shadow_width = int(self.size * 0.8)
-        shadow_height = int(self.size * 0.3)
-        shadow_x = screen_x + (self.size - shadow_width) // 2
-        shadow_y = screen_y + self.size - shadow_height // 2
-        shadow_surf = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 80), (0, 0, shadow_width, shadow_height))
-        screen.blit(shadow_surf, (shadow_x, shadow_y))
-
-        # Draw sprite
-        screen.blit(self.sprite, (screen_x, screen_y))
-
-        # Health bar
-        bar_width = self.size
-        bar_height = 5
-        pygame.draw.rect(screen, (255, 0, 0),
-                         (screen_x, screen_y - 10, bar_width, bar_height))
-        pygame.draw.rect(screen, (0, 255, 0),
-                         (screen_x, screen_y - 10,
-                          int(bar_width * (self.health / 100)), bar_height))
-
-    def change_alignment(self, alignment: str):
-        self.alignment = alignment
-
-    def interact(self, npcs, radius: float = 50) -> 'CityNPC':
-        """Find nearby NPC to interact with."""
-        for npc in npcs:
-            dx = npc.x - self.x
-            dy = npc.y - self.y
-            if math.sqrt(dx * dx + dy * dy) < radius:
-                return npc
-        return None
-
-
 def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None):
     """
     Run py_city with Beginner's Guide integration.
@@ -451,6 +244,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     """
     # Import systems (late import to avoid circular deps)
     from game.controls import Action, InputHandler
+    from game.inventory import get_item
     from game.overlay import GameOverlay, PauseMenu, ChoiceMenu
     from game.plot_event_bus import PlotEvent, publish
     from game.plot_state import PlotStateManager
@@ -464,6 +258,11 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     pygame.event.set_grab(False)
     pygame.event.pump()  # Process any pending events to establish focus
 
+    # The display mode was just (re)set: drop overlay layers and glitch
+    # stamps pooled for the previous session's display
+    reset_post_processor()
+    reset_decorations()  # Character shadows, health bars and status dots
+
     # Load existing state or create new
     plot_state = PlotStateManager.load_or_create()
 
@@ -489,18 +288,6 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
         sidewalk_width=14,
     )
 
-    # Create city map
-    city_map = CityMap(city_config)
-
-    # Create camera
-    camera = Camera(WIDTH, HEIGHT, city_config.world_width, city_config.world_height)
-
-    # Create weather system (rain + wind + temperature)
-    weather = WeatherSystem(city_config.world_width, city_config.world_height)
-
-    # Create day/night cycle (starts at 8:00 AM, 1 real minute = 1 game hour)
-    day_night = DayNightCycle(start_hour=8.0, time_scale=60.0)
-
     # Colors
     BLACK = (0, 0, 0)
     WHITE = (255, 255, 255)
@@ -508,142 +295,108 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     # Load sprites
     sprite_size = (45, 45)
     try:
-        player_sprite = pygame.transform.scale(
-            pygame.image.load(os.path.join(PY_CITY_DIR, 'player.png')), sprite_size
-        )
-        criminal_sprite = pygame.transform.scale(
-            pygame.image.load(os.path.join(PY_CITY_DIR, 'criminal.png')), sprite_size
-        )
-        police_sprite = pygame.transform.scale(
-            pygame.image.load(os.path.join(PY_CITY_DIR, 'police.png')), sprite_size
-        )
-        civilian_sprite = pygame.transform.scale(
-            pygame.image.load(os.path.join(PY_CITY_DIR, 'civilian.png')), sprite_size
-        )
+        sprites = {
+            name: pygame.transform.scale(
+                pygame.image.load(os.path.join(PY_CITY_DIR, f'{name}.png')), sprite_size
+            )
+            for name in ("player", "criminal", "police", "civilian")
+        }
     except pygame.error:
         # Fallback to colored rectangles
-        player_sprite = pygame.Surface(sprite_size)
-        player_sprite.fill((0, 200, 0))
-        criminal_sprite = pygame.Surface(sprite_size)
-        criminal_sprite.fill((200, 0, 0))
-        police_sprite = pygame.Surface(sprite_size)
-        police_sprite.fill((0, 0, 200))
-        civilian_sprite = pygame.Surface(sprite_size)
-        civilian_sprite.fill((200, 200, 0))
-
-    # Create player on a sidewalk (not in a building)
-    # Find a sidewalk node near center of world
-    player_start_x = city_config.world_width // 2
-    player_start_y = city_config.world_height // 2
-
-    # Snap to nearest sidewalk node
-    if city_map.sidewalk_nodes:
-        nearest_node = city_map.get_nearest_sidewalk_node(player_start_x, player_start_y)
-        if nearest_node:
-            player_start_x = nearest_node.x
-            player_start_y = nearest_node.y
-
-    player = CityPlayer(
-        player_start_x,
-        player_start_y,
-        player_sprite,
-        city_config.world_width,
-        city_config.world_height
-    )
-
-    # Create NPCs
-    all_npcs = []
-    criminals = []
-    police = []
-    civilians = []
-
-    # Spawn NPCs on sidewalks
-    def spawn_npc_on_sidewalk(sprite, npc_type) -> CityNPC:
-        """Spawn an NPC at a random sidewalk node."""
-        if city_map.sidewalk_nodes:
-            node = random.choice(city_map.sidewalk_nodes)
-            return CityNPC(node.x, node.y, sprite, npc_type, city_map)
-        return CityNPC(100, 100, sprite, npc_type, city_map)
-
-    # Create criminals
-    for _ in range(6):
-        npc = spawn_npc_on_sidewalk(criminal_sprite, "criminal")
-        all_npcs.append(npc)
-        criminals.append(npc)
-
-    # Create police
-    for _ in range(5):
-        npc = spawn_npc_on_sidewalk(police_sprite, "police")
-        all_npcs.append(npc)
-        police.append(npc)
-
-    # Create civilians
-    for _ in range(20):
-        npc = spawn_npc_on_sidewalk(civilian_sprite, "civilian")
-        all_npcs.append(npc)
-        civilians.append(npc)
-
-    # Register NPCs with overlay system
-    _register_npcs_with_overlay(overlay, all_npcs, plot_state)
-
-    # Create narrator queue for pacing (shared between game loop and main loop)
-    # Slower narrator pacing - give player time to read instructions
-    narrator_queue = NarratorQueue(min_gap=10.0, max_queue=2)
-
-    # Initialize event log and connect to narrator and dialogue systems
-    from event_log import get_event_log, reset_event_log
-    reset_event_log()  # Start fresh each game session
-    event_log = get_event_log()
-    narrator_queue.set_event_log(event_log)
-    overlay.dialogue.set_event_log(event_log)
-
-    # Initialize game loop manager
-    game_loop = GameLoopManager(
-        city_config.world_width,
-        city_config.world_height,
+        sprites = make_fallback_sprites(sprite_size)
+
+    # Seed every random stream from one master seed (PY_CITY_SEED replays a session)
+    rng = reset_rng()
+    _USED_NAMES.clear()
+
+    # Build the headless simulation (city, NPCs, crime, vehicles, animals...)
+    # Paths are searched on worker threads, except while recording inputs:
+    # inline searches keep the recording replay-exact
+    sim = CitySimulation(
+        city_config,
+        rng=rng,
+        sprites=sprites,
+        criminal_count=6,
+        police_count=5,
+        civilian_count=20,
+        animal_count=25,
         guide=guide,
         overlay=overlay,
-        narrator_queue=narrator_queue
+        path_workers=0 if os.environ.get(RECORD_ENV_VAR) else 2,
     )
 
-    # Initialize crime simulation
-    crime_sim = CrimeSimulation(city_config.world_width, city_config.world_height)
+    # Front-end aliases for the simulation state
+    city_map = sim.city_map
+    weather = sim.weather
+    day_night = sim.day_night
+    player = sim.player
+    all_npcs = sim.all_npcs
+    criminals = sim.criminals
+    police = sim.police
+    civilians = sim.civilians
+    narrator_queue = sim.narrator_queue
+    pursuit = sim.pursuit  # Police pursuit and jail (violence consequences)
+    game_loop = sim.game_loop
+    crime_sim = sim.crime_sim
+    corruption = sim.corruption
+    vehicle_manager = sim.vehicle_manager
+    animal_manager = sim.animal_manager
+    special_buildings = sim.special_buildings
+    investigation = sim.investigation
 
-    # Initialize corruption manager (entropy-based horror effects)
-    corruption = CorruptionManager()
+    # Create camera
+    camera = Camera(WIDTH, HEIGHT, city_config.world_width, city_config.world_height)
 
-    # Initialize road network for vehicle pathfinding
-    road_network = RoadNetwork()
-    road_network.build_from_grid(
-        city_config.world_width, city_config.world_height,
-        city_config.block_width, city_config.block_height,
-        city_config.road_width
-    )
+    # NPCs are registered with the overlay's dialogue system lazily: names
+    # and backstories are worked out off-thread as the player heads toward
+    # them and handed to the overlay a few per frame, or all on the spot
+    # when talked to
+    npc_registry = NPCRegistry(_prepare_overlay_npc,
+                               lambda spec: overlay.create_npc(**spec),
+                               rng=rng)
+    npc_registry.set_stage(plot_state.get_stage())
 
-    # Initialize vehicle system
-    vehicle_manager = VehicleManager(
-        city_config.world_width, city_config.world_height, road_network
-    )
-    vehicle_manager.spawn_vehicles(road_network.segments, city_map.parking_lots)
-
-    # Initialize animal system
-    animal_manager = AnimalManager(city_config.world_width, city_config.world_height)
-    # Collect all building rectangles for collision avoidance
-    building_rects = []
-    for block in city_map.blocks:
-        for building in block.buildings:
-            building_rects.append(building)
-    animal_manager.set_building_rects(building_rects)
-    animal_manager.spawn_animals(city_map.sidewalk_nodes, count=25)
-
-    # Initialize special buildings (jail, courthouse, etc.)
-    special_buildings = SpecialBuildingManager(city_config.world_width, city_config.world_height)
-    # Get block positions from city map for placing special buildings
-    block_positions = [(b.rect.x, b.rect.y, b.rect.width, b.rect.height) for b in city_map.blocks]
-    special_buildings.create_special_buildings(block_positions)
-
-    # Initialize investigation system
-    investigation = InvestigationManager()
+    # Initialize event log and connect to narrator and dialogue systems
+    from event_log import get_event_log, reset_event_log, JOURNAL_ENV_VAR
+    # Start fresh each game session (full history journaled if requested)
+    reset_event_log(os.environ.get(JOURNAL_ENV_VAR) or None)
+    event_log = get_event_log()
+    narrator_queue.set_event_log(event_log)
+    overlay.dialogue.set_event_log(event_log)
+    event_log.log_system(f"Session seed: {sim.seed} (replay with {SEED_ENV_VAR}={sim.seed})")
+
+    # The Tab menu renders each tab once and keeps it until something the
+    # tab shows changes; these notifications mark the affected tab stale
+    status_panel = StatusPanel(WIDTH, HEIGHT, [
+        lambda panel: _render_items_tab(panel, plot_state),
+        lambda panel: _render_quests_tab(panel, game_loop, sim.quests),
+        lambda panel: _render_stats_tab(panel, player, game_loop, plot_state),
+        _render_log_tab,
+    ])
+    event_log.on_add = lambda entry: status_panel.invalidate(LOG_TAB)
+    player.on_stats_changed = lambda: status_panel.invalidate(STATS_TAB)
+    game_loop.on_phase_change = lambda old_phase, new_phase: status_panel.invalidate(QUESTS_TAB)
+    quests_changed = [False]  # Saved once per frame, after the step
+
+    def on_quests_changed():
+        quests_changed[0] = True
+        status_panel.invalidate(QUESTS_TAB)
+
+    sim.quests.on_change = on_quests_changed
+
+    # Quest events only the front-end sees (interiors, the exit menu); the
+    # simulation flushes them with its own on the next step
+    frame_quest_events = []
+
+    def queue_quest_event(name):
+        sim.quests.queue_event(name)
+        frame_quest_events.append(name)
+
+    # Optional input recording for headless replay/profiling
+    record_path = os.environ.get(RECORD_ENV_VAR)
+    recorder = None
+    if record_path:
+        recorder = InputRecorder(sim.seed, city_config, (6, 5, 20, 25))
 
     # Track exit portal location
     exit_portal = {"x": 0, "y": 0, "active": False, "pulse": 0.0}
@@ -662,6 +415,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
     def on_anomaly_discovered(anomaly):
         discovered_anomalies.append(anomaly)
+        status_panel.invalidate(QUESTS_TAB)
 
         # Reveal next hidden anomaly (sequential spawning)
         for next_anomaly in game_loop.state.anomalies:
@@ -691,24 +445,28 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     dialog_timer = 0
     talking_npc = None
     idle_timer = 0.0
-    last_player_pos = (player.x, player.y)
-    player_moving = False
 
     # Building interior state
     interior_manager = InteriorManager()
     current_interior = None  # BuildingInterior when inside a building
     current_building = None  # SpecialBuilding when inside
     interior_player_pos = [200, 150]  # Player position within interior
+    interior_nearby = None  # Nearest interactable interior object (shared by update and draw)
     interior_search_cooldown = 0.0  # Prevent rapid searching
 
-    # Police pursuit state (violence consequences)
-    player_wanted = False  # Is player being pursued by police?
-    wanted_level = 0  # 0-3: higher = more aggressive pursuit
-    pursuing_police = []  # List of police NPCs actively chasing player
-    player_in_jail = False  # Is player currently in jail?
-    jail_timer = 0.0  # Time remaining in jail
-    violence_cooldown = 0.0  # Cooldown before wanted level decays
-    total_attacks = 0  # Track total violent acts for horror escalation
+    # Mid-session saves run on a background thread, at most one per interval;
+    # the game thread hands over snapshots, never live state
+    save_service = SaveService(os.environ.get(SAVE_ENV_VAR, DEFAULT_SAVE_PATH), interval=2.0)
+    saved_quests = save_service.get_section("quests")
+    if saved_quests and not recorder:
+        # Recordings replay from a fresh quest log
+        sim.quests.load(saved_quests)
+
+    # Items found since plot_state's own file was last written (it is only
+    # written at exit) are journaled in the save file; a crash or kill
+    # before exit would otherwise lose them
+    found_items = _restore_found_items(plot_state, save_service.get_section("found_items") or [],
+                                       get_item)
 
     # Instructions
     instructions_text = [
@@ -739,13 +497,17 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     # Shared exit portal choice menu
     exit_menu = ChoiceMenu(title="The Exit Awaits")
     level_completed_ref = [False]
+    kept_exploring_ref = [False]  # Chosen this frame (recorded for replays)
 
     def on_keep_exploring():
+        queue_quest_event("exit_used_or_stayed")
         exit_menu.close()
-        game_loop.state.phase = GamePhase.LIVING_CITY
+        sim.keep_exploring()
+        kept_exploring_ref[0] = True
         narrator_queue.queue_line("You choose to linger. The city welcomes you back.")
 
     def on_move_to_next():
+        queue_quest_event("exit_used_or_stayed")
         level_completed_ref[0] = True
         running_ref[0] = False
 
@@ -759,18 +521,26 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
     # Click-to-move target (world coordinates)
     move_target = None
 
+    # Adaptive quality (rain, glow rings, draw distance, scan lines, shadows)
+    quality = QualityGovernor(target_fps=60)
+    post_processor = get_post_processor()
+    show_debug = False
+
     # Start the game loop
-    game_loop.start()
+    sim.start()
 
     while running_ref[0]:
         raw_dt = clock.tick(60) / 1000.0
+        frame_quest_events.clear()
+        kept_exploring_ref[0] = False
 
-        # Update corruption entropy based on game phase
-        corruption.update_entropy(game_loop.state.phase.name)
-        corruption.update(raw_dt)
+        # Adapt visual quality to last frame's work time (excludes tick delay)
+        quality.record_frame(clock.get_rawtime() / 1000.0)
+        tier = quality.tier
 
-        # Apply time dilation (horror effect - reality stutters)
-        dt = corruption.warp_time(raw_dt)
+        # Update corruption entropy and apply time dilation
+        # (horror effect - reality stutters)
+        dt = sim.begin_frame(raw_dt)
 
         # Update input handler at frame start
         input_handler.update()
@@ -786,13 +556,13 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 running_ref[0] = False
                 continue
 
-            # Handle mouse clicks on status panel tabs
+            # Handle mouse clicks on status panel tabs, and wheel scrolling
             if show_status_panel and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                tab_rects = _get_status_panel_tab_rects(WIDTH, HEIGHT)
-                for i, rect in enumerate(tab_rects):
-                    if rect.collidepoint(event.pos):
-                        status_panel_tab = i
-                        break
+                clicked_tab = status_panel.tab_at(event.pos)
+                if clicked_tab is not None:
+                    status_panel_tab = clicked_tab
+            elif show_status_panel and event.type == pygame.MOUSEWHEEL:
+                status_panel.scroll(status_panel_tab, -event.y * SCROLL_STEP)
 
             # Let menus handle events first
             if exit_menu.is_open:
@@ -805,6 +575,20 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             # Pass to input handler
             input_handler.handle_event(event)
 
+        # Capture this frame's input for the recorder
+        frame_move = (0.0, 0.0)
+        frame_click = None
+        frame_interior = frame_steering = frame_attacked = frame_talked = False
+        frame_frozen = -1
+        if recorder:
+            keys_held = pygame.key.get_pressed()
+            frame_inputs = encode_inputs(
+                [name for name in RECORDED_ACTIONS
+                 if input_handler.just_pressed(getattr(Action, name))],
+                [name for name in RECORDED_KEYS
+                 if keys_held[getattr(pygame, f"K_{name}")]],
+            )
+
         # Handle pause (ESC)
         if input_handler.just_pressed(Action.PAUSE):
             publish(PlotEvent.ESC_PRESS)
@@ -822,6 +606,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 pause_menu.close()
             else:
                 pause_menu.open()
+        frame_paused = pause_menu.is_open or exit_menu.is_open
 
         # Skip game input when menus are open
         if pause_menu.is_open or exit_menu.is_open:
@@ -832,21 +617,27 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
             if keys[pygame.K_g]:
                 if not hasattr(run, '_g_pressed') or not run._g_pressed:
-                    player.change_alignment("good")
-                    game_loop.on_player_aligned("good")
+                    sim.set_alignment("good")
                     run._g_pressed = True
             else:
                 run._g_pressed = False
 
             if keys[pygame.K_n] and not keys[pygame.K_LCTRL] and not keys[pygame.K_RCTRL]:
                 if not hasattr(run, '_n_pressed') or not run._n_pressed:
-                    player.change_alignment("neutral")
-                    game_loop.on_player_aligned("neutral")
+                    sim.set_alignment("neutral")
                     narrator_queue.queue_line("I see you can't decide. How typical.")
                     run._n_pressed = True
             else:
                 run._n_pressed = False
 
+            # Debug overlay toggle (F12)
+            if keys[pygame.K_F12]:
+                if not hasattr(run, '_f12_pressed') or not run._f12_pressed:
+                    show_debug = not show_debug
+                    run._f12_pressed = True
+            else:
+                run._f12_pressed = False
+
             # Instructions toggle
             if input_handler.just_pressed(Action.INSTRUCTIONS):
                 show_instructions = not show_instructions
@@ -861,6 +652,10 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             # Status panel toggle
             if input_handler.just_pressed(Action.STATUS):
                 show_status_panel = not show_status_panel
+                if show_status_panel:
+                    # Horror stage, awareness and the inventory live in the
+                    # shared plot state, which sends no notifications
+                    status_panel.invalidate(ITEMS_TAB, STATS_TAB)
 
             # Tab switching within status panel (1, 2, 3, 4 keys)
             if show_status_panel:
@@ -880,33 +675,14 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
             # Dev: Skip phase
             if input_handler.just_pressed(Action.SKIP_PHASE):
-                current = game_loop.state.phase
-                if current == GamePhase.TUTORIAL:
-                    game_loop._transition_to_phase(GamePhase.LIVING_CITY)
-                elif current == GamePhase.LIVING_CITY:
-                    game_loop._transition_to_phase(GamePhase.SOMETHING_WRONG)
-                elif current == GamePhase.SOMETHING_WRONG:
-                    for anomaly in game_loop.state.anomalies[:5]:
-                        anomaly.discovered = True
-                    game_loop.state.anomalies_discovered = 5
-                    game_loop._transition_to_phase(GamePhase.EXIT_SEARCH)
-                elif current == GamePhase.EXIT_SEARCH:
-                    game_loop._transition_to_phase(GamePhase.COMPLETED)
+                sim.skip_phase()
                 narrator_queue.clear()
 
             # Help police (H key)
             if keys[pygame.K_h]:
                 if not hasattr(run, '_h_pressed') or not run._h_pressed:
-                    crime = crime_sim.player_intervene(player.x, player.y, True)
-                    if crime:
-                        game_loop.on_player_intervention(True)
-                        player.karma += 5
-                        for npc in all_npcs:
-                            if npc.type in ["civilian", "police"]:
-                                dx = npc.x - player.x
-                                dy = npc.y - player.y
-                                if math.sqrt(dx * dx + dy * dy) < 200:
-                                    npc.increase_trust(15)
+                    if sim.intervene(True):
+                        status_panel.invalidate(QUESTS_TAB)
                         overlay.notifications.show_glitch("They notice your help. Trust grows.", 2.0, "top_right")
                     run._h_pressed = True
             else:
@@ -915,15 +691,8 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             # Join crime (J key)
             if keys[pygame.K_j]:
                 if not hasattr(run, '_j_pressed') or not run._j_pressed:
-                    crime = crime_sim.player_intervene(player.x, player.y, False)
-                    if crime:
-                        game_loop.on_player_intervention(False)
-                        player.karma -= 15
-                        for npc in all_npcs:
-                            dx = npc.x - player.x
-                            dy = npc.y - player.y
-                            if math.sqrt(dx * dx + dy * dy) < 200:
-                                npc.trust = max(-100, npc.trust - 20)
+                    if sim.intervene(False):
+                        status_panel.invalidate(QUESTS_TAB)
                         overlay.notifications.show_glitch("They saw what you did. They won't forget.", 2.0, "top_right")
                     run._j_pressed = True
             else:
@@ -934,15 +703,13 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 if current_interior is not None:
                     # Inside a building - check for door, stairs, or searchable object
                     if interior_search_cooldown <= 0:
-                        nearby_obj = current_interior.get_nearby_object(
-                            interior_player_pos[0], interior_player_pos[1], radius=60
-                        )
+                        nearby_obj = interior_nearby
                         if nearby_obj and nearby_obj.is_door:
                             # Exit through door (only on ground floor)
                             overlay.notifications.show_glitch("You leave the building.", 1.5, "center")
                             # Reset to ground floor for next entry
                             if current_building:
-                                interior_manager.reset_to_ground(id(current_building))
+                                interior_manager.reset_to_ground(current_building.building_id)
                             current_interior = None
                             current_building = None
                         elif nearby_obj and nearby_obj.is_stairs:
@@ -950,6 +717,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                             direction = nearby_obj.stairs_direction
                             if current_interior.can_change_level(direction):
                                 current_interior.change_level(direction)
+                                interior_nearby = None
                                 level_name = current_interior.get_level_name()
                                 if direction > 0:
                                     overlay.notifications.show_glitch(f"You climb the stairs to the {level_name}.", 2.0, "center")
@@ -974,17 +742,19 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
                             if item_id:
                                 # Found an item - add to inventory
-                                from game.inventory import get_item
                                 item = get_item(item_id)
                                 if item and plot_state.inventory.add(item):
+                                    status_panel.invalidate(ITEMS_TAB)
+                                    queue_quest_event("item_found")
                                     overlay.notifications.show_glitch(
                                         f"Found: {item.name}", 3.0, "top_right"
                                     )
                                     lines = INTERIOR_NARRATOR_LINES.get("item_found", [])
                                     if lines and not overlay.audio.muted:
                                         narrator_queue.queue_line(random.choice(lines))
-                                    # Save state with new item
-                                    plot_state.save()
+                                    # Journal the new item (written off the game thread)
+                                    found_items.append(item_id)
+                                    save_service.request("found_items", list(found_items))
                             else:
                                 # Empty search
                                 if horror_stage in ("late", "finale") and nearby_obj.horror_text:
@@ -1005,10 +775,14 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                         building_type = nearby_building.building_type.value
                         current_building = nearby_building
                         current_interior = interior_manager.get_interior(
-                            id(nearby_building), building_type
+                            nearby_building.building_id, building_type
                         )
+                        interior_nearby = None
                         interior_player_pos[0] = current_interior.width // 2
                         interior_player_pos[1] = current_interior.height // 2
+                        queue_quest_event("building_entered")
+                        if f"found_{building_type}" in RECORDED_QUEST_EVENTS:
+                            queue_quest_event(f"found_{building_type}")
 
                         overlay.notifications.show_glitch(f"Entering {nearby_building.name}...", 2.0, "center")
                         lines = BUILDING_NARRATOR_LINES.get(building_type, [])
@@ -1018,15 +792,14 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                         # NPC interaction
                         interacted = player.interact(all_npcs)
                         if interacted:
-                            npc_id = f"npc_{id(interacted)}"
+                            npc_id = npc_registry.ensure(interacted).npc_id
                             situation = _get_situation(interacted, player, plot_state)
-                            if situation == "reveal_secret":
-                                interacted.secret_revealed = True
+                            sim.talk_to(interacted)
                             overlay.show_npc_dialogue_with_guide(npc_id, "", situation)
                             dialog_timer = 10.0  # Base timer, but NPC stays frozen while dialogue active
                             talking_npc = interacted
                             idle_timer = 0.0
-                            game_loop.on_player_talked(interacted.type)
+                            frame_talked = True
 
             # Exit building backup (B key or ESC when inside - main exit is E at door)
             if current_interior is not None:
@@ -1039,18 +812,14 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             # Attack (Space or Left-click)
             if input_handler.just_pressed(Action.ATTACK) and not show_status_panel:
                 # Can't attack while in jail
-                if not player_in_jail:
-                    attack_result = _do_attack(player, all_npcs, overlay, game_loop, narrator_queue)
-                    # Handle violence consequences (police pursuit)
-                    (player_wanted, wanted_level, pursuing_police,
-                     violence_cooldown, total_attacks) = _handle_attack_consequences(
-                        attack_result, player, police, player_wanted, wanted_level,
-                        pursuing_police, violence_cooldown, total_attacks,
-                        overlay, narrator_queue
-                    )
+                if not pursuit.in_jail:
+                    attack_result = sim.attack()
+                    _present_attack(attack_result, pursuit, overlay, narrator_queue)
+                    frame_attacked = True
 
             # Click-to-move (Right-click)
             click_target = input_handler.get_click_target()
+            frame_click = click_target
             if click_target:
                 # Wraparound world coordinates
                 world_x = click_target[0] % city_config.world_width
@@ -1065,26 +834,25 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 interior_search_cooldown -= dt
 
             # Track idle time
-            if (player.x, player.y) == last_player_pos:
+            player_moving = sim.check_player_moved()
+            if player_moving:
+                idle_timer = 0.0
+            else:
                 idle_timer += dt
-                player_moving = False
                 if idle_timer >= 30.0:
                     publish(PlotEvent.IDLE, {"seconds": idle_timer})
                     idle_timer = 0.0
-            else:
-                idle_timer = 0.0
-                player_moving = True
-                last_player_pos = (player.x, player.y)
 
             # Player movement via InputHandler (WASD and arrow keys)
             dx, dy = input_handler.get_movement()
 
             # Prevent movement while in jail
-            if player_in_jail:
+            if pursuit.in_jail:
                 dx, dy = 0, 0
                 move_target = None
 
             # Handle interior vs exterior movement
+            frame_interior = current_interior is not None
             if current_interior is not None:
                 # Interior movement - constrained to room bounds
                 move_speed = 3.0 * dt * 60
@@ -1098,6 +866,11 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
                 interior_player_pos[0] = new_x
                 interior_player_pos[1] = new_y
+
+                # Found once per frame; draw highlights it, [E] acts on it
+                interior_nearby = current_interior.get_nearby_object(
+                    interior_player_pos[0], interior_player_pos[1], radius=60
+                )
             else:
                 # Normal exterior movement
                 # Click-to-move takes priority if active and no keyboard input
@@ -1129,18 +902,31 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 elif dx != 0 or dy != 0:
                     # Keyboard movement cancels click-to-move
                     move_target = None
-                    # Add drift when stopping (corruption effect)
-                    corruption.add_movement_drift(dx, dy)
+                    frame_steering = True
+
+                # Keyboard steering builds up corruption drift (the
+                # character overshoots when entropy is high)
+                final_dx, final_dy = sim.move_player(dx, dy, dt, steering=frame_steering)
+                frame_move = (dx, dy)
 
-                # Apply movement drift (character overshoots when entropy is high)
-                drift_x, drift_y = corruption.get_movement_drift()
-                final_dx = dx + drift_x * 0.1
-                final_dy = dy + drift_y * 0.1
+                # Build the interior of a building we're approaching off-thread
+                interior_manager.prefetch_near(special_buildings, player.x, player.y)
 
-                player.move(final_dx, final_dy, city_map, dt)
+                # Prepare NPCs we're heading toward for the dialogue system
+                npc_registry.set_stage(plot_state.get_stage())
+                npc_registry.register_ahead(all_npcs, player.x, player.y,
+                                            final_dx * player.speed * 60,
+                                            final_dy * player.speed * 60)
 
-            # Update game loop (tutorial, phases, anomalies)
-            game_loop.update(dt, player.x, player.y, player_moving)
+            # Step the simulation: game loop, crime, NPCs (talking NPC stays
+            # frozen), vehicles, animals, clues, day/night, weather, windows
+            frozen_npc = talking_npc if dialog_timer > 0 else None
+            if frozen_npc is not None:
+                frame_frozen = frozen_npc.row
+            step = sim.step(dt, player_moving=player_moving, frozen_npc=frozen_npc)
+
+            # Register the NPCs the worker prepared, a budgeted number per frame
+            npc_registry.drain()
 
             # Check for level completion - show exit menu instead of auto-exiting
             if game_loop.is_complete() and not exit_menu.is_open:
@@ -1149,28 +935,16 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                     guide.stop()
                 narrator_queue.queue_line("A choice presents itself. Stay, or move forward?", priority=True)
 
-            # Update crime simulation (only during living city phase)
-            if game_loop.state.phase in (GamePhase.LIVING_CITY, GamePhase.SOMETHING_WRONG):
-                # Set night mode for crime bonus
-                crime_sim.set_night_mode(day_night.is_night())
-                crime_events = crime_sim.update(
-                    dt, criminals, police, civilians,
-                    player.x, player.y
-                )
-                # Queue narrator comments on crime events
-                for event in crime_events:
-                    if not overlay.audio.muted:
-                        lines = CRIME_NARRATOR_LINES.get(event, [])
-                        if lines:
-                            narrator_queue.queue_line(random.choice(lines))
+            # Queue narrator comments on crime events
+            for event in step.crime_events:
+                if not overlay.audio.muted:
+                    lines = CRIME_NARRATOR_LINES.get(event, [])
+                    if lines:
+                        narrator_queue.queue_line(random.choice(lines))
 
-            # Update police pursuit system (violence consequences)
-            (player_wanted, wanted_level, pursuing_police,
-             player_in_jail, jail_timer, violence_cooldown) = _update_police_pursuit(
-                dt, player, police, player_wanted, wanted_level,
-                pursuing_police, player_in_jail, jail_timer,
-                violence_cooldown, special_buildings, overlay, narrator_queue
-            )
+            # Police pursuit: arrests and releases (violence consequences)
+            if step.pursuit_event:
+                _present_pursuit_event(step.pursuit_event, pursuit, overlay, narrator_queue)
 
             # Process narrator queue - speak next line if ready
             if guide and not overlay.audio.muted:
@@ -1178,45 +952,34 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 if line_to_speak:
                     guide.speak_async(line_to_speak)
 
-            # Update NPCs (corruption may freeze individual NPCs)
-            for npc in all_npcs:
-                if npc is talking_npc and dialog_timer > 0:
-                    continue  # Pause talking NPC
-                if not npc.in_jail:
-                    # Corruption: occasionally skip NPC update (freeze glitch)
-                    if not corruption.should_skip_npc_update():
-                        npc.move(dt)
-
-            # Update vehicles
-            vehicle_manager.update(dt)
-
-            # Update animals
-            animal_manager.update(dt, player.x, player.y)
-
-            # Check for clue discovery
-            clue = investigation.check_clue_discovery(player.x, player.y)
-            if clue:
-                overlay.notifications.show_glitch(f"CLUE: {clue.description}", 3.0, "center")
+            if quests_changed[0]:
+                save_service.request("quests", sim.quests.save())
+                quests_changed[0] = False
+
+            # Quest completions (rewards are applied by the simulation)
+            for quest in step.completed_quests:
+                if quest.completion_message:
+                    overlay.notifications.show_glitch(quest.completion_message, 3.0, "top_right")
+                if quest.horror_hint and not overlay.audio.muted:
+                    narrator_queue.queue_line(quest.horror_hint)
+
+            # Clue discovery
+            if step.clue:
+                overlay.notifications.show_glitch(f"CLUE: {step.clue.description}", 3.0, "center")
                 lines = INVESTIGATION_NARRATOR_LINES.get("clue_found", [])
                 if lines and not overlay.audio.muted:
                     narrator_queue.queue_line(random.choice(lines))
 
-            # Update day/night cycle
-            time_event = day_night.update(dt)
-            if time_event and not overlay.audio.muted:
-                narrator_queue.queue_line(time_event)
+            # Day/night transitions
+            if step.time_event and not overlay.audio.muted:
+                narrator_queue.queue_line(step.time_event)
 
-            # Update weather (rain, wind, temp) with current time of day
-            weather_event = weather.update(dt, day_night.get_time_of_day())
-            if weather_event and not overlay.audio.muted:
-                lines = RAIN_NARRATOR_LINES.get(weather_event, [])
+            # Weather changes (rain, wind, temp)
+            if step.weather_event and not overlay.audio.muted:
+                lines = RAIN_NARRATOR_LINES.get(step.weather_event, [])
                 if lines:
                     narrator_queue.queue_line(random.choice(lines))
 
-            # Update window states based on time
-            lit_chance = day_night.get_window_lit_chance()
-            city_map.update_windows(dt, lit_chance)
-
             # Update exit portal pulse
             if exit_portal["active"]:
                 exit_portal["pulse"] += dt * 3
@@ -1231,6 +994,14 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                 if dialog_timer <= 0 and not dialogue_active:
                     talking_npc = None
 
+        if recorder:
+            recorder.record_frame(raw_dt, frame_inputs, frame_move, frame_click,
+                                  interior=frame_interior, paused=frame_paused,
+                                  steering=frame_steering, attacked=frame_attacked,
+                                  talked=frame_talked, frozen=frame_frozen,
+                                  quest_events=frame_quest_events,
+                                  kept_exploring=kept_exploring_ref[0])
+
         # Camera follows player (even when paused for smooth visuals)
         camera.follow(player.x + player.size // 2, player.y + player.size // 2)
 
@@ -1238,6 +1009,9 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
         overlay.update(dt)
 
         # --- Rendering ---
+        # Corruption scan lines ride on the post-processor's overlay layer
+        scan_alpha = corruption.get_scan_line_alpha()
+
         if current_interior is not None:
             # === INTERIOR RENDERING ===
             screen.fill((15, 15, 20))  # Dark background
@@ -1246,15 +1020,12 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             interior_offset_x = (WIDTH - current_interior.width) // 2
             interior_offset_y = (HEIGHT - current_interior.height) // 2
 
-            # Draw interior with player position for highlighting
+            # Draw interior, highlighting the object found during update
             current_interior.draw(
                 screen,
                 interior_offset_x,
                 interior_offset_y,
-                player_pos=(
-                    interior_player_pos[0] + interior_offset_x,
-                    interior_player_pos[1] + interior_offset_y
-                )
+                nearby=interior_nearby,
             )
 
             # Draw player in interior
@@ -1262,6 +1033,9 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             player_screen_y = interior_offset_y + interior_player_pos[1] - player.size // 2
             screen.blit(player.sprite, (player_screen_x, player_screen_y))
 
+            # Scan lines only (interiors have no night or rain tint)
+            post_processor.draw_tint(screen, [], scan_alpha, tier.scan_line_spacing)
+
             # Draw building name and exit hint
             font = pygame.font.Font(None, 28)
             if current_building:
@@ -1275,14 +1049,19 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
         else:
             # === EXTERIOR RENDERING ===
             # Corruption: afterimage effect (skip screen clear occasionally)
+            # Every lighting consumer this frame reads the simulation's snapshot
+            lighting = sim.lighting
             if not corruption.should_skip_screen_clear():
                 # Normal: clear and draw city
-                darkness_alpha = day_night.get_darkness_alpha()
-                city_map.draw(screen, camera, darkness_alpha)
+                city_map.draw(screen, camera, lighting.darkness_alpha, overlay=False)
             else:
                 # Afterimage: don't clear - creates smear effect
-                darkness_alpha = day_night.get_darkness_alpha()
-                city_map.draw(screen, camera, darkness_alpha)
+                city_map.draw(screen, camera, lighting.darkness_alpha, overlay=False)
+
+            # Night darkness + scan lines as one cached full-screen layer,
+            # over the city and under everything on it
+            post_processor.draw_tint(screen, [lighting.darkness_tint],
+                                     scan_alpha, tier.scan_line_spacing)
 
             # Draw anomaly markers (before NPCs so they appear under)
             for anomaly in game_loop.state.anomalies:
@@ -1322,7 +1101,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                             base_color = (100, 80, 150)
 
                         # Outer glow rings
-                        for i in range(3):
+                        for i in range(tier.glow_rings):
                             ring_alpha = int((1 - i/3) * 60 * pulse)
                             ring_radius = radius + i * 8
                             ring_color = (
@@ -1357,7 +1136,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                     pulse = abs(math.sin(exit_portal["pulse"]))
                     radius = int(30 + pulse * 15)
                     # Outer glow
-                    for i in range(3):
+                    for i in range(tier.glow_rings):
                         alpha = int((3 - i) * 30 * pulse)
                         glow_color = (100, 200, 255)
                         glow_surf = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
@@ -1396,15 +1175,15 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
                             screen.blit(crime_text, (int(cx) - 25, int(cy) - 60))
 
             # Draw vehicles (below NPCs)
-            vehicle_manager.draw(screen, camera)
+            vehicle_manager.draw(screen, camera, tier.draw_distance)
 
             # Draw animals
-            animal_manager.draw(screen, camera)
+            animal_manager.draw(screen, camera, tier.draw_distance)
 
             # Draw NPCs
             for npc in all_npcs:
                 if not npc.in_jail and not npc.in_building:
-                    npc.draw(screen, camera)
+                    npc.draw(screen, camera, shadow=tier.npc_shadows)
 
             # Draw player
             player.draw(screen, camera)
@@ -1415,8 +1194,8 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             # Draw investigation clues
             investigation.draw_clues(screen, camera)
 
-            # Draw weather effects on top of world
-            weather.draw(screen, camera)
+            # Draw weather effects (rain drops and tint) on top of world
+            weather.draw(screen, camera, tier.rain_drop_scale)
 
         # UI elements (screen-space, not affected by camera)
         font = pygame.font.Font(None, 24)
@@ -1456,7 +1235,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             screen.blit(text_surface, (12, 12 + i * 24))
 
         # Wanted status indicator (below stats)
-        if player_in_jail:
+        if pursuit.in_jail:
             # Jail indicator
             jail_bg = pygame.Surface((180, 50))
             jail_bg.set_alpha(200)
@@ -1464,18 +1243,18 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             screen.blit(jail_bg, (5, 190))
             jail_text = font.render("IN JAIL", True, (255, 100, 100))
             screen.blit(jail_text, (12, 195))
-            timer_text = small_font.render(f"Release in: {int(jail_timer)}s", True, (200, 150, 150))
+            timer_text = small_font.render(f"Release in: {int(pursuit.jail_timer)}s", True, (200, 150, 150))
             screen.blit(timer_text, (12, 220))
-        elif player_wanted:
+        elif pursuit.wanted:
             # Wanted indicator with flashing effect
             flash = int(abs(math.sin(time.time() * 4)) * 80)
             wanted_bg = pygame.Surface((180, 50))
             wanted_bg.set_alpha(200)
             wanted_bg.fill((80 + flash, 20, 20))
             screen.blit(wanted_bg, (5, 190))
-            wanted_text = font.render(f"WANTED Level {int(wanted_level)}", True, (255, 200 + flash // 2, 100))
+            wanted_text = font.render(f"WANTED Level {int(pursuit.wanted_level)}", True, (255, 200 + flash // 2, 100))
             screen.blit(wanted_text, (12, 195))
-            pursuit_text = small_font.render(f"Police pursuing: {len(pursuing_police)}", True, (200, 150, 150))
+            pursuit_text = small_font.render(f"Police pursuing: {len(pursuit.pursuing)}", True, (200, 150, 150))
             screen.blit(pursuit_text, (12, 220))
 
         # Time/Weather panel (right side)
@@ -1543,7 +1322,7 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
 
         # Draw status panel if open
         if show_status_panel:
-            _draw_status_panel(screen, player, game_loop, font, status_panel_tab, plot_state)
+            status_panel.draw(screen, status_panel_tab, pygame.mouse.get_pos())
 
         # Draw shared menus
         pause_menu.draw(screen)
@@ -1555,9 +1334,8 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             pygame.draw.circle(screen, (100, 255, 100), (int(target_screen_x), int(target_screen_y)), 8, 2)
             pygame.draw.circle(screen, (150, 255, 150), (int(target_screen_x), int(target_screen_y)), 4)
 
-        # Corruption: visual effects layer (glitch rects, scan lines)
+        # Corruption: visual effects layer (glitch rects)
         corruption.draw_visual_corruption(screen)
-        corruption.draw_scan_lines(screen)
 
         # Corruption: narrator triggers from entropy effects
         corruption_event = corruption.get_narrator_trigger()
@@ -1566,11 +1344,38 @@ def run(screen, clock, guide, scene_slug, tone, input_handler=None, overlay=None
             if lines:
                 narrator_queue.queue_line(random.choice(lines))
 
+        # Debug overlay (F12)
+        if show_debug:
+            debug_info = quality.get_debug_info()
+            corruption_info = corruption.get_corruption_debug_info()
+            path_info = sim.path_planner.get_stats()
+            npc_info = npc_registry.get_stats()
+            _draw_debug_overlay(screen, small_font, [
+                f"FPS: {clock.get_fps():.0f}",
+                f"Quality: {debug_info['tier']} ({debug_info['changes']} changes)",
+                f"Frame: {debug_info['avg_ms']:.1f} / {debug_info['budget_ms']:.1f} ms",
+                f"Entropy: {corruption_info['entropy']:.2f}",
+                f"Paths: {path_info['queued']} queued, {path_info['avg_latency_ms']:.1f} ms avg",
+                f"NPC profiles: {npc_info['registered']} / {len(all_npcs)} registered",
+                f"Seed: {sim.seed}",
+            ])
+
         pygame.display.flip()
 
     # Cleanup and save state
     overlay.clear_all()
+    interior_manager.shutdown()
+    npc_registry.shutdown()
+    sim.close()
+    event_log.close()
+    sim.quests.flush_events()  # e.g. the exit choice made on the last frame
+    save_service.request("quests", sim.quests.save())
     plot_state.save()
+    save_service.request("found_items", [])  # Now in plot_state's own file
+    save_service.close()
+    if recorder:
+        recorder.save(record_path)
+        print(f"Input recording saved to {record_path} ({recorder.frame_count} frames)")
     print(f"Game state saved. Stage: {plot_state.get_stage().value}, Awareness: {plot_state.get_awareness():.2f}")
 
     # Return completion status
@@ -1636,6 +1441,20 @@ def _draw_minimap(screen: pygame.Surface, screen_width: int,
     screen.blit(minimap, (map_x, map_y))
 
 
+def _draw_debug_overlay(screen: pygame.Surface, font: pygame.font.Font, lines: list):
+    """Draw the debug panel (bottom-left) with one line per entry."""
+    line_height = 18
+    panel_height = len(lines) * line_height + 10
+    panel_y = screen.get_height() - panel_height - 60
+    panel_bg = pygame.Surface((240, panel_height))
+    panel_bg.set_alpha(180)
+    panel_bg.fill((20, 30, 20))
+    screen.blit(panel_bg, (5, panel_y))
+    for i, line in enumerate(lines):
+        text = font.render(line, True, (150, 255, 150))
+        screen.blit(text, (12, panel_y + 5 + i * line_height))
+
+
 def _draw_pause_menu(screen: pygame.Surface, options: list, selection: int, font: pygame.font.Font):
     """Draw the pause menu overlay."""
     # Semi-transparent dark overlay
@@ -1749,97 +1568,33 @@ def _draw_exit_menu(screen: pygame.Surface, options: list, selection: int, font:
     screen.blit(inst_text, inst_rect)
 
 
-def _get_status_panel_tab_rects(screen_width: int, screen_height: int) -> list[pygame.Rect]:
-    """Get the tab rectangles for click detection."""
-    panel_width = 650
-    panel_x = (screen_width - panel_width) // 2
-    panel_y = (screen_height - 480) // 2
-    tab_width = panel_width // 4
+def _render_items_tab(panel: StatusPanel, plot_state) -> pygame.Surface:
+    """Render the Items tab page (cached until the inventory or stage changes)."""
+    page = panel.new_page()
+    _draw_items_tab(page, 0, 0, panel.width, panel.view_height,
+                    panel.section_font, panel.item_font, panel.info_font, plot_state)
+    return page
 
-    return [
-        pygame.Rect(panel_x + i * tab_width, panel_y, tab_width, 40)
-        for i in range(4)
-    ]
 
+# Quests tab content above the quest list (each tracked quest adds a row)
+QUESTS_TAB_HEIGHT = 430
 
-def _draw_status_panel(screen: pygame.Surface, player, game_loop, font: pygame.font.Font,
-                       active_tab: int = 0, plot_state=None):
-    """Draw the tabbed status/inventory panel (Tab menu)."""
-    # Semi-transparent overlay
-    overlay_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-    overlay_surf.fill((0, 0, 0, 200))
-    screen.blit(overlay_surf, (0, 0))
 
-    # Panel dimensions
-    panel_width = 650
-    panel_height = 480
-    panel_x = (screen.get_width() - panel_width) // 2
-    panel_y = (screen.get_height() - panel_height) // 2
+def _render_quests_tab(panel: StatusPanel, game_loop, quests) -> pygame.Surface:
+    """Render the Quests tab page (cached until the phase or progress changes)."""
+    page = panel.new_page(QUESTS_TAB_HEIGHT + 24 * len(quests.tracked))
+    _draw_quests_tab(page, 0, 0, panel.width, panel.view_height,
+                     panel.section_font, panel.item_font, panel.info_font, game_loop,
+                     quests)
+    return page
 
-    # Panel background
-    panel_bg = pygame.Surface((panel_width, panel_height))
-    panel_bg.fill((20, 22, 28))
-    pygame.draw.rect(panel_bg, (80, 80, 100), (0, 0, panel_width, panel_height), 2)
-    screen.blit(panel_bg, (panel_x, panel_y))
-
-    # Fonts
-    title_font = pygame.font.Font(None, 36)
-    tab_font = pygame.font.Font(None, 28)
-    section_font = pygame.font.Font(None, 24)
-    info_font = pygame.font.Font(None, 20)
-    item_font = pygame.font.Font(None, 22)
-
-    # Draw tabs at top (clickable)
-    tab_names = ["[1] ITEMS", "[2] QUESTS", "[3] STATS", "[4] LOG"]
-    tab_width = panel_width // 4
-    for i, tab_name in enumerate(tab_names):
-        tab_x = panel_x + i * tab_width
-        tab_rect = pygame.Rect(tab_x, panel_y, tab_width, 40)
-
-        # Active tab is highlighted
-        if i == active_tab:
-            pygame.draw.rect(screen, (50, 55, 70), tab_rect)
-            pygame.draw.line(screen, (100, 150, 200), (tab_x, panel_y + 39), (tab_x + tab_width, panel_y + 39), 2)
-            text_color = (200, 220, 255)
-        else:
-            # Hover effect - check if mouse is over this tab
-            mouse_pos = pygame.mouse.get_pos()
-            if tab_rect.collidepoint(mouse_pos):
-                pygame.draw.rect(screen, (40, 42, 50), tab_rect)
-                text_color = (150, 160, 180)
-            else:
-                pygame.draw.rect(screen, (30, 32, 38), tab_rect)
-                text_color = (100, 110, 130)
-
-        tab_text = tab_font.render(tab_name, True, text_color)
-        text_x = tab_x + (tab_width - tab_text.get_width()) // 2
-        screen.blit(tab_text, (text_x, panel_y + 10))
-
-    # Content area starts below tabs
-    content_y = panel_y + 50
-    content_height = panel_height - 80
-
-    # Draw content based on active tab
-    if active_tab == 0:
-        # ITEMS TAB
-        _draw_items_tab(screen, panel_x, content_y, panel_width, content_height,
-                        section_font, item_font, info_font, plot_state)
-    elif active_tab == 1:
-        # QUESTS TAB
-        _draw_quests_tab(screen, panel_x, content_y, panel_width, content_height,
-                         section_font, item_font, info_font, game_loop)
-    elif active_tab == 2:
-        # STATS TAB
-        _draw_stats_tab(screen, panel_x, content_y, panel_width, content_height,
-                        section_font, info_font, player, game_loop, plot_state)
-    else:
-        # LOG TAB
-        _draw_log_tab(screen, panel_x, content_y, panel_width, content_height,
-                      section_font, item_font, info_font)
 
-    # Close hint at bottom
-    close_text = info_font.render("TAB/ESC: Close  |  1-4 or Arrow Keys: Switch tabs", True, (80, 90, 100))
-    screen.blit(close_text, (panel_x + panel_width // 2 - close_text.get_width() // 2, panel_y + panel_height - 22))
+def _render_stats_tab(panel: StatusPanel, player, game_loop, plot_state) -> pygame.Surface:
+    """Render the Stats tab page (cached until player stats change)."""
+    page = panel.new_page()
+    _draw_stats_tab(page, 0, 0, panel.width, panel.view_height,
+                    panel.section_font, panel.info_font, player, game_loop, plot_state)
+    return page
 
 
 def _draw_items_tab(screen, panel_x, content_y, panel_width, content_height,
@@ -1916,7 +1671,7 @@ def _draw_items_tab(screen, panel_x, content_y, panel_width, content_height,
 
 
 def _draw_quests_tab(screen, panel_x, content_y, panel_width, content_height,
-                     section_font, item_font, info_font, game_loop):
+                     section_font, item_font, info_font, game_loop, quests=None):
     """Draw the Quests tab content."""
     y = content_y + 15
 
@@ -2010,6 +1765,23 @@ def _draw_quests_tab(screen, panel_x, content_y, panel_width, content_height,
         label = info_font.render(name, True, color)
         screen.blit(label, (px + phase_step // 2 - label.get_width() // 2, y + 20))
 
+    if quests is None:
+        return
+
+    # Quests in progress (the focused one highlighted)
+    y += 60
+    screen.blit(section_font.render("QUESTS", True, (150, 180, 200)), (panel_x + 20, y))
+    y += 30
+
+    tracked = quests.get_tracked_quests()
+    if not tracked:
+        screen.blit(info_font.render("Nothing to do. For now.", True, (100, 100, 110)), (panel_x + 35, y))
+    for quest in tracked:
+        color = (200, 210, 230) if quest.id == quests.active_quest_id else (140, 150, 160)
+        text = f"{quest.title}: {quest.get_progress_text()}"
+        screen.blit(info_font.render(text, True, color), (panel_x + 35, y))
+        y += 24
+
 
 def _draw_stats_tab(screen, panel_x, content_y, panel_width, content_height,
                     section_font, info_font, player, game_loop, plot_state):
@@ -2088,51 +1860,50 @@ def _draw_stats_tab(screen, panel_x, content_y, panel_width, content_height,
         right_y += 20
 
 
-def _draw_log_tab(screen, panel_x, content_y, panel_width, content_height,
-                  section_font, item_font, info_font):
-    """Draw the Event Log tab content."""
-    from event_log import get_event_log, EventType
-
-    y = content_y + 10
+def _render_log_tab(panel: StatusPanel) -> pygame.Surface:
+    """
+    Render the Event Log tab page (cached until the next log entry).
 
-    # Title
-    screen.blit(section_font.render("EVENT LOG", True, (150, 180, 200)), (panel_x + 20, y))
+    Every in-memory entry is laid out, newest first, so the page can be
+    taller than the panel and is scrolled instead of cut off.
+    """
+    from event_log import get_event_log
 
+    section_font, info_font = panel.section_font, panel.info_font
+    panel_width = panel.width
     event_log = get_event_log()
+    blits = []  # (surface, (x, y)) laid out before the page size is known
+
+    y = 10
+
+    # Title
+    blits.append((section_font.render("EVENT LOG", True, (150, 180, 200)), (20, y)))
     count_text = info_font.render(f"({event_log.count()} entries)", True, (100, 110, 130))
-    screen.blit(count_text, (panel_x + 130, y + 3))
+    blits.append((count_text, (130, y + 3)))
 
     y += 30
 
-    # Get recent entries (newest at top)
-    entries = list(reversed(event_log.get_recent(20)))
+    # Every in-memory entry (newest at top)
+    entries = list(reversed(event_log.get_recent(event_log.max_entries)))
 
     if not entries:
-        screen.blit(info_font.render("No events recorded yet.", True, (100, 100, 110)), (panel_x + 30, y))
-        screen.blit(info_font.render("Talk to NPCs and listen to the narrator.", True, (80, 90, 100)), (panel_x + 30, y + 22))
-        return
+        blits.append((info_font.render("No events recorded yet.", True, (100, 100, 110)), (30, y)))
+        blits.append((info_font.render("Talk to NPCs and listen to the narrator.", True, (80, 90, 100)), (30, y + 22)))
 
-    # Calculate available space for entries
-    entry_area_height = content_height - 50
-    max_line_width = panel_width - 60
     line_height = 18
 
-    # Draw entries
     for entry in entries:
-        if y > content_y + entry_area_height:
-            break
-
         # Get prefix and color based on event type
         prefix = entry.get_prefix()
         color = entry.get_color()
 
         # Render prefix
         prefix_surf = info_font.render(prefix, True, color)
-        screen.blit(prefix_surf, (panel_x + 25, y))
+        blits.append((prefix_surf, (25, y)))
 
         # Render text (may need wrapping)
-        text_x = panel_x + 25 + prefix_surf.get_width() + 8
-        text_max_width = panel_x + panel_width - 25 - text_x
+        text_x = 25 + prefix_surf.get_width() + 8
+        text_max_width = panel_width - 25 - text_x
 
         # Simple word wrap
         text = entry.text
@@ -2153,75 +1924,71 @@ def _draw_log_tab(screen, panel_x, content_y, panel_width, content_height,
             if current_line:
                 lines.append(current_line)
 
-            # Draw first line
-            if lines:
-                text_surf = info_font.render(lines[0], True, (180, 185, 195))
-                screen.blit(text_surf, (text_x, y))
+            # First line, then continuation lines (dimmer)
+            for i, line in enumerate(lines):
+                line_color = (180, 185, 195) if i == 0 else (160, 165, 175)
+                blits.append((info_font.render(line, True, line_color), (text_x, y)))
                 y += line_height
-
-                # Draw continuation lines (indented)
-                for line in lines[1:]:
-                    if y > content_y + entry_area_height:
-                        break
-                    text_surf = info_font.render(line, True, (160, 165, 175))
-                    screen.blit(text_surf, (text_x, y))
-                    y += line_height
         else:
             # Just render truncated
             truncated = text[:40] + "..." if len(text) > 40 else text
-            text_surf = info_font.render(truncated, True, (180, 185, 195))
-            screen.blit(text_surf, (text_x, y))
+            blits.append((info_font.render(truncated, True, (180, 185, 195)), (text_x, y)))
             y += line_height
 
         # Small gap between entries
         y += 4
 
-    # Legend at bottom
-    legend_y = content_y + content_height - 25
+    # Legend at the bottom of the page (at least at the bottom of the panel)
+    legend_y = max(y + 10, panel.view_height - 25)
     legend_items = [
         ("[Guide]", (180, 160, 120)),
         ("[NPC]", (120, 180, 220)),
         ("[Quest]", (100, 200, 100)),
         ("[Found]", (200, 150, 255)),
     ]
-    legend_x = panel_x + 25
+    legend_x = 25
     for label, color in legend_items:
         surf = info_font.render(label, True, color)
-        screen.blit(surf, (legend_x, legend_y))
+        blits.append((surf, (legend_x, legend_y)))
         legend_x += surf.get_width() + 20
 
+    page = panel.new_page(legend_y + 25)
+    for surf, pos in blits:
+        page.blit(surf, pos)
+    return page
+
 
-def _register_npcs_with_overlay(overlay, npcs, plot_state):
-    """Register all NPCs with the overlay's NPC dialogue system."""
+def _prepare_overlay_npc(profile: NPCProfile, stage) -> dict:
+    """
+    Work out the overlay.create_npc() arguments for one NPC profile.
+
+    Touches no overlay state, so NPCRegistry can run it off-thread.
+    """
     from game.plot_state import HorrorStage
 
-    for npc in npcs:
-        npc_id = f"npc_{id(npc)}"
-        archetype = NPC_TYPE_TO_ARCHETYPE.get(npc.type, "civilian")
-        traits = list(NPC_TYPE_TO_TRAITS.get(npc.type, []))
-
-        # Add stage-dependent traits
-        stage = plot_state.get_stage()
-        if stage == HorrorStage.LATE:
-            if "knowing" not in traits:
-                traits.append("paranoid")
-        elif stage == HorrorStage.FINALE:
-            traits = ["corrupted", "glitching"]
-
-        # Generate backstory based on type
-        backstory = _generate_backstory(npc.type)
-        secret = _generate_secret(npc.type, stage)
-
-        # Create NPC in overlay system
-        overlay.create_npc(
-            npc_id=npc_id,
-            name=_generate_name(npc.type),
-            archetype=archetype,
-            horror_traits=traits,
-            backstory=backstory,
-            secret=secret,
-            voice_enabled=False,
-        )
+    archetype = NPC_TYPE_TO_ARCHETYPE.get(profile.npc_type, "civilian")
+    traits = list(NPC_TYPE_TO_TRAITS.get(profile.npc_type, []))
+
+    # Add stage-dependent traits
+    if stage == HorrorStage.LATE:
+        if "knowing" not in traits:
+            traits.append("paranoid")
+    elif stage == HorrorStage.FINALE:
+        traits = ["corrupted", "glitching"]
+
+    # Generate backstory based on type
+    backstory = _generate_backstory(profile.npc_type)
+    secret = _generate_secret(profile.npc_type, stage)
+
+    return dict(
+        npc_id=profile.npc_id,
+        name=_generate_name(profile),
+        archetype=archetype,
+        horror_traits=traits,
+        backstory=backstory,
+        secret=secret,
+        voice_enabled=False,
+    )
 
 
 # Name pools for unique generation
@@ -2238,95 +2005,60 @@ _CIVILIAN_NAME = ["Martha", "Tom", "Sarah", "Jim", "Mary", "Pete", "Agnes", "Wal
                   "Earl", "Ruth", "Harold", "Dorothy", "George", "Helen", "Charles", "Margaret"]
 
 
-def _generate_name(npc_type):
-    """Generate a unique random name for NPC type."""
+def _generate_name(profile: NPCProfile):
+    """
+    Generate a unique name for an NPC profile from its seed.
+
+    The first call picks the first candidate not already used and records
+    which one it was, so later calls (stage changes) give the same name.
+    """
+    rng = profile.rng()
     max_attempts = 30
 
-    for _ in range(max_attempts):
-        if npc_type == "criminal":
-            name = f"{random.choice(_CRIMINAL_FIRST)} {random.choice(_CRIMINAL_NICK)}"
-        elif npc_type == "police":
-            name = f"{random.choice(_POLICE_RANK)} {random.choice(_POLICE_LAST)}"
+    for attempt in range(max_attempts):
+        if profile.npc_type == "criminal":
+            name = f"{rng.choice(_CRIMINAL_FIRST)} {rng.choice(_CRIMINAL_NICK)}"
+        elif profile.npc_type == "police":
+            name = f"{rng.choice(_POLICE_RANK)} {rng.choice(_POLICE_LAST)}"
         else:
-            name = f"{random.choice(_CIVILIAN_FIRST)} {random.choice(_CIVILIAN_NAME)}"
+            name = f"{rng.choice(_CIVILIAN_FIRST)} {rng.choice(_CIVILIAN_NAME)}"
 
-        if name not in _USED_NAMES:
+        if attempt == profile.name_draw:
+            return name
+        if profile.name_draw < 0 and name not in _USED_NAMES:
             _USED_NAMES.add(name)
+            profile.name_draw = attempt
             return name
 
-    fallback = f"Unknown #{len(_USED_NAMES) + 1}"
-    _USED_NAMES.add(fallback)
-    return fallback
+    profile.name_draw = max_attempts
+    return f"Unknown #{profile.index + 1}"
 
 
-def _do_attack(player, all_npcs, overlay, game_loop, narrator_queue):
+def _restore_found_items(plot_state, item_ids: list, get_item) -> list:
     """
-    Handle attack action - damages nearby NPCs.
-
-    Returns dict with attack info for police pursuit system:
-        - attacked: bool - whether any NPC was hit
-        - attacked_police: bool - whether police were attacked
-        - attacked_civilian: bool - whether civilians were attacked
-        - attacked_criminal: bool - whether criminals were attacked
-        - fatal: bool - whether anyone was knocked out
+    Add journaled items back to the plot state's inventory.
+
+    Returns:
+        The journal to keep appending to (the items stay journaled until
+        plot_state.save() has written them).
     """
-    attack_range = 60
-    result = {
-        "attacked": False,
-        "attacked_police": False,
-        "attacked_civilian": False,
-        "attacked_criminal": False,
-        "fatal": False,
-    }
-
-    for npc in all_npcs:
-        if npc.in_jail:
-            continue
-        dx = npc.x - player.x
-        dy = npc.y - player.y
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist < attack_range:
-            npc.health -= 25
-            result["attacked"] = True
-
-            # Track what type was attacked
-            if npc.type == "police":
-                result["attacked_police"] = True
-            elif npc.type == "civilian":
-                result["attacked_civilian"] = True
-            elif npc.type == "criminal":
-                result["attacked_criminal"] = True
-
-            # Attacking reduces karma (more for police/civilians)
-            if npc.type == "police":
-                player.karma -= 10
-            elif npc.type == "civilian":
-                player.karma -= 5
-            else:  # criminal
-                player.karma -= 1
-
-            # Witnesses lose trust (permanent damage)
-            npc.trust = max(-100, npc.trust - 30)
-
-            # Mark NPC as having been attacked by player (for memory)
-            if not hasattr(npc, 'attacked_by_player'):
-                npc.attacked_by_player = 0
-            npc.attacked_by_player += 1
-
-            if npc.health <= 0:
-                npc.in_jail = True  # "Knocked out" - removed from play
-                result["fatal"] = True
-                overlay.notifications.show_glitch("They fall.", 1.5, "top_right")
-                game_loop.on_player_attacked(npc.type, fatal=True)
-            else:
-                game_loop.on_player_attacked(npc.type, fatal=False)
+    for item_id in item_ids:
+        item = get_item(item_id)
+        if item:
+            plot_state.inventory.add(item)
+    return list(item_ids)
+
+
+def _present_attack(attack_result, pursuit, overlay, narrator_queue):
+    """Show and narrate the outcome of CitySimulation.attack()."""
+    if attack_result["fatal"]:
+        overlay.notifications.show_glitch("They fall.", 1.5, "top_right")
 
-    if result["attacked"]:
+    if attack_result["attacked"]:
         # Choose narrator line based on target type
-        if result["attacked_police"]:
+        if attack_result["attacked_police"]:
             lines = VIOLENCE_NARRATOR_LINES.get("attack_police", [])
-        elif result["attacked_civilian"]:
+        elif attack_result["attacked_civilian"]:
             lines = VIOLENCE_NARRATOR_LINES.get("attack_civilian", [])
         else:
             lines = VIOLENCE_NARRATOR_LINES.get("attack_criminal", [])
@@ -2336,7 +2068,16 @@ def _do_attack(player, all_npcs, overlay, game_loop, narrator_queue):
     else:
         overlay.notifications.show_glitch("Nothing to hit.", 1.0, "center")
 
-    return result
+    # Notify about wanted status changes
+    event = attack_result["wanted_event"]
+    if event:
+        lines = VIOLENCE_NARRATOR_LINES.get(event, [])
+        if lines:
+            narrator_queue.queue_line(random.choice(lines))
+    if event == "police_alerted":
+        overlay.notifications.show_glitch(
+            f"WANTED - Level {int(pursuit.wanted_level)}", 2.0, "top_right"
+        )
 
 
 def _generate_backstory(npc_type):
@@ -2403,166 +2144,18 @@ def _get_situation(npc: CityNPC, player: CityPlayer, plot_state):
     return "greeting"
 
 
-def _update_police_pursuit(dt, player, police, player_wanted, wanted_level,
-                            pursuing_police, player_in_jail, jail_timer,
-                            violence_cooldown, special_buildings, overlay,
-                            narrator_queue):
-    """
-    Update police pursuit system.
-
-    Returns updated tuple: (player_wanted, wanted_level, pursuing_police,
-                           player_in_jail, jail_timer, violence_cooldown)
-    """
-    # Decay violence cooldown
-    if violence_cooldown > 0:
-        violence_cooldown -= dt
-    else:
-        # Slowly decay wanted level when not actively violent
-        if wanted_level > 0 and not pursuing_police:
-            wanted_level = max(0, wanted_level - dt * 0.1)
-            if wanted_level == 0:
-                player_wanted = False
-
-    # Handle jail time
-    if player_in_jail:
-        jail_timer -= dt
-        if jail_timer <= 0:
-            # Release from jail
-            player_in_jail = False
-            jail_timer = 0
-            player_wanted = False
-            wanted_level = 0
-            pursuing_police = []
-
-            # Teleport player out of jail
-            if special_buildings and special_buildings.jail:
-                jail = special_buildings.jail
-                player.x = jail.x + jail.width + 50
-                player.y = jail.y + jail.height // 2
-
-            # Narrator comment on release
-            lines = VIOLENCE_NARRATOR_LINES.get("jail_release", [])
-            if lines:
-                narrator_queue.queue_line(random.choice(lines))
-
-            overlay.notifications.show_glitch("Released.", 2.0, "center")
-
-        return (player_wanted, wanted_level, pursuing_police,
-                player_in_jail, jail_timer, violence_cooldown)
-
-    # Update pursuing police
-    if player_wanted and not player_in_jail:
-        # Find nearby police to join pursuit
-        pursuit_range = 300 + wanted_level * 100  # Higher wanted = wider detection
-        for cop in police:
-            if cop.in_jail:
-                continue
-            dx = cop.x - player.x
-            dy = cop.y - player.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            # Add to pursuit if in range and not already pursuing
-            if dist < pursuit_range and cop not in pursuing_police:
-                pursuing_police.append(cop)
-
-        # Police chase player
-        catch_distance = 35
-        for cop in pursuing_police[:]:  # Copy for safe removal
-            if cop.in_jail:
-                pursuing_police.remove(cop)
-                continue
-
-            # Move toward player (faster than normal)
-            dx = player.x - cop.x
-            dy = player.y - cop.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist > 0:
-                # Police move faster when pursuing (based on wanted level)
-                speed = 2.5 + wanted_level * 0.5
-                cop.x += (dx / dist) * speed
-                cop.y += (dy / dist) * speed
-
-            # Check if caught
-            if dist < catch_distance:
-                # Player caught!
-                player_in_jail = True
-                jail_timer = 10.0 + wanted_level * 5.0  # 10-25 seconds based on crimes
-
-                # Teleport to jail
-                if special_buildings and special_buildings.jail:
-                    jail = special_buildings.jail
-                    player.x = jail.x + jail.width // 2
-                    player.y = jail.y + jail.height // 2
-
-                # Narrator comment
-                lines = VIOLENCE_NARRATOR_LINES.get("player_arrested", [])
-                if lines:
-                    narrator_queue.queue_line(random.choice(lines))
-
-                overlay.notifications.show_glitch(
-                    f"ARRESTED - {int(jail_timer)}s", 3.0, "center"
-                )
-
-                # Reset pursuit
-                pursuing_police = []
-                break
-
-    return (player_wanted, wanted_level, pursuing_police,
-            player_in_jail, jail_timer, violence_cooldown)
-
-
-def _handle_attack_consequences(attack_result, player, police, player_wanted,
-                                  wanted_level, pursuing_police, violence_cooldown,
-                                  total_attacks, overlay, narrator_queue):
-    """
-    Handle consequences of player attack.
+def _present_pursuit_event(event, pursuit, overlay, narrator_queue):
+    """Show and narrate an arrest or release from StepResult.pursuit_event."""
+    lines = VIOLENCE_NARRATOR_LINES.get(event, [])
+    if lines:
+        narrator_queue.queue_line(random.choice(lines))
 
-    Returns updated tuple: (player_wanted, wanted_level, pursuing_police,
-                           violence_cooldown, total_attacks)
-    """
-    if not attack_result["attacked"]:
-        return (player_wanted, wanted_level, pursuing_police,
-                violence_cooldown, total_attacks)
-
-    total_attacks += 1
-    violence_cooldown = 30.0  # Reset cooldown on violence
-
-    # Increase wanted level based on target
-    if attack_result["attacked_police"]:
-        # Attacking police is very bad
-        wanted_level = min(3, wanted_level + 1.5)
-        player_wanted = True
-    elif attack_result["attacked_civilian"]:
-        # Attacking civilians alerts police
-        wanted_level = min(3, wanted_level + 0.75)
-        if wanted_level >= 0.5:
-            player_wanted = True
-    else:
-        # Attacking criminals - police don't care as much
-        wanted_level = min(3, wanted_level + 0.25)
-
-    # Fatal attacks escalate further
-    if attack_result["fatal"]:
-        wanted_level = min(3, wanted_level + 0.5)
-
-    # Notify about wanted status changes
-    if player_wanted and not pursuing_police:
-        # Start pursuit
-        lines = VIOLENCE_NARRATOR_LINES.get("police_alerted", [])
-        if lines:
-            narrator_queue.queue_line(random.choice(lines))
+    if event == "player_arrested":
         overlay.notifications.show_glitch(
-            f"WANTED - Level {int(wanted_level)}", 2.0, "top_right"
+            f"ARRESTED - {int(pursuit.jail_timer)}s", 3.0, "center"
         )
-    elif wanted_level >= 2 and len(pursuing_police) < 3:
-        # Escalation
-        lines = VIOLENCE_NARRATOR_LINES.get("wanted_escalation", [])
-        if lines:
-            narrator_queue.queue_line(random.choice(lines))
-
-    return (player_wanted, wanted_level, pursuing_police,
-            violence_cooldown, total_attacks)
+    elif event == "jail_release":
+        overlay.notifications.show_glitch("Released.", 2.0, "center")
 
 
 # Exit codes for launcher integration
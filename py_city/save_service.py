@@ -0,0 +1,192 @@
+"""
+Background Save Service for Py City
+===================================
+
+Takes save requests from the game thread and does the actual writing on a
+background thread, so saving never costs frame time.
+
+Features:
+- Snapshot requests keyed by section ("quests", "found_items", ...); bursts
+  coalesce and only the latest snapshot per section is written
+- Snapshots are plain data built on the game thread, so the save thread
+  never reads live game state
+- At most one write per interval (flush() forces one, e.g. on exit)
+- Atomic writes: temp file + fsync + rename, so a crash mid-write leaves
+  the previous save intact
+- Compact versioned format: magic, schema version, CRC32, zlib-compressed
+  JSON body
+
+File layout (little-endian):
+    header: magic "PCSV", schema version u16, body CRC32 u32
+    body:   zlib(compact JSON object of sections)
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+
+# Environment variable that overrides where run_wrapped.run() saves progress
+SAVE_ENV_VAR = "PY_CITY_SAVE"
+
+# Default save file, next to the game
+DEFAULT_SAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "progress.sav")
+
+MAGIC = b"PCSV"
+SAVE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHI")
+
+
+def write_save(path: str, sections: dict, version: int = SAVE_VERSION):
+    """Atomically write sections to path (temp file + rename)."""
+    body = zlib.compress(json.dumps(sections, separators=(",", ":")).encode("utf-8"), 6)
+    header = _HEADER.pack(MAGIC, version, zlib.crc32(body))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_save(path: str) -> dict:
+    """
+    Read a save written by write_save().
+
+    Raises:
+        ValueError: Not a save file, unsupported version or corrupt body.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is too short to be a save file")
+    magic, version, crc = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a Py City save")
+    if version != SAVE_VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+
+    body = data[_HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise ValueError(f"{path} is corrupt (checksum mismatch)")
+    return json.loads(zlib.decompress(body))
+
+
+class SaveService:
+    """Coalescing, rate-limited, atomic background saver."""
+
+    def __init__(self, path: str, interval: float = 2.0):
+        """
+        Args:
+            path: Save file for snapshot sections (existing sections are
+                loaded and kept)
+            interval: Minimum seconds between writes
+        """
+        self.path = path
+        self.interval = interval
+        self.writes = 0       # Completed write passes
+        self.requests = 0     # Requests received (>= writes when coalescing)
+        self.last_error: Optional[Exception] = None
+
+        self._sections: dict = {}  # Everything written so far
+        if os.path.exists(path):
+            try:
+                self._sections = read_save(path)
+            except (OSError, ValueError) as e:
+                self.last_error = e
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, dict] = {}
+        self._next_write = 0.0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-service", daemon=True)
+        self._thread.start()
+
+    def request(self, section: str, snapshot: dict):
+        """
+        Queue a snapshot for a save section (replaces any unwritten one).
+
+        The snapshot must not be mutated afterwards - build a fresh dict.
+        """
+        with self._cond:
+            self._pending[section] = snapshot
+            self.requests += 1
+            self._cond.notify()
+
+    def get_section(self, section: str) -> Optional[dict]:
+        """Get the latest snapshot for a section (pending or saved)."""
+        with self._cond:
+            if section in self._pending:
+                return self._pending[section]
+            return self._sections.get(section)
+
+    def _run(self):
+        """Save thread: wait for requests, honor the interval, write."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return  # Closed with nothing left to write
+
+                delay = self._next_write - time.monotonic()
+                if delay > 0 and not (self._flush_requested or self._closed):
+                    # Let more requests coalesce until the interval is up
+                    self._cond.wait(delay)
+                    continue
+
+                pending, self._pending = self._pending, {}
+                self._flush_requested = False
+                self._writing = True
+
+            self._write(pending)
+
+            with self._cond:
+                self._writing = False
+                self._next_write = time.monotonic() + self.interval
+                self.writes += 1
+                self._cond.notify_all()
+
+    def _write(self, pending: Dict[str, dict]):
+        """Write snapshot sections (errors are kept, not raised)."""
+        self._sections.update(pending)
+        try:
+            write_save(self.path, self._sections)
+        except OSError as e:
+            self.last_error = e
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Write everything pending now, ignoring the interval.
+
+        Returns:
+            True if the queue drained within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        """Flush pending saves and stop the save thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
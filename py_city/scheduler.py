@@ -0,0 +1,121 @@
+"""
+Timer Scheduler for Py City
+===========================
+
+One place for "wake me up in N seconds". Entities that go idle (an NPC
+pausing between paths, an animal standing still) register a callback and
+drop out of the per-frame update until it fires, so a frame costs time in
+proportion to the timers that fire, not to the number of idle entities.
+
+Features:
+- Binary heap of deadlines; advance(dt) pops only what is due
+- Ties fire in scheduling order, so replays stay deterministic
+- O(1) cancel (lazy); cancelled entries are compacted once they dominate
+- Timers scheduled from inside a callback fire on a later advance, never
+  in the same one (same as a countdown that starts next frame)
+"""
+
+import heapq
+from typing import Callable, List, Optional
+
+
+class Timer:
+    """Handle for a scheduled callback (pass to cancel / time_left)."""
+
+    __slots__ = ("deadline", "seq", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, seq: int, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other: "Timer") -> bool:
+        if self.deadline != other.deadline:
+            return self.deadline < other.deadline
+        return self.seq < other.seq
+
+
+class TimerScheduler:
+    """Heap-based one-shot timers driven by simulation time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.fired = 0  # Callbacks run so far (for tests / debug overlay)
+        self._heap: List[Timer] = []
+        self._seq = 0
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        """Number of live (not cancelled) timers."""
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """
+        Call callback(*args) once `delay` seconds of simulation time pass.
+
+        Returns:
+            Handle for cancel() / time_left().
+        """
+        timer = Timer(self.now + delay, self._seq, callback, args)
+        self._seq += 1
+        heapq.heappush(self._heap, timer)
+        return timer
+
+    def cancel(self, timer: Optional[Timer]):
+        """Cancel a pending timer (None and already-fired timers are ignored)."""
+        if timer is None or timer.cancelled or timer.callback is None:
+            return
+        timer.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [t for t in self._heap if not t.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def time_left(self, timer: Optional[Timer]) -> float:
+        """Seconds until a timer fires (0.0 if it is None, fired or cancelled)."""
+        if timer is None or timer.cancelled or timer.callback is None:
+            return 0.0
+        return max(0.0, timer.deadline - self.now)
+
+    def advance(self, dt: float) -> int:
+        """
+        Move time forward and run every callback that is now due.
+
+        Returns:
+            Number of callbacks run.
+        """
+        self.now += dt
+        heap = self._heap
+        first_new = self._seq  # Timers scheduled by callbacks wait a frame
+        deferred = []
+        count = 0
+
+        while heap and heap[0].deadline <= self.now:
+            timer = heapq.heappop(heap)
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            if timer.seq >= first_new:
+                deferred.append(timer)
+                continue
+            callback, args = timer.callback, timer.args
+            timer.callback = None  # Marks the handle as fired
+            timer.args = ()
+            callback(*args)
+            count += 1
+
+        for timer in deferred:
+            heapq.heappush(heap, timer)
+
+        self.fired += count
+        return count
+
+    def clear(self):
+        """Drop every pending timer."""
+        for timer in self._heap:
+            timer.cancelled = True
+        self._heap.clear()
+        self._cancelled = 0
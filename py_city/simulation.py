@@ -0,0 +1,1085 @@
+"""
+City Simulation for Py City
+===========================
+
+Headless core of the city: owns the world state and advances it one step at
+a time without touching the display. The pygame front-end in run_wrapped
+reads this state to render and feeds player input into it.
+
+Features:
+- City map, day/night cycle and weather
+- Player and sidewalk-pathfinding NPCs (criminals, police, civilians)
+- Crime simulation, game loop phases and corruption
+- Vehicles, animals, special buildings and investigation clues
+- Fixed-timestep stepping for tests, benchmarks and replays
+- Idle NPCs and animals wait on a shared timer scheduler instead of
+  being visited every frame
+- NPC path searches go through a PathPlanner (optionally on worker
+  threads); an NPC keeps waiting until its path arrives
+- Shared flow field toward the player for pursuit and fleeing
+- Player actions (movement with corruption drift, alignment, crime
+  interventions, talking, attacks) and the police pursuit they trigger,
+  so live play and replays change the world the same way
+- Quest progress: world events are queued on the QuestManager and flushed
+  once per step, with karma/trust rewards applied here
+- Optional per-subsystem timing for profiling
+"""
+
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from city_map import Camera, CityConfig, CityMap, CityBlock, WeatherSystem, DayNightCycle
+from game_loop import GameLoopManager, GamePhase, Crime, CrimeSimulation, NarratorQueue
+from corruption import CorruptionManager
+from quest_system import Quest, QuestManager
+from scheduler import Timer, TimerScheduler
+from npc_engine import NPCMovementEngine, IN_JAIL, IN_BUILDING
+from path_planner import PathPlanner
+from flow_field import FlowField
+from decorations import get_decorations
+from rng import (
+    RNGService, STREAM_CITY, STREAM_WEATHER, STREAM_CRIME, STREAM_CORRUPTION,
+    STREAM_ANIMALS, STREAM_NPCS, STREAM_VEHICLES, STREAM_PHASES, STREAM_CLUES, get_rng
+)
+from city_entities import (
+    VehicleManager, AnimalManager, SpecialBuildingManager,
+    InvestigationManager, RoadNetwork, Clue
+)
+
+
+# Fleeing NPCs (civilians near an attack, criminals the player is chasing)
+FLEE_SPEED = 2.5  # px per frame at 60 FPS, same as a pursuing cop
+FLEE_TIME = 4.0  # Seconds a scare lasts
+WITNESS_RADIUS = 150  # Civilians this close to an attack run
+CHASE_FLEE_RADIUS = 250  # Chased criminals run while the player is this close
+
+# Player actions
+ATTACK_RANGE = 60
+ATTACK_DAMAGE = 25
+INTERVENE_RADIUS = 200  # NPCs this close see the player help or join a crime
+
+# Police pursuit (violence consequences)
+CATCH_DISTANCE = 35
+VIOLENCE_COOLDOWN = 30.0  # Seconds after an attack before the wanted level decays
+
+# Status dot colors
+CRIME_DOT_COLOR = (255, 255, 0)
+TRUST_DOT_COLOR = (100, 200, 255)
+HIGH_TRUST_DOT_COLOR = (150, 255, 150)
+
+
+# =============================================================================
+# CHARACTERS
+# =============================================================================
+
+class CityNPC:
+    """
+    NPC that navigates the city using sidewalk pathfinding.
+
+    Position, current waypoint and the jail/building flags live in a row of
+    an NPCMovementEngine; the NPC is a view over that row. CitySimulation
+    shares one engine between all NPCs and steps them together.
+    """
+
+    # Slotted: NPC count scales with city size. attacked_by_player is set
+    # lazily by attack() (hasattr checks rely on it starting unset).
+    __slots__ = (
+        "rng", "engine", "row", "sprite", "type", "city_map",
+        "health", "jail_timer", "committed_crime",
+        "breaking_in", "trust", "times_helped", "has_secret", "secret_revealed",
+        "path", "path_index", "wait_timer", "flee_timer", "attacked_by_player",
+    )
+
+    # Same for every NPC, so kept on the class rather than per instance
+    size = 35
+    speed = 1.5
+
+    def __init__(self, x: float, y: float, sprite: pygame.Surface,
+                 npc_type: str, city_map: CityMap, rng: random.Random = None,
+                 engine: NPCMovementEngine = None):
+        self.rng = rng or get_rng().stream(STREAM_NPCS)
+        self.engine = engine or NPCMovementEngine(capacity=1)
+        self.row = self.engine.add(x, y, self.speed, owner=self)
+        self.sprite = sprite
+        self.type = npc_type
+        self.city_map = city_map
+
+        # State
+        self.health = 100
+        self.jail_timer = 600
+        self.committed_crime = False
+        self.breaking_in = False
+
+        # Trust/Hope system
+        self.trust = 0  # -100 to 100, starts neutral
+        self.times_helped = 0  # Track how many times player helped them
+        self.has_secret = self.rng.random() < 0.3  # 30% chance NPC has a secret to share
+        self.secret_revealed = False
+
+        # Pathfinding
+        self.path = []
+        self.path_index = 0
+        self.wait_timer = self.rng.uniform(0.5, 3.0)  # Stagger initial movement
+        self.flee_timer = 0.0  # Running from the player while > 0
+
+    @property
+    def x(self) -> float:
+        return self.engine.x[self.row]
+
+    @x.setter
+    def x(self, value: float):
+        self.engine.x[self.row] = value
+
+    @property
+    def y(self) -> float:
+        return self.engine.y[self.row]
+
+    @y.setter
+    def y(self, value: float):
+        self.engine.y[self.row] = value
+
+    @property
+    def in_jail(self) -> bool:
+        return self.engine.has_flag(self.row, IN_JAIL)
+
+    @in_jail.setter
+    def in_jail(self, value: bool):
+        self.engine.set_flag(self.row, IN_JAIL, value)
+
+    @property
+    def in_building(self) -> bool:
+        return self.engine.has_flag(self.row, IN_BUILDING)
+
+    @in_building.setter
+    def in_building(self, value: bool):
+        self.engine.set_flag(self.row, IN_BUILDING, value)
+
+    def walk_to_next_waypoint(self) -> bool:
+        """
+        Point the engine row at path[path_index].
+
+        Returns:
+            False if the path is used up (the row stops walking).
+        """
+        if self.path_index < len(self.path):
+            target_x, target_y = self.path[self.path_index]
+            self.engine.set_target(self.row, target_x, target_y)
+            return True
+        self.engine.stop(self.row)
+        return False
+
+    def choose_destination(self) -> Optional[tuple]:
+        """Pick a random sidewalk node to walk to (None if there are none)."""
+        if self.city_map.sidewalk_nodes:
+            dest_node = self.rng.choice(self.city_map.sidewalk_nodes)
+            return dest_node.x, dest_node.y
+        return None
+
+    def draw(self, screen: pygame.Surface, camera: Camera, shadow: bool = True):
+        """Draw NPC with shadow and health bar (shadow off at low quality)."""
+        screen_x, screen_y = camera.apply(self.x, self.y)
+
+        # Skip if off screen
+        if (screen_x < -self.size or screen_x > camera.screen_width + self.size or
+            screen_y < -self.size or screen_y > camera.screen_height + self.size):
+            return
+
+        decorations = get_decorations()
+
+        # Draw shadow (ellipse under character)
+        if shadow:
+            shadow_surf, (offset_x, offset_y) = decorations.shadow(self.size, 60)
+            screen.blit(shadow_surf, (screen_x + offset_x, screen_y + offset_y))
+
+        # Draw sprite
+        screen.blit(self.sprite, (screen_x, screen_y))
+
+        # Health bar
+        screen.blit(decorations.health_bar(self.size, 4, self.health), (screen_x, screen_y - 8))
+
+        # Crime indicator
+        if self.breaking_in or self.committed_crime:
+            screen.blit(decorations.dot(CRIME_DOT_COLOR, 5),
+                        (int(screen_x + self.size / 2) - 5, int(screen_y + self.size / 2) - 5))
+
+        # Trust indicator (shows when trust > 0)
+        if self.trust > 0:
+            trust_color = TRUST_DOT_COLOR if self.trust < 50 else HIGH_TRUST_DOT_COLOR
+            screen.blit(decorations.dot(trust_color, 3),
+                        (int(screen_x + self.size - 5) - 3, int(screen_y + 5) - 3))
+
+    def increase_trust(self, amount: int = 20):
+        """Increase NPC trust level."""
+        self.trust = min(100, self.trust + amount)
+        self.times_helped += 1
+
+    def get_dialogue_tier(self) -> str:
+        """Get dialogue tier based on trust level."""
+        if self.trust < 20:
+            return "suspicious"
+        elif self.trust < 50:
+            return "neutral"
+        elif self.trust < 80:
+            return "friendly"
+        else:
+            return "trusting"
+
+    def can_reveal_secret(self) -> bool:
+        """Check if NPC can reveal their secret."""
+        return self.has_secret and not self.secret_revealed and self.trust >= 60
+
+
+class CityPlayer:
+    """
+    Player that moves in the city with camera tracking.
+
+    Health, karma and alignment are properties: changing one calls
+    on_stats_changed (the status panel re-renders its Stats tab from it).
+    """
+
+    def __init__(self, x: float, y: float, sprite: pygame.Surface,
+                 world_width: int, world_height: int):
+        self.on_stats_changed: Optional[Callable[[], None]] = None
+        self.x = x
+        self.y = y
+        self.size = 35
+        self.speed = 5
+        self.sprite = sprite
+        self._health = 100
+        self._karma = 0
+        self._alignment = "neutral"
+        self.world_width = world_width
+        self.world_height = world_height
+
+    def _stat_changed(self):
+        if self.on_stats_changed:
+            self.on_stats_changed()
+
+    @property
+    def health(self):
+        return self._health
+
+    @health.setter
+    def health(self, value):
+        if value != self._health:
+            self._health = value
+            self._stat_changed()
+
+    @property
+    def karma(self):
+        return self._karma
+
+    @karma.setter
+    def karma(self, value):
+        if value != self._karma:
+            self._karma = value
+            self._stat_changed()
+
+    @property
+    def alignment(self) -> str:
+        return self._alignment
+
+    @alignment.setter
+    def alignment(self, value: str):
+        if value != self._alignment:
+            self._alignment = value
+            self._stat_changed()
+
+    def move(self, dx: int, dy: int, city_map: CityMap, dt: float):
+        """Move with collision detection and wraparound edges."""
+        move_speed = self.speed * dt * 60
+
+        new_x = self.x + dx * move_speed
+        new_y = self.y + dy * move_speed
+
+        # Check collision
+        new_rect = pygame.Rect(new_x, new_y, self.size, self.size)
+        if not city_map.is_colliding(new_rect):
+            # Wraparound edges (Pac-Man style)
+            if new_x < 0:
+                self.x = self.world_width - self.size
+            elif new_x > self.world_width - self.size:
+                self.x = 0
+            else:
+                self.x = new_x
+
+            if new_y < 0:
+                self.y = self.world_height - self.size
+            elif new_y > self.world_height - self.size:
+                self.y = 0
+            else:
+                self.y = new_y
+
+    def draw(self, screen: pygame.Surface, camera: Camera):
+        """Draw player with shadow and health bar."""
+        screen_x, screen_y = camera.apply(self.x, self.y)
+
+        decorations = get_decorations()
+
+        # Draw shadow (ellipse under character)
+        shadow_surf, (offset_x, offset_y) = decorations.shadow(self.size, 80)
+        screen.blit(shadow_surf, (screen_x + offset_x, screen_y + offset_y))
+
+        # Draw sprite
+        screen.blit(self.sprite, (screen_x, screen_y))
+
+        # Health bar
+        screen.blit(decorations.health_bar(self.size, 5, self.health), (screen_x, screen_y - 10))
+
+    def change_alignment(self, alignment: str):
+        self.alignment = alignment
+
+    def interact(self, npcs, radius: float = 50) -> 'CityNPC':
+        """Find nearby NPC to interact with."""
+        for npc in npcs:
+            dx = npc.x - self.x
+            dy = npc.y - self.y
+            if math.sqrt(dx * dx + dy * dy) < radius:
+                return npc
+        return None
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+# Fallback sprite colors when the PNGs can't be loaded
+FALLBACK_SPRITE_COLORS = {
+    "player": (0, 200, 0),
+    "criminal": (200, 0, 0),
+    "police": (0, 0, 200),
+    "civilian": (200, 200, 0),
+}
+
+
+def make_fallback_sprites(size: tuple = (45, 45)) -> Dict[str, pygame.Surface]:
+    """Create solid-color sprites for the player and each NPC type."""
+    sprites = {}
+    for name, color in FALLBACK_SPRITE_COLORS.items():
+        sprite = pygame.Surface(size)
+        sprite.fill(color)
+        sprites[name] = sprite
+    return sprites
+
+
+@dataclass
+class StepResult:
+    """Events produced by one simulation step, for the front-end to present."""
+    crime_events: List[str] = field(default_factory=list)
+    clue: Optional[Clue] = None
+    time_event: Optional[str] = None
+    weather_event: Optional[str] = None
+    pursuit_event: Optional[str] = None  # "player_arrested" or "jail_release"
+    completed_quests: List[Quest] = field(default_factory=list)
+
+
+@dataclass
+class PursuitState:
+    """Police response to the player's violence."""
+    wanted: bool = False  # Is the player being pursued by police?
+    wanted_level: float = 0.0  # 0-3: higher = more aggressive pursuit
+    pursuing: List[CityNPC] = field(default_factory=list)  # Police actively chasing the player
+    in_jail: bool = False
+    jail_timer: float = 0.0  # Time remaining in jail
+    violence_cooldown: float = 0.0  # Cooldown before the wanted level decays
+    total_attacks: int = 0  # Violent acts so far (horror escalation)
+
+
+class CitySimulation:
+    """
+    Headless city simulation.
+
+    Owns the city map, player, NPCs, crime, game loop, vehicles and animals,
+    and advances them with step(). Nothing here draws or polls input, so it
+    runs unchanged under the SDL dummy driver or without a display at all.
+    """
+
+    FIXED_DT = 1.0 / 60.0
+
+    # Subsystem names recorded when profiling is enabled
+    PROFILE_SECTIONS = ("game_loop", "crime", "npcs", "vehicles",
+                        "animals", "clues", "environment", "quests")
+
+    def __init__(self, config: CityConfig = None, seed: Optional[int] = None,
+                 rng: RNGService = None,
+                 sprites: Dict[str, pygame.Surface] = None,
+                 criminal_count: int = 6, police_count: int = 5,
+                 civilian_count: int = 20, animal_count: int = 25,
+                 guide=None, overlay=None,
+                 narrator_queue: NarratorQueue = None,
+                 path_workers: int = 0):
+        """
+        Build the world.
+
+        Args:
+            config: City layout (defaults to CityConfig())
+            seed: Master seed; None picks one (or uses PY_CITY_SEED)
+            rng: RNG service to draw streams from (overrides seed)
+            sprites: Dict with "player", "criminal", "police", "civilian"
+            criminal_count, police_count, civilian_count: NPC populations
+            animal_count: Animals to spawn on sidewalks
+            guide, overlay: Passed through to GameLoopManager (optional)
+            narrator_queue: Shared narrator queue (created if not provided)
+            path_workers: Path-search threads (0 = search inline during
+                step(), which keeps replays exact)
+        """
+        # Every subsystem gets its own stream from one master seed, so a
+        # session replays exactly from self.seed
+        self.rng = rng or RNGService(seed)
+        self.seed = self.rng.master_seed
+        self.rng.seed_global()
+
+        # Window flicker timer is class-level; a new city starts a fresh cycle
+        CityBlock._window_change_timer = 0.0
+
+        self.config = config or CityConfig()
+        self.sprites = sprites or make_fallback_sprites()
+        world_w = self.config.world_width
+        world_h = self.config.world_height
+
+        self.time = 0.0
+        self.frame = 0
+
+        # Per-subsystem timings (name -> list of seconds) when profiling
+        self.profile: Optional[Dict[str, List[float]]] = None
+
+        # Pauses and cooldowns that end on their own (NPC waits, animal states)
+        self.scheduler = TimerScheduler()
+
+        # World
+        self.city_map = CityMap(self.config, rng=self.rng.stream(STREAM_CITY))
+        self.weather = WeatherSystem(world_w, world_h, rng=self.rng.stream(STREAM_WEATHER))
+        self.day_night = DayNightCycle(start_hour=8.0, time_scale=60.0)
+        self.lighting = self.day_night.get_lighting()  # This frame's light, shared by every consumer
+
+        # Player starts on the sidewalk nearest the world center
+        start_x, start_y = world_w // 2, world_h // 2
+        nearest_node = self.city_map.get_nearest_sidewalk_node(start_x, start_y)
+        if nearest_node:
+            start_x, start_y = nearest_node.x, nearest_node.y
+        self.player = CityPlayer(start_x, start_y, self.sprites["player"], world_w, world_h)
+        self._last_player_pos = (start_x, start_y)
+        self.pursuit = PursuitState()
+
+        # Distances to the player, shared by pursuing police and fleeing NPCs
+        self.player_field = FlowField.for_city(self.city_map)
+        self._fleeing: Dict[CityNPC, None] = {}  # Insertion-ordered set
+
+        # NPCs share one movement engine; waiting NPCs are parked on the
+        # scheduler and aren't walking in the engine. New paths are searched
+        # by the planner and applied a budgeted number per step
+        self.path_planner = PathPlanner(self.city_map.sidewalk_graph, workers=path_workers)
+        self.npc_engine = NPCMovementEngine(
+            capacity=criminal_count + police_count + civilian_count)
+        self.all_npcs: List[CityNPC] = []
+        self._npc_timers: Dict[CityNPC, Timer] = {}
+        self.criminals: List[CityNPC] = []
+        self.police: List[CityNPC] = []
+        self.civilians: List[CityNPC] = []
+        for npc_type, count, group in (("criminal", criminal_count, self.criminals),
+                                       ("police", police_count, self.police),
+                                       ("civilian", civilian_count, self.civilians)):
+            for _ in range(count):
+                npc = self.spawn_npc(npc_type)
+                group.append(npc)
+                self.all_npcs.append(npc)
+                self._track_npc(npc)
+
+        # Game systems (slower narrator pacing gives time to read instructions)
+        self.narrator_queue = narrator_queue or NarratorQueue(min_gap=10.0, max_queue=2)
+        self.game_loop = GameLoopManager(
+            world_w, world_h,
+            guide=guide,
+            overlay=overlay,
+            narrator_queue=self.narrator_queue,
+            city_map=self.city_map,
+            rng=self.rng.stream(STREAM_PHASES)
+        )
+        self.crime_sim = CrimeSimulation(world_w, world_h, rng=self.rng.stream(STREAM_CRIME))
+        self.corruption = CorruptionManager(rng=self.rng.stream(STREAM_CORRUPTION))
+
+        # Vehicles follow the road grid
+        self.road_network = RoadNetwork(rng=self.rng.stream(STREAM_VEHICLES))
+        self.road_network.build_from_grid(
+            world_w, world_h,
+            self.config.block_width, self.config.block_height,
+            self.config.road_width
+        )
+        self.vehicle_manager = VehicleManager(world_w, world_h, self.road_network,
+                                              rng=self.rng.stream(STREAM_VEHICLES),
+                                              scheduler=self.scheduler)
+        self.vehicle_manager.spawn_vehicles(self.road_network.segments,
+                                            self.city_map.parking_lots)
+        self.vehicle_manager.bake_parked(self.city_map)
+        self.vehicle_manager.start_pull_outs()
+
+        # Animals avoid buildings
+        self.animal_manager = AnimalManager(world_w, world_h,
+                                            rng=self.rng.stream(STREAM_ANIMALS),
+                                            scheduler=self.scheduler)
+        self.animal_manager.set_building_rects(
+            [building for block in self.city_map.blocks for building in block.buildings]
+        )
+        self.animal_manager.spawn_animals(self.city_map.sidewalk_nodes, count=animal_count)
+
+        # Special buildings and investigation
+        self.special_buildings = SpecialBuildingManager(world_w, world_h)
+        self.special_buildings.create_special_buildings(
+            [(b.rect.x, b.rect.y, b.rect.width, b.rect.height) for b in self.city_map.blocks]
+        )
+        self.investigation = InvestigationManager(clue_sites=self.city_map.get_walkable_points(),
+                                                  rng=self.rng.stream(STREAM_CLUES))
+
+        # Quests: every quest that becomes available is tracked at once
+        self.quests = QuestManager()
+        self.quests.on_quest_available = lambda quest: self.quests.start_quest(quest.id)
+        self._quest_phase: Optional[GamePhase] = None
+        self._anomalies_seen = 0
+
+    def spawn_npc(self, npc_type: str) -> CityNPC:
+        """Create an NPC of the given type at a random sidewalk node."""
+        sprite = self.sprites.get(npc_type, self.sprites["civilian"])
+        npc_rng = self.rng.stream(STREAM_NPCS)
+        if self.city_map.sidewalk_nodes:
+            node = npc_rng.choice(self.city_map.sidewalk_nodes)
+            return CityNPC(node.x, node.y, sprite, npc_type, self.city_map,
+                           rng=npc_rng, engine=self.npc_engine)
+        return CityNPC(100, 100, sprite, npc_type, self.city_map,
+                       rng=npc_rng, engine=self.npc_engine)
+
+    def _track_npc(self, npc: CityNPC):
+        """Walk an NPC along its path, or park it on the scheduler if it is waiting."""
+        self.scheduler.cancel(self._npc_timers.pop(npc, None))
+        if npc.wait_timer <= 0 and not npc.walk_to_next_waypoint():
+            # No path left: pause before the next one
+            npc.wait_timer = npc.rng.uniform(1.0, 4.0)
+        if npc.wait_timer > 0:
+            npc.engine.stop(npc.row)
+            self._npc_timers[npc] = self.scheduler.schedule(npc.wait_timer, self._wake_npc, npc)
+
+    def _wake_npc(self, npc: CityNPC):
+        """Scheduler callback: an NPC's pause is over, ask for a new path."""
+        del self._npc_timers[npc]
+        npc.wait_timer = 0.0
+        destination = npc.choose_destination()
+        if destination is None:
+            self._track_npc(npc)
+            return
+        # The NPC stands still until the planner hands its path back
+        self.path_planner.request(npc, (npc.x, npc.y), destination)
+
+    def scare_npc(self, npc: CityNPC, seconds: float = FLEE_TIME):
+        """Make an NPC run from the player for a while."""
+        if npc.in_jail or npc.in_building:
+            return
+        npc.flee_timer = max(npc.flee_timer, seconds)
+        self._fleeing[npc] = None
+
+    def scare_civilians(self, x: float, y: float, radius: float = WITNESS_RADIUS) -> int:
+        """Civilians within radius of (x, y) flee (e.g. the player attacked). Returns the count."""
+        radius_sq = radius * radius
+        scared = 0
+        for civ in self.civilians:
+            dx = civ.x - x
+            dy = civ.y - y
+            if dx * dx + dy * dy < radius_sq:
+                self.scare_npc(civ)
+                scared += 1
+        return scared
+
+    def _scare_chased_criminals(self):
+        """Criminals in a chase run while the player is close."""
+        chased = {crime.criminal_id for crime in self.crime_sim.active_crimes
+                  if crime.being_chased}
+        if not chased:
+            return
+        player = self.player
+        radius_sq = CHASE_FLEE_RADIUS * CHASE_FLEE_RADIUS
+        for criminal in self.criminals:
+            if id(criminal) not in chased:
+                continue
+            dx = criminal.x - player.x
+            dy = criminal.y - player.y
+            if dx * dx + dy * dy < radius_sq:
+                self.scare_npc(criminal, seconds=0.5)
+
+    def _move_fleeing(self, dt: float) -> List[int]:
+        """
+        Move fleeing NPCs uphill on the player field.
+
+        Returns:
+            Engine rows to hold this step (they moved here instead).
+        """
+        held = []
+        speed = FLEE_SPEED * dt * 60
+        for npc in list(self._fleeing):
+            npc.flee_timer -= dt
+            if npc.flee_timer <= 0 or npc.in_jail or npc.in_building:
+                # Calm again: plan a fresh path from wherever it ended up
+                npc.flee_timer = 0.0
+                del self._fleeing[npc]
+                self.path_planner.cancel(npc)
+                npc.path = []
+                npc.path_index = 0
+                npc.wait_timer = 0.0
+                self._track_npc(npc)
+                continue
+
+            step = self.player_field.flee_direction(npc.x, npc.y)
+            if step is not None:
+                npc.x += step[0] * speed
+                npc.y += step[1] * speed
+            # Off the field (or cornered): cower in place rather than run
+            # straight through buildings; still held off its path
+            held.append(npc.row)
+        return held
+
+    def _apply_paths(self):
+        """Start NPCs on the paths the planner finished (budgeted per step)."""
+        for npc, path in self.path_planner.collect():
+            npc.path = path
+            npc.path_index = 0
+            self._track_npc(npc)
+
+    # --- Player actions (run() and replays both go through these) ---
+
+    def check_player_moved(self) -> bool:
+        """Whether the player has moved since the last check (the tutorial's "moving")."""
+        pos = (self.player.x, self.player.y)
+        if pos == self._last_player_pos:
+            return False
+        self._last_player_pos = pos
+        return True
+
+    def move_player(self, dx: float, dy: float, dt: float,
+                    steering: bool = False) -> Tuple[float, float]:
+        """
+        Move the player through the city, with corruption drift.
+
+        Args:
+            dx, dy: Direction from the keyboard or click-to-move
+            steering: True for keyboard input, which builds up drift
+                (the character overshoots when entropy is high)
+
+        Returns:
+            The direction actually applied, drift included.
+        """
+        if steering:
+            self.corruption.add_movement_drift(dx, dy)
+        drift_x, drift_y = self.corruption.get_movement_drift()
+        final_dx = dx + drift_x * 0.1
+        final_dy = dy + drift_y * 0.1
+        self.player.move(final_dx, final_dy, self.city_map, dt)
+        return final_dx, final_dy
+
+    def set_alignment(self, alignment: str):
+        """Player picks an alignment (G/N keys)."""
+        self.player.change_alignment(alignment)
+        self.game_loop.on_player_aligned(alignment)
+
+    def intervene(self, helping: bool) -> Optional[Crime]:
+        """
+        Player helps the police with (or joins) a nearby crime.
+
+        Helping raises the trust of nearby civilians and police; joining
+        costs the trust of everyone who saw it.
+
+        Returns:
+            The crime intervened in, or None if none was close enough.
+        """
+        player = self.player
+        crime = self.crime_sim.player_intervene(player.x, player.y, helping)
+        if not crime:
+            return None
+        self.game_loop.on_player_intervention(helping)
+        self.quests.queue_event("crime_intervened")
+        player.karma += 5 if helping else -15
+        for npc in self.all_npcs:
+            dx = npc.x - player.x
+            dy = npc.y - player.y
+            if math.sqrt(dx * dx + dy * dy) < INTERVENE_RADIUS:
+                if not helping:
+                    npc.trust = max(-100, npc.trust - 20)
+                elif npc.type in ("civilian", "police"):
+                    npc.increase_trust(15)
+                    self.quests.queue_event("npc_trust_increased")
+        return crime
+
+    def talk_to(self, npc: CityNPC):
+        """
+        Player starts a conversation with an NPC.
+
+        Call after the front-end has picked the dialogue situation: an NPC
+        that trusts the player enough gives up its secret here.
+        """
+        if npc.can_reveal_secret():
+            npc.secret_revealed = True
+        self.game_loop.on_player_talked(npc.type)
+        self.quests.queue_event("npc_talked")
+
+    def attack(self) -> dict:
+        """
+        Player attack: damages every NPC in reach, sends civilian witnesses
+        running and raises the police response.
+
+        Returns dict for the front-end to present:
+            - attacked: bool - whether any NPC was hit
+            - attacked_police: bool - whether police were attacked
+            - attacked_civilian: bool - whether civilians were attacked
+            - attacked_criminal: bool - whether criminals were attacked
+            - fatal: bool - whether anyone was knocked out
+            - wanted_event: "police_alerted", "wanted_escalation" or None
+        """
+        player = self.player
+        result = {
+            "attacked": False,
+            "attacked_police": False,
+            "attacked_civilian": False,
+            "attacked_criminal": False,
+            "fatal": False,
+        }
+
+        for npc in self.all_npcs:
+            if npc.in_jail:
+                continue
+            dx = npc.x - player.x
+            dy = npc.y - player.y
+            if math.sqrt(dx * dx + dy * dy) >= ATTACK_RANGE:
+                continue
+
+            npc.health -= ATTACK_DAMAGE
+            result["attacked"] = True
+            result[f"attacked_{npc.type}"] = True
+
+            # Attacking reduces karma (more for police/civilians)
+            if npc.type == "police":
+                player.karma -= 10
+            elif npc.type == "civilian":
+                player.karma -= 5
+            else:  # criminal
+                player.karma -= 1
+
+            # Witnesses lose trust (permanent damage)
+            npc.trust = max(-100, npc.trust - 30)
+
+            # Mark NPC as having been attacked by player (for memory)
+            if not hasattr(npc, 'attacked_by_player'):
+                npc.attacked_by_player = 0
+            npc.attacked_by_player += 1
+
+            if npc.health <= 0:
+                npc.in_jail = True  # "Knocked out" - removed from play
+                result["fatal"] = True
+                self.game_loop.on_player_attacked(npc.type, fatal=True)
+            else:
+                self.game_loop.on_player_attacked(npc.type, fatal=False)
+
+        if result["attacked"]:
+            # Civilians who saw it run from the player
+            self.scare_civilians(player.x, player.y)
+        result["wanted_event"] = self._raise_wanted_level(result)
+        return result
+
+    def _raise_wanted_level(self, attack_result: dict) -> Optional[str]:
+        """
+        Police response to an attack.
+
+        Returns:
+            "police_alerted" when a pursuit starts, "wanted_escalation" when
+            it grows, else None.
+        """
+        if not attack_result["attacked"]:
+            return None
+        pursuit = self.pursuit
+        pursuit.total_attacks += 1
+        pursuit.violence_cooldown = VIOLENCE_COOLDOWN
+
+        # Increase wanted level based on target
+        if attack_result["attacked_police"]:
+            # Attacking police is very bad
+            pursuit.wanted_level = min(3, pursuit.wanted_level + 1.5)
+            pursuit.wanted = True
+        elif attack_result["attacked_civilian"]:
+            # Attacking civilians alerts police
+            pursuit.wanted_level = min(3, pursuit.wanted_level + 0.75)
+            if pursuit.wanted_level >= 0.5:
+                pursuit.wanted = True
+        else:
+            # Attacking criminals - police don't care as much
+            pursuit.wanted_level = min(3, pursuit.wanted_level + 0.25)
+
+        # Fatal attacks escalate further
+        if attack_result["fatal"]:
+            pursuit.wanted_level = min(3, pursuit.wanted_level + 0.5)
+
+        if pursuit.wanted and not pursuit.pursuing:
+            return "police_alerted"
+        if pursuit.wanted_level >= 2 and len(pursuit.pursuing) < 3:
+            return "wanted_escalation"
+        return None
+
+    def _update_pursuit(self, dt: float) -> Optional[str]:
+        """
+        Advance the police pursuit and jail time.
+
+        Pursuing police follow the player field around buildings, and go
+        straight for the player once in the player's cell or off the field.
+
+        Returns:
+            "player_arrested", "jail_release" or None.
+        """
+        pursuit = self.pursuit
+        player = self.player
+        jail = self.special_buildings.jail
+
+        # Decay violence cooldown
+        if pursuit.violence_cooldown > 0:
+            pursuit.violence_cooldown -= dt
+        elif pursuit.wanted_level > 0 and not pursuit.pursuing:
+            # Slowly decay wanted level when not actively violent
+            pursuit.wanted_level = max(0, pursuit.wanted_level - dt * 0.1)
+            if pursuit.wanted_level == 0:
+                pursuit.wanted = False
+
+        # Handle jail time
+        if pursuit.in_jail:
+            pursuit.jail_timer -= dt
+            if pursuit.jail_timer > 0:
+                return None
+            # Release from jail
+            pursuit.in_jail = False
+            pursuit.jail_timer = 0
+            pursuit.wanted = False
+            pursuit.wanted_level = 0
+            pursuit.pursuing = []
+            if jail:
+                player.x = jail.x + jail.width + 50
+                player.y = jail.y + jail.height // 2
+            return "jail_release"
+
+        if not pursuit.wanted:
+            return None
+
+        # Find nearby police to join pursuit (higher wanted = wider detection)
+        pursuit_range = 300 + pursuit.wanted_level * 100
+        for cop in self.police:
+            if cop.in_jail:
+                continue
+            dx = cop.x - player.x
+            dy = cop.y - player.y
+            if math.sqrt(dx * dx + dy * dy) < pursuit_range and cop not in pursuit.pursuing:
+                pursuit.pursuing.append(cop)
+
+        # Police chase player
+        for cop in pursuit.pursuing[:]:  # Copy for safe removal
+            if cop.in_jail:
+                pursuit.pursuing.remove(cop)
+                continue
+
+            dx = player.x - cop.x
+            dy = player.y - cop.y
+            dist = math.sqrt(dx * dx + dy * dy)
+
+            step = self.player_field.direction(cop.x, cop.y)
+            if step is None and dist > 0:
+                step = (dx / dist, dy / dist)
+            if step is not None:
+                # Police move faster when pursuing (based on wanted level)
+                speed = 2.5 + pursuit.wanted_level * 0.5
+                cop.x += step[0] * speed
+                cop.y += step[1] * speed
+
+            if dist < CATCH_DISTANCE:
+                # Player caught: 10-25 seconds based on crimes
+                pursuit.in_jail = True
+                pursuit.jail_timer = 10.0 + pursuit.wanted_level * 5.0
+                if jail:
+                    player.x = jail.x + jail.width // 2
+                    player.y = jail.y + jail.height // 2
+                pursuit.pursuing = []
+                return "player_arrested"
+        return None
+
+    def _update_quests(self, result: StepResult):
+        """
+        Queue this step's quest events, then flush them in one batch.
+
+        Phase unlocks follow game_loop.state.phase; completed quests pay
+        their karma reward to the player and their trust reward to the
+        nearest NPC.
+        """
+        quests = self.quests
+        state = self.game_loop.state
+        if state.phase != self._quest_phase:
+            self._quest_phase = state.phase
+            quests.update_phase(state.phase.name)
+            if state.phase == GamePhase.COMPLETED:
+                quests.queue_event("exit_found")
+
+        for event in result.crime_events:
+            if event in ("mugging_started", "burglary_started"):
+                quests.queue_event("crime_witnessed")
+        if result.clue:
+            quests.queue_event("clue_discovered")
+        if state.anomalies_discovered > self._anomalies_seen:
+            quests.queue_event("anomaly_discovered",
+                               state.anomalies_discovered - self._anomalies_seen)
+            self._anomalies_seen = state.anomalies_discovered
+
+        result.completed_quests = quests.flush_events()
+        for quest in result.completed_quests:
+            self.player.karma += quest.karma_reward
+            if quest.trust_reward:
+                npc = self._nearest_npc(self.player.x, self.player.y)
+                if npc:
+                    npc.increase_trust(quest.trust_reward)
+                    quests.queue_event("npc_trust_increased")
+
+    def _nearest_npc(self, x: float, y: float) -> Optional[CityNPC]:
+        """Closest NPC still in play."""
+        best, best_dist = None, float("inf")
+        for npc in self.all_npcs:
+            if npc.in_jail:
+                continue
+            dist = (npc.x - x) ** 2 + (npc.y - y) ** 2
+            if dist < best_dist:
+                best, best_dist = npc, dist
+        return best
+
+    def skip_phase(self):
+        """Dev shortcut: jump to the next game phase."""
+        game_loop = self.game_loop
+        current = game_loop.state.phase
+        if current == GamePhase.TUTORIAL:
+            game_loop._transition_to_phase(GamePhase.LIVING_CITY)
+        elif current == GamePhase.LIVING_CITY:
+            game_loop._transition_to_phase(GamePhase.SOMETHING_WRONG)
+        elif current == GamePhase.SOMETHING_WRONG:
+            for anomaly in game_loop.state.anomalies[:5]:
+                anomaly.discovered = True
+            game_loop.state.anomalies_discovered = 5
+            game_loop._transition_to_phase(GamePhase.EXIT_SEARCH)
+        elif current == GamePhase.EXIT_SEARCH:
+            game_loop._transition_to_phase(GamePhase.COMPLETED)
+
+    def keep_exploring(self):
+        """The exit menu's "Keep Exploring": back to the living city after completion."""
+        self.game_loop.state.phase = GamePhase.LIVING_CITY
+
+    def start(self):
+        """Start the game loop (tutorial phase)."""
+        self.game_loop.start()
+
+    def begin_frame(self, raw_dt: float) -> float:
+        """
+        Advance corruption for a new frame.
+
+        Returns:
+            The frame's dt after corruption time dilation.
+        """
+        self.corruption.update_entropy(self.game_loop.state.phase.name)
+        self.corruption.update(raw_dt)
+        return self.corruption.warp_time(raw_dt)
+
+    def _mark(self, section: str, start: float) -> float:
+        """Record time spent in a section when profiling; returns a new start."""
+        now = time.perf_counter()
+        if self.profile is not None:
+            self.profile.setdefault(section, []).append(now - start)
+        return now
+
+    def step(self, dt: float = None, player_moving: bool = False,
+             frozen_npc: Optional[CityNPC] = None) -> StepResult:
+        """
+        Advance the simulation by one step.
+
+        Args:
+            dt: Step length in seconds (defaults to FIXED_DT)
+            player_moving: Whether the player is moving (tutorial; see
+                check_player_moved)
+            frozen_npc: NPC to hold in place (e.g. mid-conversation)
+
+        Returns:
+            StepResult with events for the front-end to narrate or display.
+        """
+        if dt is None:
+            dt = self.FIXED_DT
+        result = StepResult()
+        player = self.player
+        t = time.perf_counter()
+
+        # Pursuers and fleeing NPCs read this; it rebuilds only when queried
+        self.player_field.update(dt, player.x, player.y)
+
+        # Tutorial, phases, anomalies
+        self.game_loop.update(dt, player.x, player.y, player_moving)
+        if player_moving:
+            self.quests.queue_event("player_moved")
+        t = self._mark("game_loop", t)
+
+        # Crime only happens once the city is "alive"
+        if self.game_loop.state.phase in (GamePhase.LIVING_CITY, GamePhase.SOMETHING_WRONG):
+            self.crime_sim.set_night_mode(self.lighting.is_night)
+            result.crime_events = self.crime_sim.update(
+                dt, self.criminals, self.police, self.civilians,
+                player.x, player.y
+            )
+        t = self._mark("crime", t)
+
+        # NPCs: finished pauses come off the scheduler and ask for paths,
+        # finished paths are applied, then every walking NPC is advanced in
+        # one engine step (corruption may freeze some)
+        self.scheduler.advance(dt)
+        self._apply_paths()
+        self._scare_chased_criminals()
+        hold = self.corruption.pick_frozen_npcs(self.npc_engine.count)
+        if self._fleeing:
+            hold.extend(self._move_fleeing(dt))
+        if frozen_npc is not None:
+            hold.append(frozen_npc.row)
+        owners = self.npc_engine.owners
+        for row in self.npc_engine.step(dt, hold):
+            npc = owners[row]
+            npc.path_index += 1
+            self._track_npc(npc)
+        result.pursuit_event = self._update_pursuit(dt)
+        t = self._mark("npcs", t)
+
+        self.vehicle_manager.update(dt)
+        t = self._mark("vehicles", t)
+
+        self.animal_manager.update(dt, player.x, player.y)
+        t = self._mark("animals", t)
+
+        result.clue = self.investigation.check_clue_discovery(player.x, player.y)
+        t = self._mark("clues", t)
+
+        # Time of day, weather and lit windows
+        result.time_event = self.day_night.update(dt)
+        self.lighting = self.day_night.get_lighting()
+        result.weather_event = self.weather.update(dt, self.lighting.time_of_day)
+        self.city_map.update(dt, self.lighting.window_lit_chance)
+        t = self._mark("environment", t)
+
+        self._update_quests(result)
+        self._mark("quests", t)
+
+        self.time += dt
+        self.frame += 1
+        return result
+
+    def close(self):
+        """Stop background workers (path planner threads)."""
+        self.path_planner.shutdown()
+
+    def run_for(self, seconds: float, dt: float = None) -> List[StepResult]:
+        """Step repeatedly for a span of simulated time (headless use)."""
+        if dt is None:
+            dt = self.FIXED_DT
+        steps = max(1, int(round(seconds / dt)))
+        return [self.step(dt) for _ in range(steps)]
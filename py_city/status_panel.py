@@ -0,0 +1,177 @@
+"""
+Status Panel for Py City
+========================
+
+Retained-mode Tab menu. The panel frame (dimmed backdrop, background,
+close hint), the tab header and each tab's content are rendered into
+cached surfaces and blitted every frame; a tab is only re-rendered after
+something it shows has changed. The game calls invalidate() from the
+change notifications of whatever a tab displays (inventory pickups,
+quest and phase changes, event log entries, player stats).
+
+Features:
+- One cached content page per tab, as tall as its content
+- Dirty tracking per tab; stale pages re-render the next time they show
+- Tab header cached per (active tab, hovered tab)
+- Scrolling blits a sub-rect of the cached page (no re-render)
+- Panel fonts created once instead of every frame
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pygame
+
+
+# Tab indexes
+ITEMS_TAB = 0
+QUESTS_TAB = 1
+STATS_TAB = 2
+LOG_TAB = 3
+
+TAB_NAMES = ("[1] ITEMS", "[2] QUESTS", "[3] STATS", "[4] LOG")
+
+PANEL_WIDTH = 650
+PANEL_HEIGHT = 480
+TAB_HEIGHT = 40
+CONTENT_TOP = 50  # Content starts this far below the panel top
+CONTENT_HEIGHT = PANEL_HEIGHT - 80  # Leaves room for the close hint
+
+# Pixels scrolled per mouse wheel notch
+SCROLL_STEP = 40
+
+BACKDROP_COLOR = (0, 0, 0, 200)
+PANEL_COLOR = (20, 22, 28)
+BORDER_COLOR = (80, 80, 100)
+CLOSE_HINT = "TAB/ESC: Close  |  1-4 or Arrow Keys: Switch tabs  |  Wheel: Scroll"
+
+
+class StatusPanel:
+    """Tabbed status panel drawn from cached surfaces."""
+
+    def __init__(self, screen_width: int, screen_height: int,
+                 renderers: Sequence[Callable[["StatusPanel"], pygame.Surface]]):
+        """
+        Args:
+            screen_width, screen_height: Screen size in pixels
+            renderers: One per tab; renderer(panel) returns the tab's content
+                       page (see new_page), drawn at panel-local coordinates
+        """
+        self.renderers = list(renderers)
+        self.width = PANEL_WIDTH
+        self.view_height = CONTENT_HEIGHT
+        self.x = (screen_width - PANEL_WIDTH) // 2
+        self.y = (screen_height - PANEL_HEIGHT) // 2
+        self.screen_size = (screen_width, screen_height)
+        self.renders = 0  # Tab pages rendered (for tests / debug overlay)
+
+        self.tab_font = pygame.font.Font(None, 28)
+        self.section_font = pygame.font.Font(None, 24)
+        self.info_font = pygame.font.Font(None, 20)
+        self.item_font = pygame.font.Font(None, 22)
+
+        self._pages: Dict[int, pygame.Surface] = {}
+        self._dirty = set(range(len(self.renderers)))
+        self._scroll: Dict[int, int] = {}
+        self._headers: Dict[Tuple[int, Optional[int]], pygame.Surface] = {}
+        self._frame: Optional[pygame.Surface] = None
+
+    def invalidate(self, *tabs: int):
+        """Mark tabs stale (all of them if none are given)."""
+        self._dirty.update(tabs or range(len(self.renderers)))
+
+    def new_page(self, height: int = 0) -> pygame.Surface:
+        """Blank, transparent content page at least the view height tall."""
+        return pygame.Surface((self.width, max(height, self.view_height)), pygame.SRCALPHA)
+
+    def tab_rects(self) -> list[pygame.Rect]:
+        """Screen rects of the tabs (for clicks and hover)."""
+        tab_width = self.width // len(TAB_NAMES)
+        return [pygame.Rect(self.x + i * tab_width, self.y, tab_width, TAB_HEIGHT)
+                for i in range(len(TAB_NAMES))]
+
+    def tab_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Index of the tab under a screen position, if any."""
+        for i, rect in enumerate(self.tab_rects()):
+            if rect.collidepoint(pos):
+                return i
+        return None
+
+    def scroll(self, tab: int, dy: int):
+        """Scroll a tab's page by dy pixels (clamped to its content)."""
+        self._scroll[tab] = self._scroll.get(tab, 0) + dy
+        page = self._pages.get(tab)
+        if page is not None:
+            self._clamp_scroll(tab, page)
+
+    def _clamp_scroll(self, tab: int, page: pygame.Surface):
+        """Keep a tab's scroll offset inside its page."""
+        limit = max(0, page.get_height() - self.view_height)
+        self._scroll[tab] = max(0, min(limit, self._scroll.get(tab, 0)))
+
+    def page(self, tab: int) -> pygame.Surface:
+        """Cached content page for a tab, re-rendered if stale."""
+        page = self._pages.get(tab)
+        if page is None or tab in self._dirty:
+            page = self.renderers[tab](self)
+            self._pages[tab] = page
+            self._dirty.discard(tab)
+            self._clamp_scroll(tab, page)
+            self.renders += 1
+        return page
+
+    def _render_frame(self) -> pygame.Surface:
+        """Dimmed backdrop with the empty panel and close hint on it."""
+        frame = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+        frame.fill(BACKDROP_COLOR)
+        panel_rect = pygame.Rect(self.x, self.y, self.width, PANEL_HEIGHT)
+        pygame.draw.rect(frame, PANEL_COLOR, panel_rect)
+        pygame.draw.rect(frame, BORDER_COLOR, panel_rect, 2)
+
+        close_text = self.info_font.render(CLOSE_HINT, True, (80, 90, 100))
+        frame.blit(close_text, (self.x + self.width // 2 - close_text.get_width() // 2,
+                                self.y + PANEL_HEIGHT - 22))
+        return frame
+
+    def _render_header(self, active_tab: int, hovered: Optional[int]) -> pygame.Surface:
+        """Tab strip with the active tab highlighted and the hovered one lit."""
+        header = pygame.Surface((self.width, TAB_HEIGHT))
+        tab_width = self.width // len(TAB_NAMES)
+        for i, tab_name in enumerate(TAB_NAMES):
+            tab_x = i * tab_width
+            tab_rect = pygame.Rect(tab_x, 0, tab_width, TAB_HEIGHT)
+
+            # Active tab is highlighted
+            if i == active_tab:
+                pygame.draw.rect(header, (50, 55, 70), tab_rect)
+                pygame.draw.line(header, (100, 150, 200), (tab_x, TAB_HEIGHT - 1),
+                                 (tab_x + tab_width, TAB_HEIGHT - 1), 2)
+                text_color = (200, 220, 255)
+            elif i == hovered:
+                pygame.draw.rect(header, (40, 42, 50), tab_rect)
+                text_color = (150, 160, 180)
+            else:
+                pygame.draw.rect(header, (30, 32, 38), tab_rect)
+                text_color = (100, 110, 130)
+
+            tab_text = self.tab_font.render(tab_name, True, text_color)
+            header.blit(tab_text, (tab_x + (tab_width - tab_text.get_width()) // 2, 10))
+        return header
+
+    def draw(self, screen: pygame.Surface, active_tab: int,
+             mouse_pos: Tuple[int, int] = (-1, -1)):
+        """Blit the panel: frame, tab header and the visible part of the active page."""
+        if self._frame is None:
+            self._frame = self._render_frame()
+        screen.blit(self._frame, (0, 0))
+
+        hovered = self.tab_at(mouse_pos)
+        key = (active_tab, hovered if hovered != active_tab else None)
+        header = self._headers.get(key)
+        if header is None:
+            header = self._render_header(*key)
+            self._headers[key] = header
+        screen.blit(header, (self.x, self.y))
+
+        page = self.page(active_tab)
+        area = pygame.Rect(0, self._scroll.get(active_tab, 0), self.width, self.view_height)
+        screen.blit(page, (self.x, self.y + CONTENT_TOP), area)
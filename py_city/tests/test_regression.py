@@ -29,13 +29,16 @@ class MockPygame:
             self.width, self.height = w, h
             self.left, self.top = x, y
             self.right, self.bottom = x + w, y + h
+            self.centerx, self.centery = x + w // 2, y + h // 2
         def colliderect(self, other):
             return not (self.right < other.left or self.left > other.right or
                        self.bottom < other.top or self.top > other.bottom)
         def inflate(self, dx, dy):
             return MockPygame.Rect(self.x - dx, self.y - dy,
                                    self.width + 2*dx, self.height + 2*dy)
-        def collidepoint(self, x, y):
+        def collidepoint(self, x, y=None):
+            if y is None:
+                x, y = x
             return self.left <= x <= self.right and self.top <= y <= self.bottom
         def copy(self):
             return MockPygame.Rect(self.x, self.y, self.width, self.height)
@@ -53,6 +56,10 @@ class MockPygame:
             return self.size[0]
         def get_height(self):
             return self.size[1]
+        def subsurface(self, rect):
+            return MockPygame.Surface((rect.width, rect.height))
+        def copy(self):
+            return MockPygame.Surface(self.size)
 
     SRCALPHA = 0x00010000
 
@@ -113,6 +120,9 @@ class MockPygame:
         @staticmethod
         def polygon(surface, color, points):
             pass
+        @staticmethod
+        def ellipse(surface, color, rect, width=0):
+            pass
 
     class font:
         @staticmethod
@@ -528,6 +538,115 @@ class TestBuildingInteriors(unittest.TestCase):
         interior3 = manager.get_interior(building_id=2, building_type="bar")
         self.assertIsNot(interior1, interior3)  # Different building
 
+    def test_levels_generated_on_first_visit(self):
+        """Test only visited floors are generated."""
+        from interiors import BuildingInterior, FloorLevel
+        interior = BuildingInterior(building_type="hospital", seed=7)
+        self.assertEqual(len(interior.levels), 0)
+        self.assertGreater(len(interior.objects), 0)
+        self.assertEqual(list(interior.levels), [FloorLevel.GROUND])
+        self.assertTrue(interior.change_level(1))
+        self.assertIn(FloorLevel.UPPER, interior.levels)
+        self.assertNotIn(FloorLevel.BASEMENT, interior.levels)
+
+    def test_interior_manager_evicts_to_delta(self):
+        """Test evicted interiors come back with searched objects intact."""
+        from interiors import InteriorManager
+        manager = InteriorManager(max_interiors=2)
+        interior = manager.get_interior(building_id=11, building_type="house")
+        target = next(o for o in interior.objects if o.searchable)
+        index = interior.objects.index(target)
+        interior.search_object(target)
+
+        manager.get_interior(building_id=12, building_type="bar")
+        manager.get_interior(building_id=13, building_type="bank")
+        info = manager.get_cache_info()
+        self.assertEqual(info["interiors"], 2)
+        self.assertEqual(info["deltas"], 1)
+
+        rebuilt = manager.get_interior(building_id=11, building_type="house")
+        self.assertIsNot(rebuilt, interior)
+        self.assertEqual([o.name for o in rebuilt.objects],
+                         [o.name for o in interior.objects])
+        self.assertTrue(rebuilt.objects[index].searched)
+        self.assertIsNone(rebuilt.objects[index].item_id)
+
+    def test_generation_leaves_global_random_alone(self):
+        """Test generating a level doesn't reseed the random module."""
+        import random
+        from interiors import BuildingInterior
+        random.seed(5)
+        expected = [random.random() for _ in range(3)]
+        random.seed(5)
+        BuildingInterior(building_type="house", seed=42)._generate_all_levels()
+        self.assertEqual([random.random() for _ in range(3)], expected)
+
+    def test_prefetch_on_worker_thread(self):
+        """Test a prefetched interior is adopted on entry, matching a fresh build."""
+        from interiors import InteriorManager
+        manager = InteriorManager()
+        manager.prefetch(building_id=21, building_type="hospital")
+        manager.wait_for_prefetch()
+        self.assertEqual(manager.get_cache_info()["prefetched"], 1)
+
+        interior = manager.get_interior(building_id=21, building_type="hospital")
+        self.assertEqual(manager.prefetch_hits, 1)
+        self.assertEqual(len(interior.levels), 3)  # Every floor pre-generated
+
+        fresh = InteriorManager(background=False).get_interior(21, "hospital")
+        self.assertEqual([o.position for o in interior.objects],
+                         [o.position for o in fresh.objects])
+        manager.shutdown()
+
+    def test_stale_prefetch_dropped_after_refetch(self):
+        """Test a job built before eviction can't replace the re-prefetched interior."""
+        import threading
+        from interiors import InteriorManager
+        manager = InteriorManager(max_interiors=1)
+        build = manager._build
+        started, gate = threading.Event(), threading.Event()
+
+        def slow_first_prefetch(building_id, building_type, delta):
+            if threading.current_thread().name == "interior-prefetch" and not started.is_set():
+                started.set()
+                gate.wait(5.0)
+            return build(building_id, building_type, delta)
+
+        manager._build = slow_first_prefetch
+        manager.prefetch(building_id=11, building_type="house")  # Stale job, held
+        self.assertTrue(started.wait(5.0))
+        interior = manager.get_interior(building_id=11, building_type="house")
+        target = next(o for o in interior.objects if o.searchable)
+        index = interior.objects.index(target)
+        interior.search_object(target)
+        manager.get_interior(building_id=12, building_type="bar")  # Evicts 11 to a delta
+        manager.prefetch(building_id=11, building_type="house")
+        gate.set()
+        manager.wait_for_prefetch()
+
+        rebuilt = manager.get_interior(building_id=11, building_type="house")
+        self.assertEqual(manager.prefetch_hits, 1)
+        self.assertTrue(rebuilt.objects[index].searched)
+        manager.shutdown()
+
+    def test_room_surface_rebaked_only_on_search(self):
+        """Test the baked room is reused until a searched flag flips."""
+        from interiors import BuildingInterior
+        interior = BuildingInterior(building_type="house", seed=3)
+        screen = MockPygame.Surface((800, 600))
+        interior.draw(screen, 200, 150, player_pos=(400, 300))
+        level = interior.get_current_level()
+        baked = level.room_surface
+        self.assertIsNotNone(baked)
+
+        interior.draw(screen, 200, 150, nearby=interior.get_door())
+        self.assertIs(level.room_surface, baked)
+
+        target = next(o for o in interior.objects if o.searchable)
+        interior.search_object(target)
+        interior.draw(screen, 200, 150)
+        self.assertIsNot(level.room_surface, baked)
+
     def test_building_types_have_objects(self):
         """Test all building types generate valid interiors."""
         from interiors import BuildingInterior, BUILDING_OBJECTS
@@ -537,6 +656,42 @@ class TestBuildingInteriors(unittest.TestCase):
                              f"Building type {building_type} has no objects")
 
 
+class TestEventLog(unittest.TestCase):
+    """Tests for the ring-buffer event log and journal."""
+
+    def test_ring_buffer_evicts_oldest(self):
+        """Test the log keeps the newest entries and type indexes stay in sync."""
+        from event_log import EventLog, EventType
+        log = EventLog(max_entries=5)
+        for i in range(12):
+            if i % 3 == 0:
+                log.log_narrator(f"narrator {i}")
+            else:
+                log.log_system(f"system {i}")
+        self.assertEqual(log.count(), 5)
+        self.assertEqual(log.total_count, 12)
+        self.assertEqual([e.text for e in log.get_recent(2)], ["system 10", "system 11"])
+        self.assertEqual([e.text for e in log.get_narrator_lines()], ["narrator 9"])
+        in_window = [e for e in log.entries if e.event_type == EventType.SYSTEM]
+        self.assertEqual(log.get_by_type(EventType.SYSTEM), in_window)
+
+    def test_journal_keeps_full_history(self):
+        """Test the journal answers time-range/type queries beyond the ring buffer."""
+        import tempfile
+        from event_log import EventLog, EventType
+        with tempfile.TemporaryDirectory() as tmp:
+            log = EventLog(max_entries=10, journal_path=os.path.join(tmp, "events.jsonl"))
+            log._get_game_time = lambda: float(log.total_count)
+            for i in range(200):
+                log.add(EventType.QUEST if i % 2 else EventType.SYSTEM, f"event {i}")
+            self.assertEqual(log.count(), 10)
+
+            quests = log.query(start=20, end=40, event_type=EventType.QUEST)
+            self.assertEqual([e.timestamp for e in quests], list(range(21, 40, 2)))
+            self.assertEqual(len(log.query()), 200)
+            log.close()
+
+
 class TestQuestSystem(unittest.TestCase):
     """Tests for quest system."""
 
@@ -641,6 +796,44 @@ class TestQuestSystem(unittest.TestCase):
             # Should complete after 20 moves
             self.assertIn(tutorial_id, manager.completed_quests)
 
+    def test_quest_manager_tracks_many_quests(self):
+        """Test events reach every tracked quest and dependents unlock."""
+        from quest_system import QuestManager, QuestStatus
+        manager = QuestManager()
+        manager.update_phase("LIVING_CITY")
+        for quest_id in ("find_hospital", "witness_crime", "meet_neighbors"):
+            self.assertIsNotNone(manager.start_quest(quest_id))
+        self.assertEqual(len(manager.get_tracked_quests()), 3)
+
+        completed = manager.on_event("crime_witnessed")
+        self.assertEqual(completed.id, "witness_crime")
+        self.assertEqual(manager.quests["help_or_ignore"].status, QuestStatus.AVAILABLE)
+        self.assertEqual(manager.active_quest_id, "meet_neighbors")
+        self.assertEqual(manager.quests["find_hospital"].status, QuestStatus.ACTIVE)
+
+    def test_quest_manager_batches_events(self):
+        """Test queued events are summed per type and dispatched on flush."""
+        from quest_system import QuestManager
+        manager = QuestManager()
+        manager.update_phase("TUTORIAL")
+        manager.start_quest("tutorial_move")
+        for _ in range(25):
+            manager.queue_event("player_moved")
+        self.assertEqual(manager.quests["tutorial_move"].current_count, 0)
+
+        completed = manager.flush_events()
+        self.assertEqual([q.id for q in completed], ["tutorial_move"])
+        self.assertEqual(manager.flush_events(), [])
+
+    def test_quest_manager_phase_gating(self):
+        """Test a phase change only unlocks quests gated on that phase."""
+        from quest_system import QuestManager, QuestStatus
+        manager = QuestManager()
+        manager.update_phase("SOMETHING_WRONG")
+        self.assertEqual(manager.quests["first_anomaly"].status, QuestStatus.AVAILABLE)
+        self.assertEqual(manager.quests["find_hospital"].status, QuestStatus.LOCKED)
+        self.assertEqual(manager.quests["gather_clues"].status, QuestStatus.LOCKED)
+
     def test_all_quests_defined(self):
         """Test essential quests exist."""
         from quest_system import ALL_QUESTS
@@ -660,6 +853,1177 @@ class TestQuestSystem(unittest.TestCase):
         self.assertGreater(hints_found, 0, "No quests have horror hints")
 
 
+class TestSaveService(unittest.TestCase):
+    """Tests for the background save service."""
+
+    def test_bursts_coalesce(self):
+        """Test a burst of requests within the interval coalesces into atomic writes."""
+        import tempfile
+        from save_service import SaveService, read_save
+        from quest_system import QuestManager
+        manager = QuestManager()
+        manager.update_phase("TUTORIAL")
+        manager.start_quest("tutorial_move")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "progress.sav")
+            service = SaveService(path, interval=60.0)
+            for _ in range(50):
+                manager.on_event("player_moved")
+                service.request("quests", manager.save())
+            self.assertTrue(service.flush())
+            self.assertEqual(service.requests, 50)
+            # One write per interval, plus the forced flush
+            self.assertLessEqual(service.writes, 2)
+            service.close()
+
+            data = read_save(path)
+            self.assertIn("tutorial_move", data["quests"]["completed"])
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_corrupt_save_rejected(self):
+        """Test a damaged file is detected rather than half-loaded."""
+        import tempfile
+        from save_service import write_save, read_save
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "progress.sav")
+            write_save(path, {"quests": {"completed": ["a"]}})
+            with open(path, "r+b") as f:
+                f.seek(-3, os.SEEK_END)
+                f.write(b"\x00\x00\x00")
+            with self.assertRaises(ValueError):
+                read_save(path)
+
+    def test_sections_merge_with_existing_save(self):
+        """Test a new section is written alongside the ones already saved."""
+        import tempfile
+        from save_service import SaveService, write_save, read_save
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "progress.sav")
+            write_save(path, {"quests": {"completed": ["tutorial_move"]}})
+            service = SaveService(path, interval=0.0)
+            self.assertEqual(service.get_section("quests"), {"completed": ["tutorial_move"]})
+            service.request("found_items", ["rusty_key"])
+            service.close()
+            data = read_save(path)
+        self.assertEqual(set(data), {"quests", "found_items"})
+        self.assertEqual(data["found_items"], ["rusty_key"])
+
+    def test_found_item_survives_restart_without_plot_save(self):
+        """Test a journaled item is back in the inventory after a restart."""
+        import tempfile
+        from types import SimpleNamespace
+        from save_service import SaveService
+        from run_wrapped import _restore_found_items
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "progress.sav")
+            service = SaveService(path, interval=0.0)
+            service.request("found_items", ["rusty_key"])
+            service.close()  # Killed before exit: plot_state.save() never ran
+
+            items = []
+            plot_state = SimpleNamespace(inventory=SimpleNamespace(items=items, add=items.append))
+            restarted = SaveService(path, interval=0.0)
+            found = _restore_found_items(plot_state, restarted.get_section("found_items") or [],
+                                         lambda item_id: SimpleNamespace(id=item_id))
+            restarted.close()
+        self.assertEqual([item.id for item in plot_state.inventory.items], ["rusty_key"])
+        self.assertEqual(found, ["rusty_key"])
+
+    def test_quest_save_snapshot_cached(self):
+        """Test QuestManager.save() reuses its snapshot until state changes."""
+        from quest_system import QuestManager
+        manager = QuestManager()
+        manager.update_phase("TUTORIAL")
+        first = manager.save()
+        self.assertIs(manager.save(), first)
+        manager.start_quest("tutorial_move")
+        self.assertIsNot(manager.save(), first)
+
+
+class TestTimerScheduler(unittest.TestCase):
+    """Tests for the timer scheduler and the entities parked on it."""
+
+    def test_fires_in_deadline_order(self):
+        """Test due timers fire in deadline order, ties in scheduling order."""
+        from scheduler import TimerScheduler
+        scheduler = TimerScheduler()
+        fired = []
+        scheduler.schedule(1.0, fired.append, "b")
+        scheduler.schedule(0.5, fired.append, "a")
+        scheduler.schedule(1.0, fired.append, "c")
+        cancelled = scheduler.schedule(0.2, fired.append, "x")
+        scheduler.cancel(cancelled)
+
+        self.assertEqual(scheduler.advance(0.4), 0)
+        self.assertAlmostEqual(scheduler.time_left(cancelled), 0.0)
+        self.assertEqual(scheduler.advance(0.7), 3)
+        self.assertEqual(fired, ["a", "b", "c"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_callback_timers_wait_a_frame(self):
+        """Test a timer scheduled from a callback fires on a later advance."""
+        from scheduler import TimerScheduler
+        scheduler = TimerScheduler()
+        fired = []
+        scheduler.schedule(0.1, lambda: scheduler.schedule(0.0, fired.append, "next"))
+        scheduler.advance(0.2)
+        self.assertEqual(fired, [])
+        scheduler.advance(0.0)
+        self.assertEqual(fired, ["next"])
+
+    def test_waiting_npcs_are_parked(self):
+        """Test waiting NPCs leave the update set and return with a path."""
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=5,
+                             criminal_count=0, police_count=0, civilian_count=6,
+                             animal_count=0)
+        # Every NPC starts with a staggered pause (plus the next car pull-out)
+        self.assertEqual(sim.npc_engine.walking_count(), 0)
+        self.assertEqual(len(sim.scheduler), 6 + 1)
+
+        sim.run_for(3.1)
+        self.assertEqual(sim.npc_engine.walking_count(), 6)
+        self.assertTrue(all(npc.path for npc in sim.all_npcs))
+
+    def test_idle_animal_flees_player(self):
+        """Test an idle skittish animal wakes when the player comes close."""
+        from city_entities import AnimalManager, Animal, AnimalType
+        manager = AnimalManager(2000, 2000)
+        pigeon = Animal(x=500.0, y=500.0, animal_type=AnimalType.PIGEON, rng=manager.rng)
+        manager.animals.append(pigeon)
+        manager._set_timer(pigeon, 30.0)
+        manager._file_animal(pigeon)
+
+        manager.update(1 / 60, 1500.0, 1500.0)
+        self.assertEqual(pigeon.state, "idle")
+        self.assertEqual((pigeon.x, pigeon.y), (500.0, 500.0))
+
+        manager.update(1 / 60, 540.0, 500.0)
+        self.assertEqual(pigeon.state, "fleeing")
+        self.assertLess(pigeon.x, 500.0)
+
+
+class TestSpatialPlacement(unittest.TestCase):
+    """Tests for Poisson-disk placement and the point grid."""
+
+    def test_poisson_disk_keeps_spacing(self):
+        """Test picks respect the minimum distance while sites allow it."""
+        import random
+        from spatial import poisson_disk_sample
+        sites = [(x, y) for x in range(0, 1000, 10) for y in range(0, 1000, 10)]
+        picked = poisson_disk_sample(sites, 20, 150, random.Random(4))
+        self.assertEqual(len(picked), 20)
+        for i, (ax, ay) in enumerate(picked):
+            for bx, by in picked[i + 1:]:
+                self.assertGreaterEqual((ax - bx) ** 2 + (ay - by) ** 2, 150 ** 2)
+
+    def test_poisson_disk_relaxes_when_crowded(self):
+        """Test the spacing relaxes instead of returning too few sites."""
+        import random
+        from spatial import poisson_disk_sample
+        sites = [(x, 0) for x in range(0, 100, 10)]
+        self.assertEqual(len(poisson_disk_sample(sites, 8, 500, random.Random(1))), 8)
+
+    def test_point_grid_radius_query(self):
+        """Test grid queries return only items inside the radius."""
+        from spatial import PointGrid
+        grid = PointGrid(50)
+        grid.insert("near", 110, 100)
+        grid.insert("edge", 140, 100)
+        grid.insert("far", 400, 400)
+        self.assertEqual(sorted(grid.nearby(100, 100, 40)), ["near"])
+        grid.remove("near")
+        self.assertEqual(grid.nearby(100, 100, 40), [])
+        self.assertEqual(len(grid), 2)
+
+    def test_anomalies_spread_over_sidewalks(self):
+        """Test anomalies sit on walkable sites and are found via the grid."""
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=1600, world_height=1200), seed=8,
+                             criminal_count=0, police_count=0, civilian_count=0,
+                             animal_count=0)
+        sites = set(sim.city_map.get_walkable_points())
+        anomalies = sim.game_loop.state.anomalies
+        for anomaly in anomalies:
+            self.assertIn((anomaly.x, anomaly.y), sites)
+
+        target = anomalies[2]
+        sim.game_loop._update_anomalies(0.016, target.x + 10, target.y)
+        self.assertTrue(target.discovered)
+        self.assertEqual(sim.game_loop.state.anomalies_discovered, 1)
+
+    def test_clues_discovered_once(self):
+        """Test clues are placed on sites and discovered through the grid."""
+        from city_entities import InvestigationManager
+        sites = [(x, y) for x in range(100, 900, 40) for y in range(100, 700, 40)]
+        manager = InvestigationManager(clue_sites=sites)
+        case = manager.create_case("robbery", 1000, 800)
+        self.assertEqual(len(case.clues), 3)
+        clue = case.clues[0]
+        self.assertIn((clue.x, clue.y), sites)
+        self.assertIs(manager.check_clue_discovery(clue.x + 5, clue.y), clue)
+        self.assertIsNone(manager.check_clue_discovery(clue.x + 5, clue.y))
+        self.assertEqual(case.clues_found, 1)
+
+    def test_placement_ignores_global_random(self):
+        """Test anomaly and clue layouts depend only on their own streams."""
+        import random
+        from city_entities import InvestigationManager
+        from game_loop import GameLoopManager
+
+        def layout(global_seed):
+            random.seed(global_seed)  # Whatever else drew from the random module
+            game_loop = GameLoopManager(1600, 1200, rng=random.Random(4))
+            case = InvestigationManager(rng=random.Random(5)).create_case("robbery", 1600, 1200)
+            return ([(a.x, a.y) for a in game_loop.state.anomalies],
+                    [(c.x, c.y, c.clue_type, c.description) for c in case.clues])
+
+        self.assertEqual(layout(1), layout(2))
+
+
+class TestNPCMovementEngine(unittest.TestCase):
+    """Tests for the batched NPC movement engine."""
+
+    def _engine(self, use_numpy=False):
+        from npc_engine import NPCMovementEngine
+        engine = NPCMovementEngine(capacity=2, use_numpy=use_numpy)
+        engine.add(0.0, 0.0, 1.5)
+        engine.add(100.0, 100.0, 1.5)
+        engine.add(50.0, 50.0, 1.5)  # Grows past the initial capacity
+        engine.set_target(0, 100.0, 0.0)
+        engine.set_target(1, 101.0, 101.0)
+        return engine
+
+    def test_step_returns_arrivals(self):
+        """Test walkers move and only rows that reached a waypoint come back."""
+        engine = self._engine()
+        self.assertEqual(engine.step(1 / 60), [1])
+        self.assertAlmostEqual(engine.x[0], 1.5)
+        self.assertEqual((engine.x[1], engine.y[1]), (101.0, 101.0))
+        self.assertEqual((engine.x[2], engine.y[2]), (50.0, 50.0))
+        self.assertEqual(engine.walking_count(), 1)
+
+    def test_held_and_jailed_rows_stay_put(self):
+        """Test held rows and flagged rows don't move."""
+        from npc_engine import IN_JAIL
+        engine = self._engine()
+        engine.step(1 / 60, hold=[0])
+        self.assertEqual(engine.x[0], 0.0)
+        engine.set_flag(0, IN_JAIL, True)
+        engine.step(1 / 60)
+        self.assertEqual(engine.x[0], 0.0)
+
+    @unittest.skipUnless(__import__("npc_engine").HAS_NUMPY, "NumPy not installed")
+    def test_numpy_matches_lists(self):
+        """Test the NumPy backend gives the same results as the list one."""
+        plain, vector = self._engine(False), self._engine(True)
+        for _ in range(30):
+            self.assertEqual(plain.step(1 / 60), vector.step(1 / 60))
+        self.assertAlmostEqual(plain.x[0], float(vector.x[0]))
+
+    def test_npc_is_row_view(self):
+        """Test CityNPC reads and writes its engine row."""
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=2,
+                             criminal_count=1, police_count=1, civilian_count=1,
+                             animal_count=0)
+        npc = sim.all_npcs[1]
+        npc.x = 321.0
+        self.assertEqual(sim.npc_engine.x[npc.row], 321.0)
+        npc.in_jail = True
+        sim.run_for(4.0)
+        self.assertEqual(npc.x, 321.0)
+
+    def test_frozen_npc_picks(self):
+        """Test the freeze glitch only picks NPCs once entropy is high."""
+        from corruption import CorruptionManager
+        import random
+        corruption = CorruptionManager(rng=random.Random(6))
+        self.assertEqual(corruption.pick_frozen_npcs(5000), [])
+        corruption.entropy = 0.8
+        picked = corruption.pick_frozen_npcs(5000)
+        self.assertTrue(0 < len(picked) < 40)
+        self.assertEqual(picked, sorted(set(picked)))
+        self.assertLess(picked[-1], 5000)
+
+
+class TestPathPlanner(unittest.TestCase):
+    """Tests for the sidewalk graph and the path-request queue."""
+
+    def setUp(self):
+        self.city_map = CityMap(CityConfig(world_width=800, world_height=600))
+        self.graph = self.city_map.sidewalk_graph
+        nodes = self.city_map.sidewalk_nodes
+        self.routes = [((nodes[i].x, nodes[i].y), (nodes[-1 - i].x, nodes[-1 - i].y))
+                       for i in range(6)]
+
+    def test_graph_finds_connected_path(self):
+        """Test graph paths start near the start and end on the destination."""
+        (sx, sy), (ex, ey) = self.routes[0]
+        path = self.graph.find_path(sx, sy, ex, ey)
+        self.assertEqual(path[0], (sx, sy))
+        self.assertEqual(path[-1], (ex, ey))
+        self.assertEqual(self.graph.nearest(sx + 1, sy + 1), self.graph.nearest(sx, sy))
+
+    def test_inline_budget_spreads_results(self):
+        """Test inline planning hands back at most the budget per collect."""
+        from path_planner import PathPlanner
+        planner = PathPlanner(self.graph, apply_budget=4)
+        for owner, (start, end) in enumerate(self.routes):
+            planner.request(owner, start, end)
+        first = planner.collect()
+        self.assertEqual([owner for owner, _ in first], [0, 1, 2, 3])
+        self.assertEqual(planner.get_stats()["queued"], 2)
+        self.assertEqual(len(planner.collect()), 2)
+        self.assertEqual(planner.get_stats()["completed"], 6)
+
+    def test_newer_request_replaces_older(self):
+        """Test only the latest request per owner is delivered."""
+        from path_planner import PathPlanner
+        planner = PathPlanner(self.graph)
+        planner.request("npc", *self.routes[0])
+        planner.request("npc", *self.routes[1])
+        planner.request("gone", *self.routes[2])
+        planner.cancel("gone")
+        results = planner.collect()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][1][-1], self.routes[1][1])
+
+    def test_worker_threads_match_inline(self):
+        """Test threaded planning delivers the same paths as inline planning."""
+        from path_planner import PathPlanner
+        planner = PathPlanner(self.graph, workers=2)
+        try:
+            for owner, (start, end) in enumerate(self.routes):
+                planner.request(owner, start, end)
+            self.assertTrue(planner.wait_idle())
+            results = dict(planner.collect())
+        finally:
+            planner.shutdown()
+        for owner, (start, end) in enumerate(self.routes):
+            self.assertEqual(results[owner], self.city_map.find_path(*start, *end))
+
+    def test_npc_waits_for_its_path(self):
+        """Test a woken NPC stays put until its path is applied."""
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=4,
+                             criminal_count=0, police_count=0, civilian_count=1,
+                             animal_count=0)
+        npc = sim.all_npcs[0]
+        sim.scheduler.cancel(sim._npc_timers.get(npc))
+        sim._wake_npc(npc)
+        self.assertFalse(sim.npc_engine.walking_count())
+        self.assertEqual(sim.path_planner.get_stats()["queued"], 1)
+        sim._apply_paths()
+        self.assertTrue(npc.path)
+        self.assertEqual(npc.path_index, 0)
+        self.assertEqual(sim.path_planner.get_stats()["queued"], 0)
+
+
+class TestFlowField(unittest.TestCase):
+    """Tests for the shared flow field toward the player."""
+
+    def _field(self, **kwargs):
+        from flow_field import FlowField
+        # 10x10 cells with a wall down column 5, open only at the bottom row
+        wall = MockPygame.Rect(200, 0, 40, 360)
+        return FlowField(400, 400, [wall], cell_size=40, **kwargs)
+
+    def test_idle_field_is_two_bytes_per_cell(self):
+        """Test a large field allocates no per-cell objects before a rebuild."""
+        import tracemalloc
+        from flow_field import FlowField
+        tracemalloc.start()
+        try:
+            field = FlowField(6000, 4000)
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        cells = field.cols * field.rows
+        self.assertLess(allocated, 2 * cells + 4096)
+
+    def test_path_goes_around_wall(self):
+        """Test distances route around blocked cells."""
+        field = self._field()
+        field.update(0.0, 300, 20)
+        self.assertEqual(field.distance(300, 20), 0)
+        # Straight across is 5 cells; down, around the wall's end and back up is 23
+        self.assertEqual(field.distance(100, 20), 23)
+        self.assertIsNone(field.direction(300, 20))
+
+        # Following the directions walks around the wall to the goal
+        x, y = 100.0, 20.0
+        for _ in range(40):
+            step = field.direction(x, y)
+            if step is None:
+                break
+            self.assertTrue(field.passable[field.cell_at(x + step[0] * 40, y + step[1] * 40)])
+            x, y = x + step[0] * 40, y + step[1] * 40
+        self.assertEqual(field.cell_at(x, y), field.cell_at(300, 20))
+
+    def test_flee_increases_distance(self):
+        """Test the flee direction leads uphill."""
+        field = self._field()
+        field.update(0.0, 100, 100)
+        x, y = 140.0, 140.0
+        dx, dy = field.flee_direction(x, y)
+        self.assertGreater(field.distance(x + dx * 40, y + dy * 40), field.distance(x, y))
+
+    def test_rebuilds_are_lazy_and_throttled(self):
+        """Test the field rebuilds only on query, cell change and interval."""
+        field = self._field(rebuild_interval=0.25)
+        field.update(0.1, 20, 20)
+        self.assertEqual(field.builds, 0)
+        field.direction(100, 100)
+        field.update(0.1, 30, 30)  # Same cell
+        field.direction(100, 100)
+        self.assertEqual(field.builds, 1)
+        field.update(0.1, 60, 20)  # New cell, too soon
+        field.direction(100, 100)
+        self.assertEqual(field.builds, 1)
+        field.update(0.2, 60, 20)
+        field.direction(100, 100)
+        self.assertEqual(field.builds, 2)
+
+    def test_scared_civilians_flee_then_resume(self):
+        """Test civilians near an attack run from the player and then calm down."""
+        import math
+        from simulation import CitySimulation, FLEE_TIME
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=5,
+                             criminal_count=0, police_count=0, civilian_count=3,
+                             animal_count=0)
+        civ = sim.civilians[0]
+        sim.player.x, sim.player.y = civ.x + 30, civ.y
+        self.assertGreaterEqual(sim.scare_civilians(sim.player.x, sim.player.y), 1)
+        start = math.hypot(civ.x - sim.player.x, civ.y - sim.player.y)
+        sim.run_for(1.0)
+        self.assertGreater(math.hypot(civ.x - sim.player.x, civ.y - sim.player.y), start)
+        sim.run_for(FLEE_TIME)
+        self.assertEqual(civ.flee_timer, 0.0)
+        self.assertNotIn(civ, sim._fleeing)
+
+    def test_fleeing_off_field_stays_put(self):
+        """Test a fleeing NPC with no field direction doesn't cut through buildings."""
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=5,
+                             criminal_count=0, police_count=0, civilian_count=3,
+                             animal_count=0)
+        civ = sim.civilians[0]
+        sim.player.x, sim.player.y = civ.x + 30, civ.y
+        sim.scare_civilians(sim.player.x, sim.player.y)
+        sim.player_field.flee_direction = lambda x, y: None
+        start = (civ.x, civ.y)
+        sim.run_for(0.5)
+        self.assertEqual((civ.x, civ.y), start)
+        self.assertIn(civ, sim._fleeing)
+
+
+class TestWaterFrames(unittest.TestCase):
+    """Tests for the pre-rendered water animation frames."""
+
+    def test_frames_loop_and_are_shared_by_size(self):
+        """Test same-size lakes share frames and the animation loops."""
+        from city_map import WaterBody, WaterFrameCache, WATER_WAVE_PERIOD
+        cache = WaterFrameCache(frame_count=32)
+        lake_a = WaterBody(0, 0, 500, 600)
+        lake_b = WaterBody(2000, 0, 500, 600)
+        lake_b.wave_offset = lake_a.wave_offset
+        strips_a = cache.get(lake_a, 1.0)
+        self.assertIs(cache.get(lake_b, 1.0), strips_a)
+        self.assertIs(cache.get(lake_a, 1.0 + WATER_WAVE_PERIOD), strips_a)
+        self.assertEqual(cache.renders, 1)
+        cache.get(WaterBody(0, 0, 400, 600), 1.0)
+        self.assertEqual(len(cache), 2)
+
+    def test_offscreen_frames_evicted(self):
+        """Test frames are dropped once their lake has been off screen a while."""
+        from city_map import WaterBody, WaterFrameCache
+        cache = WaterFrameCache(ttl=5.0)
+        lake = WaterBody(0, 0, 500, 600)
+        camera = Camera(800, 600, 4800, 3600)
+        lake.draw(MockPygame.Surface((800, 600)), camera, 0.0, cache)
+        self.assertEqual(cache.evict(4.0), 0)
+        camera.x = 3000  # Lake off screen: draw skips it
+        lake.draw(MockPygame.Surface((800, 600)), camera, 4.0, cache)
+        self.assertEqual(cache.evict(6.0), 1)
+        self.assertEqual(len(cache), 0)
+
+
+class TestStaticLayerBaking(unittest.TestCase):
+    """Tests for baking lots, bridges and parked cars into the road layer."""
+
+    def test_waves_skip_bridges(self):
+        """Test wave strips under a bridge are left out."""
+        from city_map import WaterBody
+        lake = WaterBody(100, 100, 400, 600)
+        lake.set_covers([MockPygame.Rect(80, 360, 440, 80)])  # Across the middle
+        self.assertEqual({piece[0] for piece in lake._wave_pieces}, {0})
+        lake.set_covers([MockPygame.Rect(200, 0, 50, 800)])  # Down one side
+        self.assertEqual(len(lake._wave_pieces), 4)  # Both strips split in two
+
+    def test_unstamp_restamps_overlapping(self):
+        """Test lifting a stamp puts back later stamps that overlapped it."""
+        city_map = CityMap(CityConfig(world_width=800, world_height=600))
+        draws = []
+        city_map.stamp("a", MockPygame.Rect(10, 10, 40, 40), lambda s, c: draws.append("a"))
+        city_map.stamp("b", MockPygame.Rect(30, 30, 40, 40), lambda s, c: draws.append("b"))
+        city_map.stamp("c", MockPygame.Rect(300, 300, 40, 40), lambda s, c: draws.append("c"))
+        self.assertTrue(city_map.unstamp("a"))
+        self.assertEqual(draws, ["a", "b", "c", "b"])
+        self.assertEqual(list(city_map._stamps), ["c", "b"])
+        self.assertFalse(city_map.unstamp("a"))
+        self.assertFalse(city_map.stamp("d", MockPygame.Rect(900, 900, 10, 10), None))
+
+    def test_parked_cars_baked_until_started(self):
+        """Test parked cars aren't drawn live until they pull out."""
+        from simulation import CitySimulation
+        from city_entities import VehicleType
+        sim = CitySimulation(CityConfig(world_width=1600, world_height=1200), seed=8,
+                             criminal_count=0, police_count=0, civilian_count=0,
+                             animal_count=0)
+        manager = sim.vehicle_manager
+        manager.draw(MockPygame.Surface((800, 600)), Camera(800, 600, 1600, 1200))
+        parked = [v for v in manager.vehicles
+                  if v.parked and v.vehicle_type != VehicleType.POLICE_CAR]
+        self.assertTrue(parked)
+        self.assertFalse(any(v in manager._drawn for v in parked))
+        manager.start_vehicle(parked[0])
+        sim.step()
+        self.assertIn(parked[0], manager._drawn)
+        self.assertIn(parked[0], manager._active)
+        self.assertNotIn(id(parked[0]), sim.city_map._stamps)
+
+    def test_parked_car_pulls_out_on_timer(self):
+        """Test the scheduler pulls a baked car out, holds it, then drives it."""
+        from simulation import CitySimulation
+        from city_entities import PULL_OUT_INTERVAL, PULL_OUT_WAIT
+        sim = CitySimulation(CityConfig(world_width=1600, world_height=1200), seed=8,
+                             criminal_count=0, police_count=0, civilian_count=0,
+                             animal_count=0)
+        manager = sim.vehicle_manager
+        baked = len(manager._baked)
+        sim.scheduler.advance(PULL_OUT_INTERVAL[1])
+        self.assertEqual(manager.pulled_out, 1)
+        self.assertEqual(len(manager._baked), baked - 1)
+        car = next(v for v in manager.vehicles if v.waiting)
+        self.assertFalse(car.parked)
+        manager.update(0.1)
+        self.assertNotIn(car, manager._active)
+        sim.scheduler.advance(PULL_OUT_WAIT)
+        manager.update(0.1)
+        self.assertIn(car, manager._active)
+
+
+class TestNPCRegistry(unittest.TestCase):
+    """Tests for lazy NPC registration with the dialogue system."""
+
+    def setUp(self):
+        from types import SimpleNamespace
+        from npc_registry import NPCRegistry
+        from rng import RNGService
+        self.created = []
+        self.registry = NPCRegistry(lambda profile, stage: (profile.npc_id, stage),
+                                    self.created.append, rng=RNGService(7))
+        self.registry.set_stage("early")
+        self.npcs = [SimpleNamespace(x=x, y=0, type="civilian", row=row)
+                     for row, x in enumerate((100, 350, 1000))]
+
+    def tearDown(self):
+        self.registry.shutdown()
+
+    def test_registers_near_and_predicted_npcs(self):
+        """Test only NPCs near the player or its predicted position are registered."""
+        self.assertEqual(self.registry.register_ahead(self.npcs, 0, 0, vx=300, vy=0), 2)
+        self.registry.wait_idle()
+        self.assertEqual(self.created, [])  # Prepared off-thread, not yet registered
+        self.assertEqual(self.registry.drain(), 2)
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.registry.register_ahead(self.npcs, 0, 0, vx=300, vy=0), 0)
+        stats = self.registry.get_stats()
+        self.assertEqual((stats["profiles"], stats["registered"]), (2, 2))
+
+    def test_drain_is_budgeted_on_calling_thread(self):
+        """Test prepared NPCs reach the overlay on the draining thread, budget per call."""
+        import threading
+        from types import SimpleNamespace
+        npcs = [SimpleNamespace(x=10 * row, y=0, type="civilian", row=row) for row in range(5)]
+        threads = []
+        self.registry.create = lambda spec: threads.append(threading.current_thread())
+        self.assertEqual(self.registry.register_ahead(npcs, 0, 0), 5)
+        self.registry.wait_idle()
+        self.assertEqual(self.registry.drain(), 2)
+        self.assertEqual(self.registry.drain(), 2)
+        self.assertEqual(self.registry.drain(), 1)
+        self.assertEqual(threads, [threading.current_thread()] * 5)
+
+    def test_stale_stage_preparations_are_dropped(self):
+        """Test NPCs prepared for an old stage are re-queued, not registered."""
+        self.registry.register_ahead(self.npcs, 0, 0)
+        self.registry.wait_idle()
+        self.registry.set_stage("late")
+        self.assertEqual(self.registry.drain(), 0)
+        self.assertEqual(self.registry.register_ahead(self.npcs, 0, 0), 1)
+        self.registry.wait_idle()
+        self.registry.drain()
+        self.assertEqual(self.created, [(self.registry.profile(self.npcs[0]).npc_id, "late")])
+
+    def test_stage_change_reregisters_from_seed(self):
+        """Test a stage change re-registers on demand with the same seeded profile."""
+        from npc_registry import NPCRegistry
+        from rng import RNGService
+        profile = self.registry.ensure(self.npcs[2])
+        self.registry.ensure(self.npcs[2])
+        self.registry.set_stage("late")
+        self.assertFalse(self.registry.is_registered(profile.npc_id))
+        self.registry.ensure(self.npcs[2])
+        self.assertEqual(self.created, [(profile.npc_id, "early"), (profile.npc_id, "late")])
+
+        again = NPCRegistry(lambda profile, stage: None, lambda spec: None,
+                            rng=RNGService(7)).profile(self.npcs[2])
+        self.assertEqual(again.seed, profile.seed)
+        self.assertEqual(again.rng().random(), profile.rng().random())
+
+
+class TestStatusPanel(unittest.TestCase):
+    """Tests for the retained-mode status panel and its change notifications."""
+
+    def setUp(self):
+        from status_panel import StatusPanel
+        self.rendered = []
+
+        def renderer(tab, height):
+            def render(panel):
+                self.rendered.append(tab)
+                return panel.new_page(height)
+            return render
+
+        self.panel = StatusPanel(800, 600, [renderer(0, 0), renderer(1, 1000)])
+        self.screen = TestPostProcessor.CountingSurface((800, 600))
+
+    def test_pages_render_once_until_invalidated(self):
+        """Test a tab re-renders only after invalidate(), and only when shown."""
+        for _ in range(3):
+            self.panel.draw(self.screen, 0)
+        self.assertEqual(self.rendered, [0])
+        self.assertEqual(self.screen.blits, 9)  # Frame, header, page each frame
+
+        self.panel.invalidate(0, 1)
+        self.panel.draw(self.screen, 0)
+        self.assertEqual(self.rendered, [0, 0])
+        self.panel.draw(self.screen, 1)
+        self.assertEqual(self.rendered, [0, 0, 1])
+
+    def test_scroll_is_clamped_without_rerender(self):
+        """Test scrolling stays inside the page and never re-renders it."""
+        from status_panel import CONTENT_HEIGHT
+        self.panel.draw(self.screen, 1)
+        self.panel.scroll(1, 5000)
+        self.assertEqual(self.panel._scroll[1], 1000 - CONTENT_HEIGHT)
+        self.panel.scroll(1, -5000)
+        self.assertEqual(self.panel._scroll[1], 0)
+        self.panel.draw(self.screen, 1)
+        self.assertEqual(self.rendered, [1])
+        self.assertEqual(self.panel.tab_at((self.panel.x + 5, self.panel.y + 5)), 0)
+        self.assertIsNone(self.panel.tab_at((0, 0)))
+
+    def test_sources_send_change_notifications(self):
+        """Test the event log, quests and player stats report changes."""
+        from event_log import EventLog
+        from quest_system import QuestManager
+        from simulation import CityPlayer
+        changes = []
+
+        log = EventLog()
+        log.on_add = lambda entry: changes.append("log")
+        log.log_system("hello")
+
+        quests = QuestManager()
+        quests.on_change = lambda: changes.append("quests")
+        quests.update_phase("TUTORIAL")
+
+        player = CityPlayer(0, 0, None, 800, 600)
+        player.on_stats_changed = lambda: changes.append("player")
+        player.karma += 5
+        player.health = 100  # Unchanged: no notification
+        player.change_alignment("good")
+        self.assertEqual(player.karma, 5)
+
+        self.assertEqual(changes[0], "log")
+        self.assertIn("quests", changes)
+        self.assertEqual(changes.count("player"), 2)
+
+
+class TestLightingTable(unittest.TestCase):
+    """Tests for the per-minute lighting table and pre-darkened building colours."""
+
+    def test_table_matches_periods(self):
+        """Test each minute's snapshot matches its period and periods share one."""
+        from city_map import MINUTES_PER_DAY
+        cycle = DayNightCycle(start_hour=21.0)
+        night = cycle.get_lighting()
+        self.assertEqual(night.time_of_day, TimeOfDay.NIGHT)
+        self.assertEqual(night.darkness_alpha, 120)
+        self.assertEqual(night.darkness_tint, CityMap.get_darkness_tint(120))
+        self.assertTrue(night.is_night)
+
+        table = cycle._lighting_table
+        self.assertEqual(len(table), MINUTES_PER_DAY)
+        self.assertEqual(len({id(entry) for entry in table}), len(TimeOfDay))
+        self.assertEqual(table[5 * 60 - 1].time_of_day, TimeOfDay.NIGHT)
+        self.assertEqual(table[5 * 60].time_of_day, TimeOfDay.DAWN)
+
+        cycle.game_hour = 13.25
+        self.assertIs(cycle.get_lighting(), table[13 * 60 + 15])
+        self.assertEqual(cycle.get_darkness_alpha(), 0)
+        self.assertEqual(cycle.get_window_lit_chance(), 0.1)
+
+    def test_building_colors_darkened_once(self):
+        """Test blocks darken their colours only when the darkness changes."""
+        from city_map import CityBlock
+        block = CityBlock(0, 0, 200, 160)
+        self.assertIs(block._colors_for(0), block.building_colors)
+        night = block._colors_for(120)
+        self.assertIs(block._colors_for(120), night)
+        self.assertEqual(night[0], tuple(max(0, c - 40) for c in block.building_colors[0]))
+
+
+class TestCitySimulation(unittest.TestCase):
+    """Tests for the headless CitySimulation."""
+
+    def _make_sim(self, seed=3):
+        from simulation import CitySimulation
+        config = CityConfig(world_width=800, world_height=600)
+        return CitySimulation(config, seed=seed, criminal_count=2,
+                              police_count=2, civilian_count=4, animal_count=5)
+
+    def test_owns_world_state(self):
+        """Test the simulation builds NPC groups and subsystems."""
+        sim = self._make_sim()
+        self.assertEqual(len(sim.all_npcs), 8)
+        self.assertEqual(len(sim.criminals), 2)
+        self.assertEqual(len(sim.police), 2)
+        self.assertEqual(len(sim.civilians), 4)
+        self.assertIs(sim.game_loop.narrator, sim.narrator_queue)
+
+    def test_step_fixed_dt(self):
+        """Test stepping advances time at the fixed timestep."""
+        sim = self._make_sim()
+        sim.start()
+        results = sim.run_for(1.0)
+        self.assertEqual(len(results), 60)
+        self.assertEqual(sim.frame, 60)
+        self.assertAlmostEqual(sim.time, 1.0, places=5)
+
+    def test_frozen_npc_does_not_move(self):
+        """Test a frozen NPC keeps its position."""
+        sim = self._make_sim()
+        npc = sim.all_npcs[0]
+        npc.wait_timer = 0.0
+        npc.path = [(npc.x + 100, npc.y)]
+        npc.path_index = 0
+        start = (npc.x, npc.y)
+        sim.step(frozen_npc=npc)
+        self.assertEqual((npc.x, npc.y), start)
+
+    def test_profile_records_sections(self):
+        """Test profiling records every step section."""
+        sim = self._make_sim()
+        sim.profile = {}
+        sim.step()
+        for section in sim.PROFILE_SECTIONS:
+            self.assertEqual(len(sim.profile[section]), 1)
+
+
+    def test_attack_starts_pursuit_and_arrest(self):
+        """Test attacking police makes the player wanted until caught."""
+        sim = self._make_sim()
+        sim.start()
+        cop = sim.police[0]
+        cop.x, cop.y = sim.player.x + 20, sim.player.y
+        result = sim.attack()
+        self.assertTrue(result["attacked_police"])
+        self.assertEqual(result["wanted_event"], "police_alerted")
+        self.assertTrue(sim.pursuit.wanted)
+        self.assertEqual(cop.health, 75)
+        events = [step.pursuit_event for step in sim.run_for(1.0)]
+        self.assertIn("player_arrested", events)
+        self.assertTrue(sim.pursuit.in_jail)
+        self.assertEqual(sim.pursuit.pursuing, [])
+
+    def test_quests_progress_once_per_step(self):
+        """Test world events advance quests and completions unlock the next."""
+        sim = self._make_sim()
+        sim.start()
+        completed = []
+        for _ in range(20):
+            completed.extend(sim.step(player_moving=True).completed_quests)
+        self.assertEqual([quest.id for quest in completed], ["tutorial_move"])
+        self.assertIn("tutorial_talk", sim.quests.tracked)
+        sim.talk_to(sim.all_npcs[0])
+        self.assertEqual([quest.id for quest in sim.step().completed_quests],
+                         ["tutorial_talk"])
+
+    def test_move_player_applies_drift(self):
+        """Test keyboard steering builds corruption drift into movement."""
+        sim = self._make_sim()
+        sim.corruption.entropy = 0.8
+        final = sim.move_player(1.0, 0.0, sim.FIXED_DT, steering=True)
+        self.assertGreater(final[0], 1.0)
+        coast = sim.move_player(0.0, 0.0, sim.FIXED_DT)  # Overshoot after release
+        self.assertAlmostEqual(coast[0], final[0] - 1.0)
+
+
+class TestRNGService(unittest.TestCase):
+    """Tests for the seeded RNG service."""
+
+    def test_same_seed_same_streams(self):
+        """Test streams replay exactly from the master seed."""
+        from rng import RNGService
+        a = RNGService(99).stream("weather")
+        b = RNGService(99).stream("weather")
+        self.assertEqual([a.random() for _ in range(5)],
+                         [b.random() for _ in range(5)])
+
+    def test_streams_are_independent(self):
+        """Test drawing from one stream doesn't shift another."""
+        from rng import RNGService
+        quiet = RNGService(5)
+        busy = RNGService(5)
+        for _ in range(100):
+            busy.stream("crime").random()
+        self.assertEqual(quiet.stream("weather").random(),
+                         busy.stream("weather").random())
+        self.assertNotEqual(quiet.derive_seed("crime"), quiet.derive_seed("weather"))
+
+    def test_simulation_records_seed(self):
+        """Test the simulation exposes its master seed for replay."""
+        from simulation import CitySimulation
+        config = CityConfig(world_width=800, world_height=600)
+        sim = CitySimulation(config, seed=1234, criminal_count=1,
+                             police_count=1, civilian_count=1, animal_count=1)
+        self.assertEqual(sim.seed, 1234)
+        replay = CitySimulation(config, seed=sim.seed, criminal_count=1,
+                                police_count=1, civilian_count=1, animal_count=1)
+        self.assertEqual([(n.x, n.y) for n in sim.all_npcs],
+                         [(n.x, n.y) for n in replay.all_npcs])
+
+
+class TestInputReplay(unittest.TestCase):
+    """Tests for input recording and headless replay."""
+
+    def _record(self, path):
+        from replay import InputRecorder, encode_inputs
+        config = CityConfig(world_width=800, world_height=600)
+        recorder = InputRecorder(77, config, (1, 1, 2, 2))
+        for i in range(30):
+            inputs = encode_inputs(keys=["g"]) if i == 5 else 0
+            click = (120.0, 80.0) if i == 10 else None
+            recorder.record_frame(1.0 / 60.0, inputs, (1.0, 0.0), click)
+        recorder.save(path)
+        return recorder
+
+    def test_round_trip(self):
+        """Test a saved recording loads back frame for frame."""
+        import tempfile
+        from replay import load_recording
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.pcr")
+            self._record(path)
+            recording = load_recording(path)
+        self.assertEqual(recording.seed, 77)
+        self.assertEqual(recording.config.world_width, 800)
+        self.assertEqual(recording.npc_counts, (1, 1, 2, 2))
+        self.assertEqual(len(recording.frames), 30)
+        self.assertTrue(recording.frames[5].has("g"))
+        self.assertEqual(recording.frames[10].click, (120.0, 80.0))
+        self.assertIsNone(recording.frames[11].click)
+
+    def test_replay_is_deterministic(self):
+        """Test replaying the same recording twice ends in the same state."""
+        import tempfile
+        from replay import load_recording, replay
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.pcr")
+            self._record(path)
+            recording = load_recording(path)
+        first, times = replay(recording)
+        second, _ = replay(recording)
+        self.assertEqual(len(times), 30)
+        self.assertEqual(first.player.alignment, "good")
+        self.assertEqual((first.player.x, first.player.y),
+                         (second.player.x, second.player.y))
+        self.assertEqual([(n.x, n.y) for n in first.all_npcs],
+                         [(n.x, n.y) for n in second.all_npcs])
+
+
+    def test_replays_actions_and_frozen_npc(self):
+        """Test attacks, talks and the dialogue-frozen NPC replay exactly."""
+        import tempfile
+        from replay import InputRecorder, load_recording, replay
+        from simulation import CitySimulation
+        config = CityConfig(world_width=800, world_height=600)
+        recorder = InputRecorder(31, config, (1, 2, 2, 0))
+        for i in range(40):
+            recorder.record_frame(1.0 / 60.0, 0, (0.0, 1.0), steering=True,
+                                  attacked=i == 3, talked=i == 6, frozen=0,
+                                  quest_events=["item_found"] if i == 8 else ())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.pcr")
+            recorder.save(path)
+            recording = load_recording(path)
+        self.assertEqual(recording.frames[0].frozen, 0)
+        self.assertTrue(recording.frames[3].flags & 0x10)
+        self.assertEqual(recording.frames[8].quest_events, ("item_found",))
+        self.assertEqual(recording.frames[9].quest_events, ())
+
+        first, _ = replay(recording)
+        second, _ = replay(recording)
+        self.assertEqual([(n.x, n.y, n.health) for n in first.all_npcs],
+                         [(n.x, n.y, n.health) for n in second.all_npcs])
+        self.assertEqual((first.pursuit.wanted_level, first.pursuit.in_jail),
+                         (second.pursuit.wanted_level, second.pursuit.in_jail))
+
+        fresh = CitySimulation(config, seed=31, criminal_count=1, police_count=2,
+                               civilian_count=2, animal_count=0)
+        held = first.npc_engine.owners[0]
+        self.assertEqual((held.x, held.y), (fresh.npc_engine.owners[0].x,
+                                            fresh.npc_engine.owners[0].y))
+
+    def test_replay_crosses_exit_menu(self):
+        """Test "Keep Exploring" after completion replays back into the living city."""
+        import tempfile
+        from game_loop import GamePhase
+        from replay import InputRecorder, encode_inputs, load_recording, replay
+        config = CityConfig(world_width=800, world_height=600)
+        recorder = InputRecorder(12, config, (1, 1, 2, 0))
+        for _ in range(4):  # Tutorial -> ... -> completed
+            recorder.record_frame(1.0 / 60.0, encode_inputs(["SKIP_PHASE"]))
+        recorder.record_frame(1.0 / 60.0, paused=True)  # Exit menu open
+        recorder.record_frame(1.0 / 60.0, quest_events=["exit_used_or_stayed"],
+                              kept_exploring=True)
+        for _ in range(5):
+            recorder.record_frame(1.0 / 60.0, 0, (1.0, 0.0), steering=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.pcr")
+            recorder.save(path)
+            recording = load_recording(path)
+        self.assertTrue(recording.frames[5].flags & 0x80)
+
+        sim, _ = replay(recording)
+        self.assertEqual(sim.game_loop.state.phase, GamePhase.LIVING_CITY)
+        self.assertFalse(sim.game_loop.is_complete())
+
+        recording.frames[5].flags &= ~0x80  # Without the choice the level stays complete
+        stuck, _ = replay(recording)
+        self.assertTrue(stuck.game_loop.is_complete())
+
+
+class TestQualityGovernor(unittest.TestCase):
+    """Tests for the adaptive quality governor."""
+
+    def test_downgrades_when_over_budget(self):
+        """Test sustained slow frames drop a tier."""
+        from quality import QualityGovernor
+        governor = QualityGovernor(target_fps=60, window=30)
+        self.assertEqual(governor.tier_index, 0)
+        for _ in range(120):
+            governor.record_frame(0.030)
+        self.assertGreater(governor.tier_index, 0)
+
+    def test_hysteresis_prevents_flapping(self):
+        """Test frames just under budget don't raise the tier back."""
+        from quality import QualityGovernor
+        governor = QualityGovernor(target_fps=60, window=30, start_tier=2)
+        for _ in range(600):
+            governor.record_frame(0.015)  # Under budget, but not by much
+        self.assertEqual(governor.tier_index, 2)
+        self.assertEqual(governor.tier_changes, 0)
+
+    def test_upgrades_after_hold(self):
+        """Test fast frames raise the tier only after the hold period."""
+        from quality import QualityGovernor
+        governor = QualityGovernor(target_fps=60, window=30, start_tier=1,
+                                   upgrade_hold=120)
+        for _ in range(30):
+            governor.record_frame(0.005)
+        self.assertEqual(governor.tier_index, 1)  # Only 30 frames in
+        for _ in range(200):
+            governor.record_frame(0.005)
+        self.assertEqual(governor.tier_index, 0)
+        self.assertEqual(governor.get_debug_info()["tier"], "High")
+
+
+class TestPostProcessor(unittest.TestCase):
+    """Tests for the pooled post-processing compositor."""
+
+    class CountingSurface(MockPygame.Surface):
+        def __init__(self, size, flags=0):
+            super().__init__(size, flags)
+            self.blits = 0
+        def blit(self, source, pos, area=None):
+            self.blits += 1
+
+    def test_combined_tint_matches_stacking(self):
+        """Test folding tints gives the same alpha as stacking them."""
+        from postprocess import combine_tints
+        self.assertIsNone(combine_tints([None, (0, 0, 0, 0)]))
+        self.assertEqual(combine_tints([(20, 25, 50, 60)]), (20, 25, 50, 60))
+        combined = combine_tints([(20, 25, 50, 100), (100, 110, 130, 30)])
+        expected_alpha = 255 * (1 - (1 - 100 / 255) * (1 - 30 / 255))
+        self.assertAlmostEqual(combined[3], expected_alpha, delta=1)
+        self.assertTrue(20 < combined[0] < 100)
+
+    def test_tint_layer_cached_until_params_change(self):
+        """Test darkness + rain is one blit and only rebuilt on change."""
+        from postprocess import PostProcessor
+        post = PostProcessor()
+        screen = self.CountingSurface((800, 600))
+        for _ in range(10):
+            post.draw_tint(screen, [(20, 25, 50, 60), (100, 110, 130, 15)])
+        self.assertEqual(screen.blits, 10)
+        self.assertEqual(post.rebuilds, 1)
+        post.draw_tint(screen, [(20, 25, 50, 70), None])
+        self.assertEqual(post.rebuilds, 2)
+
+    def test_scan_lines_share_tint_layer(self):
+        """Test scan lines ride on the tint blit and flicker without rebuilds."""
+        from postprocess import PostProcessor
+        post = PostProcessor()
+        screen = self.CountingSurface((800, 600))
+        night = [(20, 25, 50, 60)]
+        for frame in range(10):
+            post.draw_tint(screen, night, scan_alpha=12 if frame % 2 else 0)
+        self.assertEqual(screen.blits, 10)
+        self.assertEqual(post.rebuilds, 2)  # With and without scan lines
+        post.draw_tint(screen, [], scan_alpha=0)
+        self.assertEqual(screen.blits, 10)
+        post.draw_tint(screen, [], scan_alpha=12)
+        self.assertEqual(screen.blits, 11)
+
+    def test_rain_tint_layer_kept_beside_scan_lines(self):
+        """Test the rain tint drawn over the sprites doesn't evict the night layers."""
+        from postprocess import PostProcessor
+        post = PostProcessor()
+        screen = self.CountingSurface((800, 600))
+        for frame in range(10):
+            post.draw_tint(screen, [(20, 25, 50, 60)], scan_alpha=12 if frame % 2 else 0)
+            post.draw_tint(screen, [(100, 110, 130, 20)])
+        self.assertEqual(screen.blits, 20)
+        self.assertEqual(post.rebuilds, 3)
+
+    def test_glitch_stamps_pooled(self):
+        """Test glitches with similar alpha share one stamp."""
+        from postprocess import PostProcessor
+        post = PostProcessor()
+        a = post.glitch_stamp((128, 0, 128), 100)
+        b = post.glitch_stamp((128, 0, 128), 105)
+        c = post.glitch_stamp((0, 0, 0), 100)
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+
+class TestCharacterDecorations(unittest.TestCase):
+    """Tests for the cached character shadow / health bar / dot stamps."""
+
+    def test_health_bars_quantized(self):
+        """Test nearby health values share one bar and out-of-range values clamp."""
+        from decorations import CharacterDecorations
+        decorations = CharacterDecorations()
+        self.assertIs(decorations.health_bar(35, 4, 52), decorations.health_bar(35, 4, 49))
+        self.assertIsNot(decorations.health_bar(35, 4, 52), decorations.health_bar(35, 4, 60))
+        self.assertIs(decorations.health_bar(35, 4, -25), decorations.health_bar(35, 4, 0))
+        self.assertIsNot(decorations.health_bar(35, 4, 100), decorations.health_bar(35, 5, 100))
+
+    def test_npc_draw_is_blits_only(self):
+        """Test an NPC draws as a few blits and renders no stamps once warm."""
+        from decorations import get_decorations
+        from simulation import CitySimulation
+        sim = CitySimulation(CityConfig(world_width=800, world_height=600), seed=3,
+                             criminal_count=1, police_count=0, civilian_count=0,
+                             animal_count=0)
+        npc = sim.all_npcs[0]
+        npc.committed_crime = True
+        camera = Camera(800, 600, 800, 600)
+        camera.x, camera.y = npc.x - 400, npc.y - 300
+        screen = TestPostProcessor.CountingSurface((800, 600))
+        npc.draw(screen, camera)
+        renders = get_decorations().renders
+        screen.blits = 0
+        npc.draw(screen, camera)
+        self.assertEqual(screen.blits, 4)  # Shadow, sprite, health bar, crime dot
+        self.assertEqual(get_decorations().renders, renders)
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Tests for the headless benchmark harness."""
+
+    def _tiny_scenario(self, seed=7):
+        from benchmark import BenchmarkScenario
+        return BenchmarkScenario("tiny", npc_count=20, world_width=800,
+                                 world_height=600, seconds=0.5, seed=seed)
+
+    def test_run_scenario_reports_subsystems(self):
+        """Test scenario results include every subsystem timing."""
+        from benchmark import run_scenario, SUBSYSTEMS
+        result = run_scenario(self._tiny_scenario())
+        self.assertEqual(result["frames"], 30)
+        self.assertEqual(result["entities"]["npcs"], 20)
+        for name in SUBSYSTEMS:
+            self.assertIn(name, result["subsystems"])
+            self.assertGreaterEqual(result["subsystems"][name]["mean_ms"], 0.0)
+
+    def test_same_seed_is_deterministic(self):
+        """Test the same seed produces the same final state."""
+        from benchmark import run_scenario
+        first = run_scenario(self._tiny_scenario(seed=11))
+        second = run_scenario(self._tiny_scenario(seed=11))
+        self.assertEqual(first["checksum"], second["checksum"])
+
+    def test_baseline_regression_detected(self):
+        """Test slowdowns past the threshold are reported."""
+        from benchmark import compare_to_baseline
+        baseline = {"results": {"small": {
+            "frame": {"mean_ms": 2.0},
+            "subsystems": {"npcs": {"mean_ms": 1.0}},
+        }}}
+        ok = {"results": {"small": {
+            "frame": {"mean_ms": 2.1},
+            "subsystems": {"npcs": {"mean_ms": 1.1}},
+        }}}
+        slow = {"results": {"small": {
+            "frame": {"mean_ms": 2.1},
+            "subsystems": {"npcs": {"mean_ms": 2.0}},
+        }}}
+        self.assertEqual(compare_to_baseline(ok, baseline, threshold=0.25), [])
+        regressions = compare_to_baseline(slow, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("small/npcs", regressions[0])
+
+    def test_entity_records_are_slotted(self):
+        """Test slotted records allocate less than dict-backed ones (tracemalloc)."""
+        from benchmark import build_simulation, measure_entity_memory
+        report = measure_entity_memory(build_simulation(self._tiny_scenario()), copies=500)
+        for name in ("SidewalkNode", "RoadNode", "Vehicle", "Animal",
+                     "CityNPC", "Clue", "LogEntry", "InteriorObject"):
+            self.assertIn(name, report)
+            self.assertGreaterEqual(report[name]["saved_pct"], 15.0, name)
+        self.assertGreaterEqual(report["SidewalkNode"]["saved_pct"], 35.0)
+        self.assertEqual(report["CityNPC"]["count"], 20)
+
+    def test_world_build_memory_drops_with_slots(self):
+        """Test the traced peak of building a world is lower with slotted records."""
+        from benchmark import measure_world_memory
+        import city_map
+        from simulation import CityNPC
+        world = measure_world_memory(self._tiny_scenario())
+        self.assertLess(world["peak_kib"], world["dict_peak_kib"])
+        self.assertLess(world["current_kib"], world["dict_current_kib"])
+        # The dict-backed twins are swapped back out afterwards
+        self.assertTrue(hasattr(city_map.SidewalkNode, "__slots__"))
+        self.assertTrue(hasattr(CityNPC, "__slots__"))
+
+
 if __name__ == '__main__':
     # Run with verbose output
     unittest.main(verbosity=2)